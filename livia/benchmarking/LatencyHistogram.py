@@ -0,0 +1,99 @@
+import math
+from threading import Lock
+from typing import Dict, Optional
+
+DEFAULT_MIN_LATENCY: float = 1e-6
+DEFAULT_BUCKET_GROWTH: float = 1.02
+
+
+class LatencyHistogram:
+    def __init__(self, min_latency: float = DEFAULT_MIN_LATENCY, bucket_growth: float = DEFAULT_BUCKET_GROWTH):
+        if min_latency <= 0:
+            raise ValueError("min_latency must be a positive float")
+        if bucket_growth <= 1:
+            raise ValueError("bucket_growth must be greater than 1")
+
+        self.__min_latency: float = min_latency
+        self.__log_bucket_growth: float = math.log(bucket_growth)
+        self.__bucket_growth: float = bucket_growth
+
+        # Buckets grow logarithmically, so the relative error of the percentiles is bounded by the bucket growth
+        self.__buckets: Dict[int, int] = {}
+        self.__count: int = 0
+        self.__sum: float = 0
+        self.__max: float = 0
+
+        self.__lock: Lock = Lock()
+
+    @property
+    def count(self) -> int:
+        with self.__lock:
+            return self.__count
+
+    @property
+    def mean(self) -> Optional[float]:
+        with self.__lock:
+            return self.__sum / self.__count if self.__count > 0 else None
+
+    @property
+    def max(self) -> Optional[float]:
+        with self.__lock:
+            return self.__max if self.__count > 0 else None
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> Optional[float]:
+        return self.percentile(99)
+
+    def add(self, latency: float) -> None:
+        if latency <= self.__min_latency:
+            bucket = 0
+        else:
+            bucket = int(math.log(latency / self.__min_latency) / self.__log_bucket_growth) + 1
+
+        with self.__lock:
+            self.__buckets[bucket] = self.__buckets.get(bucket, 0) + 1
+            self.__count += 1
+            self.__sum += latency
+            self.__max = max(self.__max, latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be in the [0, 100] range")
+
+        with self.__lock:
+            if self.__count == 0:
+                return None
+
+            rank = max(1, math.ceil(self.__count * percentile / 100))
+
+            accumulated = 0
+            for bucket in sorted(self.__buckets):
+                accumulated += self.__buckets[bucket]
+
+                if accumulated >= rank:
+                    # The upper bound of the bucket, which never exceeds the maximum observed latency
+                    return min(self.__max, self.__min_latency * self.__bucket_growth ** bucket)
+
+            return self.__max
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__buckets.clear()
+            self.__count = 0
+            self.__sum = 0
+            self.__max = 0
+
+    def __str__(self) -> str:
+        def format_latency(latency: Optional[float]) -> str:
+            return "-" if latency is None else f"{latency * 1000:.2f}ms"
+
+        return f"count: {self.count}, mean: {format_latency(self.mean)}, p50: {format_latency(self.p50)}, " \
+               f"p95: {format_latency(self.p95)}, p99: {format_latency(self.p99)}, max: {format_latency(self.max)}"
@@ -17,7 +17,11 @@ class TimeLogger:
         self.__reference_id: Optional[str] = None
 
         if isinstance(reference_object, FrameAnalyzer):
-            self.__reference_id = FrameAnalyzerManager.get_metadata_for(reference_object).id
+            try:
+                self.__reference_id = FrameAnalyzerManager.get_metadata_for(reference_object).id
+            except ValueError:
+                # Analyzers that are not registered (e.g. wrappers that are only built programmatically)
+                self.__reference_id = reference_object.__class__.__name__
         else:
             self.__reference_id = str(reference_object)
 
@@ -0,0 +1,77 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, List, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+DEFAULT_MAX_BUFFERS_PER_KEY: int = 8
+
+BufferKey = Tuple[Tuple[int, ...], np.dtype]
+
+
+class FrameBufferPool:
+    def __init__(self, max_buffers_per_key: int = DEFAULT_MAX_BUFFERS_PER_KEY):
+        if max_buffers_per_key < 1:
+            raise ValueError("max_buffers_per_key must be a positive number")
+
+        self.__max_buffers_per_key: int = max_buffers_per_key
+        self.__free_buffers: Dict[BufferKey, List[ndarray]] = defaultdict(list)
+        # Leased buffers are referenced here so their ids cannot be reused while they are out of the pool
+        self.__leased_buffers: Dict[int, ndarray] = {}
+        self.__allocated: int = 0
+        self.__lock: Lock = Lock()
+
+    @property
+    def max_buffers_per_key(self) -> int:
+        return self.__max_buffers_per_key
+
+    @property
+    def allocated(self) -> int:
+        with self.__lock:
+            return self.__allocated
+
+    @property
+    def leased(self) -> int:
+        with self.__lock:
+            return len(self.__leased_buffers)
+
+    def lease(self, shape: Tuple[int, ...], dtype=np.uint8) -> ndarray:
+        key = (tuple(shape), np.dtype(dtype))
+
+        with self.__lock:
+            free_buffers = self.__free_buffers[key]
+            if free_buffers:
+                buffer = free_buffers.pop()
+            else:
+                buffer = np.empty(key[0], key[1])
+                self.__allocated += 1
+
+            self.__leased_buffers[id(buffer)] = buffer
+
+        return buffer
+
+    def is_leased(self, buffer: ndarray) -> bool:
+        with self.__lock:
+            return self.__leased_buffers.get(id(buffer)) is buffer
+
+    def release(self, buffer: ndarray) -> None:
+        with self.__lock:
+            if id(buffer) not in self.__leased_buffers:
+                raise ValueError("buffer was not leased from this pool")
+
+            del self.__leased_buffers[id(buffer)]
+
+            free_buffers = self.__free_buffers[(buffer.shape, buffer.dtype)]
+            if len(free_buffers) < self.__max_buffers_per_key:
+                free_buffers.append(buffer)
+
+    def copy(self, frame: ndarray) -> ndarray:
+        buffer = self.lease(frame.shape, frame.dtype)
+        np.copyto(buffer, frame)
+
+        return buffer
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__free_buffers.clear()
@@ -0,0 +1,108 @@
+from enum import Enum
+from threading import Condition, Lock
+from typing import Generic, List, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 1
+    DROP_OLDEST = 2
+    DROP_NEWEST = 3
+
+
+class RingBuffer(Generic[T]):
+    def __init__(self, capacity: int, policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number")
+
+        self.__slots: List[Optional[T]] = [None] * capacity
+        self.__capacity: int = capacity
+        self.__policy: OverflowPolicy = policy
+        self.__head: int = 0
+        self.__size: int = 0
+        self.__closed: bool = False
+        self.__dropped: int = 0
+
+        self.__condition: Condition = Condition(lock=Lock())
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        return self.__policy
+
+    @property
+    def dropped(self) -> int:
+        with self.__condition:
+            return self.__dropped
+
+    def __len__(self) -> int:
+        with self.__condition:
+            return self.__size
+
+    def is_closed(self) -> bool:
+        with self.__condition:
+            return self.__closed
+
+    def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        if item is None:
+            raise ValueError("item can't be None")
+
+        with self.__condition:
+            if self.__size == self.__capacity and not self.__closed:
+                if self.__policy == OverflowPolicy.BLOCK:
+                    if not self.__condition.wait_for(
+                            lambda: self.__size < self.__capacity or self.__closed, timeout):
+                        return False
+                elif self.__policy == OverflowPolicy.DROP_OLDEST:
+                    self.__pop()
+                    self.__dropped += 1
+                else:
+                    self.__dropped += 1
+                    return False
+
+            if self.__closed:
+                return False
+
+            self.__slots[(self.__head + self.__size) % self.__capacity] = item
+            self.__size += 1
+            self.__condition.notify_all()
+
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__size > 0 or self.__closed, timeout):
+                return None
+
+            if self.__size == 0:
+                return None
+
+            item = self.__pop()
+            self.__condition.notify_all()
+
+            return item
+
+    def clear(self) -> List[T]:
+        with self.__condition:
+            items = [self.__pop() for _ in range(self.__size)]
+            self.__condition.notify_all()
+
+            return items
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def __pop(self) -> T:
+        item = self.__slots[self.__head]
+        self.__slots[self.__head] = None
+        self.__head = (self.__head + 1) % self.__capacity
+        self.__size -= 1
+
+        # Slots are only empty outside the stored range
+        return cast(T, item)
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from numpy import ndarray
+
+
+class AsyncFrameInput(ABC):
+    async def play(self) -> None:
+        pass
+
+    @abstractmethod
+    async def next_frame(self) -> Tuple[Optional[int], Optional[ndarray]]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_fps(self) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_frame_size(self) -> Tuple[int, int]:
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        pass
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Tuple[int, ndarray]:
+        num_frame, frame = await self.next_frame()
+
+        if num_frame is None or frame is None:
+            raise StopAsyncIteration()
+
+        return num_frame, frame
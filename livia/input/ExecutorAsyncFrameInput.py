@@ -0,0 +1,33 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional, Tuple
+
+from numpy import ndarray
+
+from livia.input.AsyncFrameInput import AsyncFrameInput
+from livia.input.FrameInput import FrameInput
+
+
+class ExecutorAsyncFrameInput(AsyncFrameInput):
+    def __init__(self, input: FrameInput, executor: Optional[Executor] = None):
+        self.__input: FrameInput = input
+        self.__executor: Optional[Executor] = executor
+
+    @property
+    def input(self) -> FrameInput:
+        return self.__input
+
+    async def play(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self.__executor, self.__input.play)
+
+    async def next_frame(self) -> Tuple[Optional[int], Optional[ndarray]]:
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, self.__input.next_frame)
+
+    def get_fps(self) -> int:
+        return self.__input.get_fps()
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        return self.__input.get_frame_size()
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self.__executor, self.__input.close)
@@ -1,4 +1,5 @@
 import time
+from threading import Condition, Lock, Thread
 from typing import Optional, Tuple
 
 from cv2 import CAP_PROP_FPS, CAP_PROP_FRAME_COUNT, CAP_PROP_POS_FRAMES, CAP_PROP_POS_MSEC
@@ -6,16 +7,31 @@ from cv2 import VideoCapture
 from numpy import ndarray
 
 from livia import LIVIA_LOGGER
+from livia.buffer.RingBuffer import RingBuffer
 from livia.input.OpenCVFrameInput import OpenCVFrameInput
 from livia.input.SeekableFrameInput import SeekableFrameInput
 
 
+DEFAULT_READ_AHEAD: int = 0
+
+
 class FileFrameInput(OpenCVFrameInput, SeekableFrameInput):
-    def __init__(self, path: str, delay: Optional[float] = None):
+    def __init__(self, path: str, delay: Optional[float] = None, offline: bool = False,
+                 read_ahead: int = DEFAULT_READ_AHEAD):
+        if read_ahead < 0:
+            raise ValueError("read_ahead must be a non negative number")
+
         super().__init__(VideoCapture(path))
+        self.__path: str = path
         self.__delay: float = 1 / 25
 
-        if delay is None:
+        if offline:
+            if delay is not None:
+                raise ValueError("delay can not be used in offline mode")
+
+            # Frames are delivered as fast as they can be decoded, without pacing nor skipping
+            self.__delay = 0
+        elif delay is None:
             try:
                 self.__delay = 1 / self._capture.get(CAP_PROP_FPS)
             except AttributeError:
@@ -23,22 +39,79 @@ class FileFrameInput(OpenCVFrameInput, SeekableFrameInput):
         else:
             self.__delay = delay
 
+        self.__offline: bool = offline
         self.__last_frame_time: float = 0
         self._length_in_frames: int = self._capture.get(CAP_PROP_FRAME_COUNT)
 
+        self.__decoded_frames: int = 0
+        self.__decode_time: float = 0
+        self.__run_start_time: Optional[float] = None
+        self.__run_end_time: Optional[float] = None
+
+        # When reading ahead, frames are decoded in a background thread up to read_ahead frames in advance. Each seek
+        # starts a new generation, so that the frames decoded before it are discarded
+        self.__read_ahead: int = read_ahead
+        self.__read_ahead_buffer: Optional[RingBuffer[Tuple[int, Optional[int], Optional[ndarray], float, float]]] = \
+            RingBuffer(read_ahead) if read_ahead > 0 else None
+        self.__read_ahead_thread: Optional[Thread] = None
+        # The capture lock is only held while the capture is used, so that the position and the generation can be
+        # read while a frame is being decoded
+        self.__state_condition: Condition = Condition(lock=Lock())
+        self.__generation: int = 0
+        self.__decoder_finished: bool = False
+        self.__finished_generation: Optional[int] = None
+        self.__closed: bool = False
+
+        # Position of the last frame delivered, which is behind the position of the capture when reading ahead
+        self.__current_frame_index: int = -1
+        self.__current_msec: float = 0
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def read_ahead(self) -> int:
+        return self.__read_ahead
+
+    @property
+    def offline(self) -> bool:
+        return self.__offline
+
+    @property
+    def decoded_frames(self) -> int:
+        return self.__decoded_frames
+
+    @property
+    def decode_fps(self) -> Optional[float]:
+        return self.__decoded_frames / self.__decode_time if self.__decode_time > 0 else None
+
+    @property
+    def end_to_end_fps(self) -> Optional[float]:
+        if self.__run_start_time is None:
+            return None
+
+        end_time = time.perf_counter() if self.__run_end_time is None else self.__run_end_time
+        elapsed = end_time - self.__run_start_time
+
+        return self.__decoded_frames / elapsed if elapsed > 0 else None
+
     def next_frame(self) -> Tuple[Optional[int], Optional[ndarray]]:
         if self._capture.isOpened():
-            with self._capture_lock:
-                if self._capture.isOpened():
-                    num_frame = int(self._capture.get(CAP_PROP_POS_FRAMES))
-                    ret, self._current_frame = self._capture.read()
+            if self.__run_start_time is None:
+                self.__run_start_time = time.perf_counter()
 
-                    if not ret:
-                        self._current_frame = None
-                else:
-                    ret = False
-                    self._current_frame = None
-                    num_frame = None
+            if self.__read_ahead > 0:
+                num_frame, self._current_frame = self.__read_ahead_frame()
+            else:
+                num_frame, self._current_frame = self.__read_frame()
+
+            ret = self._current_frame is not None
+
+            if ret:
+                self.__decoded_frames += 1
+            elif self.__run_end_time is None:
+                self.__finish_run()
 
             if self.__delay > 0:
                 if self.__last_frame_time > 0:
@@ -48,7 +121,7 @@ class FileFrameInput(OpenCVFrameInput, SeekableFrameInput):
                     while elapsed > self.__delay:
                         LIVIA_LOGGER.warning(f"Frame skipped (elapsed: {elapsed}, delay: {self.__delay})")
                         elapsed -= self.__delay
-                        if not self._capture.grab():
+                        if not self.__skip_frame():
                             break
 
                     if elapsed < self.__delay:
@@ -60,17 +133,184 @@ class FileFrameInput(OpenCVFrameInput, SeekableFrameInput):
         else:
             return None, None
 
-    def go_to_frame(self, frame: int):
+    def __read_frame(self) -> Tuple[Optional[int], Optional[ndarray]]:
         with self._capture_lock:
-            self._capture.set(CAP_PROP_POS_FRAMES, frame)
-            self._current_frame = None
-            self.__last_frame_time = 0
+            if not self._capture.isOpened():
+                return None, None
 
-    def go_to_msec(self, msec: float):
+            num_frame = int(self._capture.get(CAP_PROP_POS_FRAMES))
+
+            decode_start_time = time.perf_counter()
+            ret, frame = self._capture.read()
+            decode_time = time.perf_counter() - decode_start_time
+
+        with self.__state_condition:
+            self.__decode_time += decode_time
+
+        return (num_frame, frame) if ret else (None, None)
+
+    def __skip_frame(self) -> bool:
+        if self.__read_ahead > 0:
+            return self.__read_ahead_frame()[1] is not None
+        else:
+            with self._capture_lock:
+                return self._capture.grab()
+
+    def __read_ahead_frame(self) -> Tuple[Optional[int], Optional[ndarray]]:
+        read_ahead_buffer = self.__read_ahead_buffer
+        if read_ahead_buffer is None:
+            raise RuntimeError("The read-ahead buffer should not be None")
+
+        if self.__read_ahead_thread is None:
+            self.__start_read_ahead()
+
+        while True:
+            with self.__state_condition:
+                if self.__finished_generation == self.__generation:
+                    return None, None
+
+            item = read_ahead_buffer.get()
+
+            if item is None:
+                return None, None
+
+            generation, num_frame, frame, msec, decode_time = item
+
+            with self.__state_condition:
+                # Frames decoded before the last seek are discarded
+                if generation == self.__generation:
+                    self.__decode_time += decode_time
+
+                    if num_frame is None or frame is None:
+                        self.__finished_generation = generation
+
+                        return None, None
+                    else:
+                        self.__current_frame_index = num_frame
+                        self.__current_msec = msec
+
+                        return num_frame, frame
+
+    def __start_read_ahead(self):
+        with self.__state_condition:
+            if self.__read_ahead_thread is None and not self.__closed:
+                self.__read_ahead_thread = Thread(target=self.__decode_frames, daemon=True,
+                                                  name="File Read-Ahead Thread")
+                self.__read_ahead_thread.start()
+
+    def __decode_frames(self):
+        read_ahead_buffer = self.__read_ahead_buffer
+        if read_ahead_buffer is None:
+            raise RuntimeError("The read-ahead buffer should not be None")
+
+        while True:
+            with self.__state_condition:
+                # After the end of the file, the decoder waits for a seek
+                self.__state_condition.wait_for(lambda: self.__closed or not self.__decoder_finished)
+
+                if self.__closed:
+                    break
+
+            with self._capture_lock:
+                # The generation is read with the capture lock, so that it matches the position of the capture
+                with self.__state_condition:
+                    generation = self.__generation
+
+                if self._capture.isOpened():
+                    num_frame = int(self._capture.get(CAP_PROP_POS_FRAMES))
+
+                    decode_start_time = time.perf_counter()
+                    ret, frame = self._capture.read()
+                    decode_time = time.perf_counter() - decode_start_time
+
+                    msec = self._capture.get(CAP_PROP_POS_MSEC)
+                else:
+                    ret, decode_time = False, 0
+
+            if not ret:
+                with self.__state_condition:
+                    # The end of a generation that was already replaced by a seek does not stop the decoder
+                    if generation == self.__generation:
+                        self.__decoder_finished = True
+
+            # The buffer is closed when the input is closed, which also releases a blocked decoder
+            if ret:
+                read_ahead_buffer.put((generation, num_frame, frame, msec, decode_time))
+            else:
+                read_ahead_buffer.put((generation, None, None, 0, decode_time))
+
+    def __seek(self, property_id: int, value: float):
+        # The capture lock is taken first, as the decoder does, so that no frame is decoded between the change of the
+        # position and the start of the new generation
         with self._capture_lock:
-            self._capture.set(CAP_PROP_POS_MSEC, msec)
-            self._current_frame = None
-            self.__last_frame_time = 0
+            self._capture.set(property_id, value)
+
+            with self.__state_condition:
+                self._current_frame = None
+                self.__last_frame_time = 0
+                self.__reset_run()
+
+                if self.__read_ahead_buffer is not None:
+                    self.__generation += 1
+                    self.__decoder_finished = False
+                    self.__finished_generation = None
+                    self.__current_frame_index = int(self._capture.get(CAP_PROP_POS_FRAMES)) - 1
+                    self.__current_msec = self._capture.get(CAP_PROP_POS_MSEC)
+
+                    self.__read_ahead_buffer.clear()
+                    self.__state_condition.notify_all()
+
+    def __finish_run(self):
+        self.__run_end_time = time.perf_counter()
+
+        if self.__offline:
+            decode_fps = self.decode_fps
+            end_to_end_fps = self.end_to_end_fps
+
+            LIVIA_LOGGER.info(
+                f"Offline run finished (frames: {self.__decoded_frames}, "
+                f"decode fps: {'-' if decode_fps is None else f'{decode_fps:.2f}'}, "
+                f"end-to-end fps: {'-' if end_to_end_fps is None else f'{end_to_end_fps:.2f}'})"
+            )
+
+    def __reset_run(self):
+        self.__decoded_frames = 0
+        self.__decode_time = 0
+        self.__run_start_time = None
+        self.__run_end_time = None
+
+    def go_to_frame(self, frame: int):
+        self.__seek(CAP_PROP_POS_FRAMES, frame)
+
+    def go_to_msec(self, msec: float):
+        self.__seek(CAP_PROP_POS_MSEC, msec)
+
+    def get_current_frame_index(self) -> Optional[int]:
+        if self.__read_ahead > 0:
+            with self.__state_condition:
+                return self.__current_frame_index
+        else:
+            return super().get_current_frame_index()
+
+    def get_current_msec(self) -> Optional[int]:
+        if self.__read_ahead > 0:
+            with self.__state_condition:
+                return int(self.__current_msec)
+        else:
+            return super().get_current_msec()
 
     def get_length_in_frames(self) -> int:
         return self._length_in_frames
+
+    def close(self):
+        if self.__read_ahead_buffer is not None:
+            with self.__state_condition:
+                self.__closed = True
+                self.__state_condition.notify_all()
+
+            self.__read_ahead_buffer.close()
+
+            if self.__read_ahead_thread is not None:
+                self.__read_ahead_thread.join()
+
+        super().close()
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from numpy import ndarray
+
+
+class AsyncFrameOutput(ABC):
+    @abstractmethod
+    async def output_frame(self, num_frame: int, frame: ndarray):
+        pass
+
+    async def close(self):
+        pass
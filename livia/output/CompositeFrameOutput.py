@@ -1,19 +1,47 @@
 from threading import Lock
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 from numpy import ndarray
 
+from livia.buffer.RingBuffer import OverflowPolicy
 from livia.output.FrameOutput import FrameOutput
+from livia.output.ThreadedFrameOutputDecorator import ThreadedFrameOutputDecorator, DEFAULT_QUEUE_SIZE
 
 
 class CompositeFrameOutput(FrameOutput):
-    def __init__(self, first_output: FrameOutput, second_output: FrameOutput, *args: FrameOutput):
+    def __init__(self,
+                 first_output: FrameOutput,
+                 second_output: FrameOutput,
+                 *args: FrameOutput,
+                 parallel: bool = False,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 policy: OverflowPolicy = OverflowPolicy.BLOCK):
         super().__init__()
 
         self.__outputs: List[FrameOutput] = [first_output, second_output, *args]
 
+        # In parallel mode each output is written by its own writer thread, so slow outputs do not delay the others
+        self.__parallel: bool = parallel
+        self.__queue_size: int = queue_size
+        self.__policy: OverflowPolicy = policy
+        self.__writers: List[Optional[ThreadedFrameOutputDecorator]] = [
+            self.__create_writer(output) for output in self.__outputs
+        ]
+
         self.__lock: Lock = Lock()
 
+    def __create_writer(self, output: FrameOutput) -> Optional[ThreadedFrameOutputDecorator]:
+        return ThreadedFrameOutputDecorator(output, self.__queue_size, self.__policy) if self.__parallel else None
+
+    @property
+    def parallel(self) -> bool:
+        return self.__parallel
+
+    @property
+    def dropped(self) -> int:
+        with self.__lock:
+            return sum(writer.dropped for writer in self.__writers if writer is not None)
+
     def has_descendant(self, output: FrameOutput) -> bool:
         with self.__lock:
             for child in self.__outputs:
@@ -30,12 +58,19 @@ class CompositeFrameOutput(FrameOutput):
             for i in range(0, len(self.__outputs)):
                 if self.__outputs[i] == output:
                     self.__outputs.pop(i)
-                    return True
+                    writer = self.__writers.pop(i)
+                    break
                 elif isinstance(output, CompositeFrameOutput):
                     if output.remove_output(output):
                         return True
+            else:
+                return False
 
-            return False
+        # The writer is stopped out of the lock, as it waits until its pending frames are written
+        if writer is not None:
+            writer.stop()
+
+        return True
 
     @property
     def outputs(self) -> Tuple[FrameOutput, ...]:
@@ -43,11 +78,27 @@ class CompositeFrameOutput(FrameOutput):
             return tuple(self.__outputs)
 
     def output_frame(self, num_frame: int, frame: ndarray):
+        # The lock is released before writing, so outputs can be inspected or removed while frames are being written
         with self.__lock:
-            for output in self.__outputs:
+            outputs = list(self.__outputs)
+            writers = list(self.__writers)
+
+        if self.__parallel:
+            # All the outputs share the same frame, so it can not be modified by any of them
+            frame_view = frame.view()
+            frame_view.flags.writeable = False
+
+            for writer in writers:
+                if writer is not None:
+                    writer.output_frame(num_frame, frame_view)
+        else:
+            for output in outputs:
                 output.output_frame(num_frame, frame)
 
     def close(self):
         with self.__lock:
-            for output in self.__outputs:
-                output.close()
+            for output, writer in zip(self.__outputs, self.__writers):
+                if writer is None:
+                    output.close()
+                else:
+                    writer.close()
@@ -0,0 +1,24 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+
+from numpy import ndarray
+
+from livia.output.AsyncFrameOutput import AsyncFrameOutput
+from livia.output.FrameOutput import FrameOutput
+
+
+class ExecutorAsyncFrameOutput(AsyncFrameOutput):
+    def __init__(self, output: FrameOutput, executor: Optional[Executor] = None):
+        self.__output: FrameOutput = output
+        self.__executor: Optional[Executor] = executor
+
+    @property
+    def output(self) -> FrameOutput:
+        return self.__output
+
+    async def output_frame(self, num_frame: int, frame: ndarray):
+        await asyncio.get_running_loop().run_in_executor(self.__executor, self.__output.output_frame, num_frame, frame)
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(self.__executor, self.__output.close)
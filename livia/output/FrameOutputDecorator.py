@@ -0,0 +1,22 @@
+from abc import ABC
+
+from numpy import ndarray
+
+from livia.output.FrameOutput import FrameOutput
+
+
+class FrameOutputDecorator(FrameOutput, ABC):
+    def __init__(self, decorated_output: FrameOutput):
+        super().__init__()
+
+        self._decorated_output: FrameOutput = decorated_output
+
+    @property
+    def decorated_output(self) -> FrameOutput:
+        return self._decorated_output
+
+    def output_frame(self, num_frame: int, frame: ndarray):
+        self._decorated_output.output_frame(num_frame, frame)
+
+    def close(self):
+        self._decorated_output.close()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from threading import Thread, Lock
+from typing import Optional, Tuple
+
+from numpy import ndarray
+
+from livia import LIVIA_LOGGER
+from livia.benchmarking.LatencyHistogram import LatencyHistogram
+from livia.buffer.RingBuffer import RingBuffer, OverflowPolicy
+from livia.output.FrameOutput import FrameOutput
+from livia.output.FrameOutputDecorator import FrameOutputDecorator
+
+DEFAULT_QUEUE_SIZE: int = 8
+
+
+class ThreadedFrameOutputDecorator(FrameOutputDecorator):
+    def __init__(self,
+                 decorated_output: FrameOutput,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 daemon: bool = True):
+        super().__init__(decorated_output)
+
+        self.__queue: RingBuffer[Tuple[int, ndarray, float]] = RingBuffer(queue_size, policy)
+        self.__daemon: bool = daemon
+        self.__writer_thread: Optional[Thread] = None
+        self.__writer_lock: Lock = Lock()
+
+        self.__queue_wait: LatencyHistogram = LatencyHistogram()
+
+    @staticmethod
+    def latest_only(decorated_output: FrameOutput, daemon: bool = True) -> ThreadedFrameOutputDecorator:
+        # Only the last frame is waiting to be written, so the output always shows the most recent frame
+        return ThreadedFrameOutputDecorator(decorated_output, 1, OverflowPolicy.DROP_OLDEST, daemon)
+
+    @property
+    def queue_size(self) -> int:
+        return self.__queue.capacity
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        return self.__queue.policy
+
+    @property
+    def dropped(self) -> int:
+        return self.__queue.dropped
+
+    @property
+    def pending(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def queue_wait(self) -> LatencyHistogram:
+        return self.__queue_wait
+
+    def output_frame(self, num_frame: int, frame: ndarray):
+        self.__start_writer()
+
+        self.__queue.put((num_frame, frame, time.perf_counter()))
+
+    def __start_writer(self):
+        if self.__writer_thread is None:
+            with self.__writer_lock:
+                if self.__writer_thread is None and not self.__queue.is_closed():
+                    self.__writer_thread = Thread(target=self.__write_frames, daemon=self.__daemon,
+                                                 name="Frame Output Writer Thread")
+                    self.__writer_thread.start()
+
+    def __write_frames(self):
+        while True:
+            queued_frame = self.__queue.get()
+
+            if queued_frame is None:
+                break
+
+            num_frame, frame, queued_time = queued_frame
+            self.__queue_wait.add(time.perf_counter() - queued_time)
+
+            try:
+                self._decorated_output.output_frame(num_frame, frame)
+            except Exception:
+                LIVIA_LOGGER.exception(f"Error writing frame {num_frame}")
+
+    def stop(self):
+        # Queued frames are written before the writer thread ends
+        self.__queue.close()
+
+        with self.__writer_lock:
+            writer_thread = self.__writer_thread
+
+        if writer_thread is not None:
+            writer_thread.join()
+
+    def close(self):
+        self.stop()
+
+        super().close()
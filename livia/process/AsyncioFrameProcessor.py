@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Callable, Tuple
+
+from numpy import ndarray
+
+from livia import LIVIA_LOGGER
+from livia.buffer.RingBuffer import OverflowPolicy
+from livia.input.AsyncFrameInput import AsyncFrameInput
+from livia.output.AsyncFrameOutput import AsyncFrameOutput
+from livia.process.FrameProcessError import FrameProcessError
+from livia.process.FrameProcessor import DEFAULT_INPUT_BUFFER_SIZE
+from livia.process.HasFrameTimestamps import HasFrameTimestamps
+from livia.process.listener.EventListeners import EventListeners
+from livia.process.listener.IOChangeEvent import IOChangeEvent
+from livia.process.listener.IOChangeListener import IOChangeListener
+from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
+from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+
+
+class AsyncioFrameProcessor(HasFrameTimestamps, ABC):
+    def __init__(self,
+                 input: AsyncFrameInput,
+                 output: AsyncFrameOutput,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        if input_buffer_size < 0:
+            raise ValueError("input_buffer_size must be a non negative number")
+
+        HasFrameTimestamps.__init__(self)
+
+        self._input: AsyncFrameInput = input
+        self._output: AsyncFrameOutput = output
+
+        self._num_frame: Optional[int] = None
+
+        self._alive: bool = False
+        self._paused: bool = False
+
+        self._io_change_listeners: EventListeners[IOChangeListener] = EventListeners[IOChangeListener]()
+        self._process_change_listeners: EventListeners[ProcessChangeListener] = EventListeners[ProcessChangeListener]()
+
+        self._play_task: Optional[asyncio.Task] = None
+
+        # Created on start, as events and queues are bound to the running event loop
+        self._resume_event: Optional[asyncio.Event] = None
+
+        self._input_buffer_size: int = input_buffer_size
+        self._input_buffer_policy: OverflowPolicy = input_buffer_policy
+        # Buffered frames keep the input they were read from, so the frames of a replaced input can be discarded. The
+        # end of the input is put as None
+        self._input_buffer: Optional[asyncio.Queue[Optional[Tuple[AsyncFrameInput, int, ndarray, float]]]] = None
+        self._input_reader_task: Optional[asyncio.Task] = None
+
+    @property
+    def input(self) -> AsyncFrameInput:
+        return self._input
+
+    @input.setter
+    def input(self, input: AsyncFrameInput):
+        if input != self._input:
+            self._set_input(input)
+
+    def _set_input(self, input: AsyncFrameInput):
+        old_input = self._input
+        self._input = input
+
+        event = IOChangeEvent(self, input, old_input)
+        self._io_change_listeners.notify(IOChangeListener.input_changed, event)
+
+    @property
+    def output(self) -> AsyncFrameOutput:
+        return self._output
+
+    @output.setter
+    def output(self, output: AsyncFrameOutput):
+        if output != self._output:
+            old_output = self._output
+            self._output = output
+
+            event = IOChangeEvent(self, self._output, old_output)
+            self._io_change_listeners.notify(IOChangeListener.output_changed, event)
+
+    def is_alive(self) -> bool:
+        return self._alive
+
+    def is_running(self) -> bool:
+        return self._play_task is not None and not self._play_task.done()
+
+    def is_paused(self) -> bool:
+        return self._paused
+
+    async def _play(self):
+        await self._input.play()
+
+        if self._input_buffer_size > 0:
+            self._start_input_reader()
+
+        while True:
+            if not await self._check_running_status():
+                break
+
+            frame = await self._input_frame()
+
+            if self._num_frame is None or frame is None:
+                break
+
+            if not await self._check_running_status():
+                break
+
+            await self._process_frame(frame)
+
+        await self._stop_input_reader()
+
+        self._alive = False
+        self._paused = False
+        self._on_finish()
+        self._notify_process_change_event(ProcessChangeListener.finished)
+
+    async def _process_frame(self, frame: ndarray):
+        manipulated_frame = await self._manipulate_frame(frame)
+
+        if await self._check_running_status():
+            await self._output_frame(manipulated_frame)
+
+    @abstractmethod
+    async def _manipulate_frame(self, frame: ndarray) -> ndarray:
+        raise NotImplementedError()
+
+    async def _check_running_status(self) -> bool:
+        resume_event = self._resume_event
+        if resume_event is None:
+            raise RuntimeError("self._resume_event should not be None")
+
+        if self._paused:
+            await resume_event.wait()
+
+        return self._alive
+
+    async def _input_frame(self) -> Optional[ndarray]:
+        input_buffer = self._input_buffer
+
+        if input_buffer is None:
+            self._num_frame, frame = await self._input.next_frame()
+            self._stamp_frame_inputted(time.perf_counter())
+        else:
+            while True:
+                buffered_frame = await input_buffer.get()
+
+                if buffered_frame is None:
+                    self._num_frame, frame = None, None
+                    self._stamp_frame_inputted(None)
+                    break
+
+                # The reader may still put a frame of the previous input after the input is replaced
+                frame_input, num_frame, frame, captured = buffered_frame
+                if frame_input is not self._input:
+                    continue
+
+                # Capture time is taken when the frame was read, so the time spent in the buffer is included
+                self._num_frame = num_frame
+                self._stamp_frame_inputted(captured)
+                break
+
+        self._notify_process_change_event(ProcessChangeListener.frame_inputted)
+
+        return frame
+
+    def _start_input_reader(self):
+        input_buffer: asyncio.Queue[Optional[Tuple[AsyncFrameInput, int, ndarray, float]]] = \
+            asyncio.Queue(self._input_buffer_size)
+
+        self._input_buffer = input_buffer
+        self._input_reader_task = asyncio.get_running_loop().create_task(self._read_input(input_buffer))
+
+    async def _stop_input_reader(self):
+        reader_task = self._input_reader_task
+
+        self._input_buffer = None
+        self._input_reader_task = None
+
+        if reader_task is not None:
+            reader_task.cancel()
+            try:
+                await reader_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _read_input(self, input_buffer: asyncio.Queue[Optional[Tuple[AsyncFrameInput, int, ndarray, float]]]):
+        try:
+            while self._alive:
+                input = self._input
+
+                num_frame, frame = await input.next_frame()
+
+                if num_frame is None or frame is None:
+                    break
+
+                buffered_frame = (input, num_frame, frame, time.perf_counter())
+
+                if self._input_buffer_policy == OverflowPolicy.BLOCK or not input_buffer.full():
+                    await input_buffer.put(buffered_frame)
+                elif self._input_buffer_policy == OverflowPolicy.DROP_OLDEST:
+                    input_buffer.get_nowait()
+                    input_buffer.put_nowait(buffered_frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            LIVIA_LOGGER.exception("Error reading frame from input")
+
+        # The end of the input lets the play loop consume the remaining frames and then finish
+        await input_buffer.put(None)
+
+    async def _output_frame(self, frame: ndarray):
+        num_frame = self._num_frame
+        if num_frame is None:
+            raise RuntimeError("self._num_frame should not be None")
+
+        await self._output.output_frame(num_frame, frame)
+        self._stamp_frame_outputted()
+
+        self._notify_process_change_event(ProcessChangeListener.frame_outputted)
+
+    def pause(self):
+        resume_event = self._resume_event
+
+        if self._alive and self.is_running() and resume_event is not None:
+            self._paused = True
+            resume_event.clear()
+
+            self._notify_process_change_event(ProcessChangeListener.paused)
+        else:
+            raise FrameProcessError("Process is not running")
+
+    def resume(self):
+        resume_event = self._resume_event
+
+        if self._paused and resume_event is not None:
+            self._paused = False
+            resume_event.set()
+
+            self._notify_process_change_event(ProcessChangeListener.resumed)
+        else:
+            raise FrameProcessError("Process is not paused")
+
+    def start(self) -> asyncio.Task:
+        if self._alive:
+            raise FrameProcessError("Process is already running")
+        else:
+            loop = asyncio.get_running_loop()
+
+            self._num_frame = None
+            self._reset_frame_timestamps()
+            self._alive = True
+            self._resume_event = asyncio.Event()
+            self._resume_event.set()
+            self._play_task = loop.create_task(self._play())
+            self._on_start()
+
+            self._notify_process_change_event(ProcessChangeListener.started)
+
+            return self._play_task
+
+    def stop(self):
+        resume_event = self._resume_event
+
+        if self._alive and resume_event is not None:
+            self._paused = False
+            self._alive = False
+            resume_event.set()  # Awake if paused
+
+            input_buffer = self._input_buffer
+            if input_buffer is not None:
+                # Awake if waiting for a frame
+                while not input_buffer.empty():
+                    input_buffer.get_nowait()
+                input_buffer.put_nowait(None)
+
+            self._on_stop()
+
+            self._notify_process_change_event(ProcessChangeListener.stopped)
+        else:
+            raise FrameProcessError("Process is not running")
+
+    async def wait(self):
+        play_task = self._play_task
+        if play_task is not None:
+            await play_task
+
+    async def stop_and_wait(self):
+        play_task = self._play_task
+        self.stop()
+        await play_task
+
+    async def close(self):
+        await self._input.close()
+        await self._output.close()
+
+    def _on_start(self):
+        pass
+
+    def _on_stop(self):
+        pass
+
+    def _on_finish(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def add_io_change_listener(self, listener: IOChangeListener):
+        self._io_change_listeners.append(listener)
+
+    def remove_io_change_listener(self, listener: IOChangeListener):
+        self._io_change_listeners.remove(listener)
+
+    def has_io_change_listener(self, listener: IOChangeListener) -> bool:
+        return listener in self._io_change_listeners
+
+    def add_process_change_listener(self, listener: ProcessChangeListener):
+        self._process_change_listeners.append(listener)
+
+    def remove_process_change_listener(self, listener: ProcessChangeListener):
+        self._process_change_listeners.remove(listener)
+
+    def has_process_change_listener(self, listener: ProcessChangeListener) -> bool:
+        return listener in self._process_change_listeners
+
+    def _notify_process_change_event(self,
+                                     event_method: Callable[[ProcessChangeListener, ProcessChangeEvent], None]):
+        event = ProcessChangeEvent(self, self._num_frame, self._frame_timestamps)
+        self._process_change_listeners.notify(event_method, event)
@@ -1,21 +1,38 @@
+import time
 from abc import ABC, abstractmethod
 from threading import Thread, Condition, Lock
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 from numpy import ndarray
 
+from livia import LIVIA_LOGGER
+from livia.buffer.RingBuffer import RingBuffer, OverflowPolicy
 from livia.input.FrameInput import FrameInput
 from livia.output.FrameOutput import FrameOutput
 from livia.process.FrameProcessError import FrameProcessError
+from livia.process.HasFrameTimestamps import HasFrameTimestamps
+from livia.process.listener.EventDispatcher import EventDispatcher
 from livia.process.listener.EventListeners import EventListeners
 from livia.process.listener.IOChangeEvent import IOChangeEvent
 from livia.process.listener.IOChangeListener import IOChangeListener
 from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
 from livia.process.listener.ProcessChangeListener import ProcessChangeListener
 
+DEFAULT_INPUT_BUFFER_SIZE: int = 0
+
+
+class FrameProcessor(HasFrameTimestamps, ABC):
+    def __init__(self,
+                 input: FrameInput,
+                 output: FrameOutput,
+                 daemon: bool = True,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        if input_buffer_size < 0:
+            raise ValueError("input_buffer_size must be a non negative number")
+
+        HasFrameTimestamps.__init__(self)
 
-class FrameProcessor(ABC):
-    def __init__(self, input: FrameInput, output: FrameOutput, daemon: bool = True):
         self._input: FrameInput = input
         self._output: FrameOutput = output
         self._daemon: bool = daemon
@@ -27,9 +44,16 @@ class FrameProcessor(ABC):
 
         self._io_change_listeners: EventListeners[IOChangeListener] = EventListeners[IOChangeListener]()
         self._process_change_listeners: EventListeners[ProcessChangeListener] = EventListeners[ProcessChangeListener]()
+        self._event_dispatcher: Optional[EventDispatcher] = None
 
         self._play_thread: Optional[Thread] = None
 
+        self._input_buffer_size: int = input_buffer_size
+        self._input_buffer_policy: OverflowPolicy = input_buffer_policy
+        # Buffered frames keep the input they were read from, so the frames of a replaced input can be discarded
+        self._input_buffer: Optional[RingBuffer[Tuple[FrameInput, int, ndarray, float]]] = None
+        self._input_reader_thread: Optional[Thread] = None
+
         self._running_condition: Condition = Condition(lock=Lock())
 
         self._input_lock: Lock = Lock()
@@ -43,11 +67,19 @@ class FrameProcessor(ABC):
     @input.setter
     def input(self, input: FrameInput):
         if input != self._input:
+            self._set_input(input)
+
+    def _set_input(self, input: FrameInput):
+        with self._input_lock:
             old_input = self._input
             self._input = input
 
-            event = IOChangeEvent(self, self._input, old_input)
-            self._io_change_listeners.notify(IOChangeListener.input_changed, event)
+            input_buffer = self._input_buffer
+            if input_buffer is not None:
+                input_buffer.clear()
+
+        event = IOChangeEvent(self, input, old_input)
+        self._io_change_listeners.notify(IOChangeListener.input_changed, event)
 
     @property
     def output(self) -> FrameOutput:
@@ -62,6 +94,14 @@ class FrameProcessor(ABC):
             event = IOChangeEvent(self, self._output, old_output)
             self._io_change_listeners.notify(IOChangeListener.output_changed, event)
 
+    @property
+    def event_dispatcher(self) -> Optional[EventDispatcher]:
+        return self._event_dispatcher
+
+    @event_dispatcher.setter
+    def event_dispatcher(self, event_dispatcher: Optional[EventDispatcher]):
+        self._event_dispatcher = event_dispatcher
+
     def is_alive(self) -> bool:
         with self._running_condition:
             return self._alive
@@ -78,6 +118,9 @@ class FrameProcessor(ABC):
         with self._input_lock:
             self._input.play()
 
+        if self._input_buffer_size > 0:
+            self._start_input_reader()
+
         while True:
             if not self._check_running_status():
                 break
@@ -92,9 +135,13 @@ class FrameProcessor(ABC):
 
             self._process_frame(frame)
 
+        self._stop_input_reader()
+        self._flush_frame_events()
+
         with self._running_condition:
             self._alive = False
             self._paused = False
+            self._on_finish()
             self._notify_process_change_event(ProcessChangeListener.finished)
 
     def _process_frame(self, frame: ndarray):
@@ -120,23 +167,90 @@ class FrameProcessor(ABC):
             else:
                 return True
 
-    def _input_frame(self) -> ndarray:
-        with self._input_lock:
-            input = self._input
-
-        self._num_frame, frame = input.next_frame()
+    def _input_frame(self) -> Optional[ndarray]:
+        input_buffer = self._input_buffer
+
+        if input_buffer is None:
+            with self._input_lock:
+                input = self._input
+
+            self._num_frame, frame = input.next_frame()
+            self._stamp_frame_inputted(time.perf_counter())
+        else:
+            while True:
+                buffered_frame = input_buffer.get()
+
+                if buffered_frame is None:
+                    self._num_frame, frame = None, None
+                    self._stamp_frame_inputted(None)
+                    break
+
+                # The reader may still put a frame of the previous input after the input is replaced
+                frame_input, num_frame, frame, captured = buffered_frame
+                with self._input_lock:
+                    if frame_input is not self._input:
+                        continue
+
+                # Capture time is taken when the frame was read, so the time spent in the buffer is included
+                self._num_frame = num_frame
+                self._stamp_frame_inputted(captured)
+                break
 
-        self._notify_process_change_event(ProcessChangeListener.frame_inputted)
+        self._notify_frame_event(ProcessChangeListener.frame_inputted)
 
         return frame
 
+    def _start_input_reader(self):
+        input_buffer = RingBuffer[Tuple[FrameInput, int, ndarray, float]](self._input_buffer_size,
+                                                                          self._input_buffer_policy)
+
+        self._input_buffer = input_buffer
+        self._input_reader_thread = Thread(target=self._read_input, args=(input_buffer,), daemon=self._daemon,
+                                           name="Frame Processor Input Reader Thread")
+        self._input_reader_thread.start()
+
+    def _stop_input_reader(self):
+        input_buffer = self._input_buffer
+        reader_thread = self._input_reader_thread
+
+        if input_buffer is not None:
+            input_buffer.close()
+            self._input_buffer = None
+
+        if reader_thread is not None:
+            reader_thread.join()
+            self._input_reader_thread = None
+
+    def _read_input(self, input_buffer: RingBuffer[Tuple[FrameInput, int, ndarray, float]]):
+        try:
+            while not input_buffer.is_closed():
+                with self._input_lock:
+                    input = self._input
+
+                num_frame, frame = input.next_frame()
+
+                if num_frame is None or frame is None:
+                    break
+
+                input_buffer.put((input, num_frame, frame, time.perf_counter()))
+        except Exception:
+            LIVIA_LOGGER.exception("Error reading frame from input")
+        finally:
+            # Closing the buffer lets the play loop consume the remaining frames and then finish
+            input_buffer.close()
+
     def _output_frame(self, frame: ndarray):
+        num_frame = self._num_frame
+        if num_frame is None:
+            raise RuntimeError("self._num_frame should not be None")
+
         with self._output_lock:
             output = self._output
 
-        output.output_frame(self._num_frame, frame)
+        output.output_frame(num_frame, frame)
+        self._stamp_frame_outputted()
 
-        self._notify_process_change_event(ProcessChangeListener.frame_outputted)
+        self._notify_frame_event(ProcessChangeListener.frame_outputted)
 
     def pause(self):
         with self._running_condition:
@@ -163,6 +277,7 @@ class FrameProcessor(ABC):
                 raise FrameProcessError("Process is already running")
             else:
                 self._num_frame = None
+                self._reset_frame_timestamps()
                 self._alive = True
                 self._play_thread = Thread(target=self._play, daemon=self._daemon, name="Frame Processor Play Thread")
                 self._play_thread.start()
@@ -176,12 +291,27 @@ class FrameProcessor(ABC):
                 self._paused = False
                 self._alive = False
                 self._running_condition.notify()  # Awake if paused
-                self._on_stop()
 
-                self._notify_process_change_event(ProcessChangeListener.stopped)
+                input_buffer = self._input_buffer
+                if input_buffer is not None:
+                    input_buffer.close()  # Awake if waiting for a frame
+
+                self._on_stop()
             else:
                 raise FrameProcessError("Process is not running")
 
+        # Frame events are not sent once the process is stopped, so the pending ones are delivered before notifying it.
+        # It is done without the lock, as the listeners called by the event dispatcher may use the processor
+        self._flush_frame_events()
+
+        with self._running_condition:
+            self._notify_process_change_event(ProcessChangeListener.stopped)
+
+    def wait(self):
+        thread = self._play_thread
+        if thread is not None:
+            thread.join()
+
     def stop_and_wait(self):
         thread = self._play_thread
         self.stop()
@@ -199,6 +329,9 @@ class FrameProcessor(ABC):
     def _on_stop(self):
         pass
 
+    def _on_finish(self):
+        pass
+
     def __enter__(self):
         pass
 
@@ -225,5 +358,27 @@ class FrameProcessor(ABC):
 
     def _notify_process_change_event(self,
                                      event_method: Callable[[ProcessChangeListener, ProcessChangeEvent], None]):
-        event = ProcessChangeEvent(self, self._num_frame)
+        event = ProcessChangeEvent(self, self._num_frame, self._frame_timestamps)
         self._process_change_listeners.notify(event_method, event)
+
+    def _flush_frame_events(self):
+        event_dispatcher = self._event_dispatcher
+        if event_dispatcher is not None:
+            event_dispatcher.flush(self._process_change_listeners)
+
+    def _notify_frame_event(self, event_method: Callable[[ProcessChangeListener, ProcessChangeEvent], None]):
+        # Per-frame events are skipped when nobody listens and, if there is an event dispatcher, they are delivered by
+        # its thread instead of the play thread
+        num_frame = self._num_frame
+        if len(self._process_change_listeners) == 0 or num_frame is None or not self._alive:
+            return
+
+        # The timestamps are copied, as the play thread keeps updating them while the event is dispatched
+        timestamps = self._frame_timestamps
+        event = ProcessChangeEvent(self, num_frame, None if timestamps is None else timestamps.copy())
+
+        event_dispatcher = self._event_dispatcher
+        if event_dispatcher is None:
+            self._process_change_listeners.notify(event_method, event)
+        else:
+            event_dispatcher.dispatch(self._process_change_listeners, event_method, event)
@@ -0,0 +1,92 @@
+from typing import Optional
+
+
+class FrameTimestamps:
+    def __init__(self, captured: Optional[float] = None):
+        # All the timestamps are taken with time.perf_counter
+        self.__captured: Optional[float] = captured
+        self.__analysis_started: Optional[float] = None
+        self.__analysis_finished: Optional[float] = None
+        self.__modification_captured: Optional[float] = None
+        self.__modification_applied: Optional[float] = None
+        self.__outputted: Optional[float] = None
+
+    def copy(self) -> "FrameTimestamps":
+        timestamps = FrameTimestamps(self.__captured)
+        timestamps.__analysis_started = self.__analysis_started
+        timestamps.__analysis_finished = self.__analysis_finished
+        timestamps.__modification_captured = self.__modification_captured
+        timestamps.__modification_applied = self.__modification_applied
+        timestamps.__outputted = self.__outputted
+
+        return timestamps
+
+    @property
+    def captured(self) -> Optional[float]:
+        return self.__captured
+
+    @captured.setter
+    def captured(self, captured: Optional[float]):
+        self.__captured = captured
+
+    @property
+    def analysis_started(self) -> Optional[float]:
+        return self.__analysis_started
+
+    @analysis_started.setter
+    def analysis_started(self, analysis_started: Optional[float]):
+        self.__analysis_started = analysis_started
+
+    @property
+    def analysis_finished(self) -> Optional[float]:
+        return self.__analysis_finished
+
+    @analysis_finished.setter
+    def analysis_finished(self, analysis_finished: Optional[float]):
+        self.__analysis_finished = analysis_finished
+
+    @property
+    def modification_captured(self) -> Optional[float]:
+        return self.__modification_captured
+
+    @modification_captured.setter
+    def modification_captured(self, modification_captured: Optional[float]):
+        self.__modification_captured = modification_captured
+
+    @property
+    def modification_applied(self) -> Optional[float]:
+        return self.__modification_applied
+
+    @modification_applied.setter
+    def modification_applied(self, modification_applied: Optional[float]):
+        self.__modification_applied = modification_applied
+
+    @property
+    def outputted(self) -> Optional[float]:
+        return self.__outputted
+
+    @outputted.setter
+    def outputted(self, outputted: Optional[float]):
+        self.__outputted = outputted
+
+    @property
+    def analysis_time(self) -> Optional[float]:
+        if self.__analysis_started is None or self.__analysis_finished is None:
+            return None
+        else:
+            return self.__analysis_finished - self.__analysis_started
+
+    @property
+    def modification_age(self) -> Optional[float]:
+        # Time elapsed since the capture of the frame that was analyzed to build the applied modification
+        if self.__modification_captured is None or self.__modification_applied is None:
+            return None
+        else:
+            return self.__modification_applied - self.__modification_captured
+
+    @property
+    def latency(self) -> Optional[float]:
+        if self.__captured is None or self.__outputted is None:
+            return None
+        else:
+            return self.__outputted - self.__captured
@@ -0,0 +1,31 @@
+import time
+from typing import Optional
+
+from livia.benchmarking.LatencyHistogram import LatencyHistogram
+from livia.process.FrameTimestamps import FrameTimestamps
+
+
+class HasFrameTimestamps:
+    def __init__(self):
+        self._frame_timestamps: Optional[FrameTimestamps] = None
+        self._output_latency: LatencyHistogram = LatencyHistogram()
+
+    @property
+    def output_latency(self) -> LatencyHistogram:
+        return self._output_latency
+
+    def _reset_frame_timestamps(self):
+        self._frame_timestamps = None
+        self._output_latency.reset()
+
+    def _stamp_frame_inputted(self, captured: Optional[float]):
+        self._frame_timestamps = FrameTimestamps(captured)
+
+    def _stamp_frame_outputted(self):
+        timestamps = self._frame_timestamps
+        if timestamps is not None:
+            timestamps.outputted = time.perf_counter()
+
+            latency = timestamps.latency
+            if latency is not None:
+                self._output_latency.add(latency)
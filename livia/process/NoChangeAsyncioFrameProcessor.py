@@ -0,0 +1,13 @@
+from numpy import ndarray
+
+from livia.input.AsyncFrameInput import AsyncFrameInput
+from livia.output.AsyncFrameOutput import AsyncFrameOutput
+from livia.process.AsyncioFrameProcessor import AsyncioFrameProcessor
+
+
+class NoChangeAsyncioFrameProcessor(AsyncioFrameProcessor):
+    def __init__(self, input: AsyncFrameInput, output: AsyncFrameOutput):
+        super().__init__(input, output)
+
+    async def _manipulate_frame(self, frame: ndarray) -> ndarray:
+        return frame
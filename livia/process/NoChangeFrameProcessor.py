@@ -1,13 +1,19 @@
 from numpy import ndarray
 
+from livia.buffer.RingBuffer import OverflowPolicy
 from livia.input.FrameInput import FrameInput
 from livia.output.FrameOutput import FrameOutput
-from livia.process.FrameProcessor import FrameProcessor
+from livia.process.FrameProcessor import FrameProcessor, DEFAULT_INPUT_BUFFER_SIZE
 
 
 class NoChangeFrameProcessor(FrameProcessor):
-    def __init__(self, input: FrameInput, output: FrameOutput, daemon: bool = True):
-        super().__init__(input, output, daemon)
+    def __init__(self,
+                 input: FrameInput,
+                 output: FrameOutput,
+                 daemon: bool = True,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        super().__init__(input, output, daemon, input_buffer_size, input_buffer_policy)
 
     def _manipulate_frame(self, frame: ndarray) -> ndarray:
         return frame
@@ -1,93 +1,80 @@
+import time
 from typing import Optional
 
 from numpy import ndarray
 
+from livia.buffer.FrameBufferPool import FrameBufferPool
+from livia.buffer.RingBuffer import OverflowPolicy
 from livia.input.FrameInput import FrameInput
+from livia.input.SeekableFrameInput import SeekableFrameInput
 from livia.output.FrameOutput import FrameOutput
-from livia.process.FrameProcessor import FrameProcessor
+from livia.process.FrameProcessor import FrameProcessor, DEFAULT_INPUT_BUFFER_SIZE
 from livia.process.analyzer.AreaOfInterest import AreaOfInterest
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
-from livia.process.analyzer.listener.FrameAnalyzerChangeEvent import FrameAnalyzerChangeEvent
-from livia.process.analyzer.listener.FrameAnalyzerChangeListener import FrameAnalyzerChangeListener
-from livia.process.analyzer.modification.FrameModification import FrameModification
-from livia.process.analyzer.modification.NoFrameModification import NoFrameModification
-from livia.process.listener.EventListeners import EventListeners
+from livia.process.analyzer.FrameRatioController import FrameRatioController
+from livia.process.analyzer.HasFrameAnalyzer import HasFrameAnalyzer, DEFAULT_FRAME_RATIO
+from livia.process.analyzer.SceneChangeDetector import SceneChangeDetector
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
 
-DEFAULT_FRAME_RATIO: int = 1
 
-
-class AnalyzerFrameProcessor(FrameProcessor):
+class AnalyzerFrameProcessor(FrameProcessor, HasFrameAnalyzer):
     def __init__(self,
                  input: FrameInput,
                  output: FrameOutput,
                  frame_analyzer: FrameAnalyzer,
                  area_of_interest: Optional[AreaOfInterest] = None,
                  frame_ratio: int = DEFAULT_FRAME_RATIO,
-                 daemon: bool = True):
-        super().__init__(input, output, daemon)
-
-        self.__current_modification: FrameModification = NoFrameModification()
-        self._area_of_interest: Optional[AreaOfInterest] = area_of_interest
-        self._frame_ratio: int = frame_ratio
-
-        self._frame_analyzer: FrameAnalyzer = frame_analyzer
-        self._frame_analyzer_change_listeners: EventListeners[FrameAnalyzerChangeListener] =\
-            EventListeners[FrameAnalyzerChangeListener]()
-
-    def _has_area_of_interest(self) -> bool:
-        return self._area_of_interest is not None
+                 daemon: bool = True,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 frame_ratio_controller: Optional[FrameRatioController] = None,
+                 frame_buffer_pool: Optional[FrameBufferPool] = None,
+                 read_only_frames: bool = False,
+                 frame_modification_cache: Optional[FrameModificationCache] = None,
+                 scene_change_detector: Optional[SceneChangeDetector] = None):
+        FrameProcessor.__init__(self, input, output, daemon, input_buffer_size, input_buffer_policy)
+        HasFrameAnalyzer.__init__(self, frame_analyzer, area_of_interest, frame_ratio, frame_ratio_controller,
+                                  frame_buffer_pool, read_only_frames, frame_modification_cache, scene_change_detector)
+
+    def _get_input_fps(self) -> float:
+        return self._input.get_fps()
+
+    def _get_seekable_input(self) -> Optional[SeekableFrameInput]:
+        return self._input if isinstance(self._input, SeekableFrameInput) else None
+
+    def _on_start(self):
+        self._reset_analysis()
 
     def _manipulate_frame(self, frame: ndarray) -> ndarray:
-        if self._num_frame is None:
+        num_frame = self._num_frame
+        if num_frame is None:
             raise RuntimeError("self._num_frame should not be None")
 
-        if self._num_frame % self._frame_ratio == 0:
-            if self._has_area_of_interest():
-                frame_aoi = self._area_of_interest.extract_from(frame)
-
-                modification = self._frame_analyzer.analyze(self._num_frame // self._frame_ratio, frame_aoi.copy())
-                self.__current_modification = modification
-
-                modified_frame_aoi = modification.modify(self._num_frame // self._frame_ratio, frame_aoi)
-
-                return self._area_of_interest.replace_on(frame, modified_frame_aoi)
-            else:
-                modification = self._frame_analyzer.analyze(self._num_frame // self._frame_ratio, frame.copy())
-                self.__current_modification = modification
+        # The frame ratio may change with the analysis, which starts with the next frame
+        frame_index = self._analysis_frame_index(num_frame)
+        frame_position = self._analysis_frame_position(num_frame)
+        frame_aoi = self._extract_area_of_interest(frame)
 
-                return modification.modify(self._num_frame // self._frame_ratio, frame)
-        else:
-            if self._has_area_of_interest():
-                frame_aoi = self._area_of_interest.extract_from(frame)
+        frame_to_analyze = self._prepare_analysis(num_frame, frame, frame_aoi)
+        if frame_to_analyze is not None:
+            analysis_start = time.perf_counter()
+            try:
+                modification = self._run_analysis(frame_index, frame_to_analyze)
+                analysis_end = time.perf_counter()
 
-                modification = self.__current_modification
+                # The frame is released once the modification is cached, as caches may keep references to it
+                self._finish_analysis(num_frame, frame_to_analyze, modification, analysis_start, analysis_end)
+            finally:
+                self._release_frame(frame_to_analyze)
 
-                modified_frame_aoi = modification.modify(self._num_frame // self._frame_ratio, frame_aoi)
-
-                return self._area_of_interest.replace_on(frame, modified_frame_aoi)
-            else:
-                modification = self.__current_modification
-
-                return modification.modify(self._num_frame // self._frame_ratio, frame)
+        return self._apply_current_modification(frame_index, frame_position, frame, frame_aoi)
 
     @property
-    def frame_analyzer(self) -> FrameAnalyzer:
-        return self._frame_analyzer
-
-    @frame_analyzer.setter
-    def frame_analyzer(self, frame_analyzer: FrameAnalyzer):
-        if self._frame_analyzer != frame_analyzer:
-            old_frame_analyzer = self._frame_analyzer
-            self._frame_analyzer = frame_analyzer
-
-            event = FrameAnalyzerChangeEvent(self, self._frame_analyzer, old_frame_analyzer)
-            self._frame_analyzer_change_listeners.notify(FrameAnalyzerChangeListener.analyzer_changed, event)
-
-    def add_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener):
-        self._frame_analyzer_change_listeners.append(listener)
-
-    def remove_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener):
-        self._frame_analyzer_change_listeners.remove(listener)
-
-    def has_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener) -> bool:
-        return listener in self._frame_analyzer_change_listeners
+    def input(self) -> FrameInput:
+        return super().input
+
+    @input.setter
+    def input(self, input: FrameInput):
+        if input != self._input:
+            self._set_input(input)
+            self._clear_input_caches()
@@ -2,7 +2,7 @@ from numpy import ndarray, ascontiguousarray
 
 
 class AreaOfInterest:
-    def __init__(self, x: int, y: int, width: int, height: int):
+    def __init__(self, x: int, y: int, width: int, height: int, strided: bool = False):
         if x < 0:
             raise ValueError("x must be non-negative number")
         if y < 0:
@@ -16,6 +16,8 @@ class AreaOfInterest:
         self.__y: int = y
         self.__width: int = width
         self.__height: int = height
+        # Strided areas are extracted as views of the frame, so the modifications are drawn directly on it
+        self.__strided: bool = strided
 
     @property
     def x(self) -> int:
@@ -33,6 +35,10 @@ class AreaOfInterest:
     def height(self) -> int:
         return self.__height
 
+    @property
+    def strided(self) -> bool:
+        return self.__strided
+
     @property
     def x0(self) -> int:
         return self.__x
@@ -49,12 +55,25 @@ class AreaOfInterest:
     def y1(self) -> int:
         return self.__y + self.__height - 1
 
+    def view_from(self, frame: ndarray) -> ndarray:
+        return frame[self.y0:self.y1 + 1, self.x0:self.x1 + 1]
+
     def extract_from(self, frame: ndarray) -> ndarray:
-        frame_aoi = frame[self.y0:self.y1 + 1, self.x0:self.x1 + 1]
+        frame_aoi = self.view_from(frame)
 
-        return frame_aoi if frame_aoi.flags['C_CONTIGUOUS'] else ascontiguousarray(frame_aoi)
+        return frame_aoi if self.__strided or frame_aoi.flags['C_CONTIGUOUS'] else ascontiguousarray(frame_aoi)
 
     def replace_on(self, frame: ndarray, aoi: ndarray) -> ndarray:
-        frame[self.y0:self.y1 + 1, self.x0:self.x1 + 1] = aoi
+        frame_aoi = self.view_from(frame)
+
+        # Areas modified in place (e.g. strided areas) are already part of the frame
+        if not AreaOfInterest.__is_same_view(frame_aoi, aoi):
+            frame_aoi[...] = aoi
 
         return frame
+
+    @staticmethod
+    def __is_same_view(view: ndarray, other_view: ndarray) -> bool:
+        return view.__array_interface__["data"][0] == other_view.__array_interface__["data"][0] \
+               and view.shape == other_view.shape \
+               and view.strides == other_view.strides
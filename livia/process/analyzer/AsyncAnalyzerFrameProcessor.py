@@ -1,19 +1,35 @@
 import time
+from collections import deque
 from threading import Thread, Lock, Condition
-from typing import Optional, Tuple, List
+from logging import Logger
+from typing import Optional, Tuple, List, Dict, Deque, Sequence, Set
 
 from numpy import ndarray
 
+from livia import LIVIA_LOGGER
 from livia.benchmarking.TimeLogger import TimeLogger
+from livia.buffer.FrameBufferPool import FrameBufferPool
+from livia.buffer.RingBuffer import OverflowPolicy
 from livia.input.FrameInput import FrameInput
 from livia.output.FrameOutput import FrameOutput
+from livia.process.FrameProcessError import FrameProcessError
+from livia.process.FrameProcessor import DEFAULT_INPUT_BUFFER_SIZE
+from livia.process.FrameTimestamps import FrameTimestamps
 from livia.process.analyzer.AnalyzerFrameProcessor import AnalyzerFrameProcessor, DEFAULT_FRAME_RATIO
 from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+from livia.process.analyzer.FrameAnalyzerProcess import FrameAnalyzerProcess
+from livia.process.analyzer.FrameRatioController import FrameRatioController
+from livia.process.analyzer.SceneChangeDetector import SceneChangeDetector
 from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.modification.NoFrameModification import NoFrameModification
 
 DEFAULT_MODIFICATION_PERSISTENCE: int = 0
 DEFAULT_NUM_THREADS: int = 1
+DEFAULT_BATCH_SIZE: int = 1
+DEFAULT_BATCH_DELAY: float = 0.0
 
 
 class AsyncAnalyzerFrameProcessor(AnalyzerFrameProcessor):
@@ -26,43 +42,146 @@ class AsyncAnalyzerFrameProcessor(AnalyzerFrameProcessor):
                  num_threads: int = DEFAULT_NUM_THREADS,
                  frame_ratio: int = DEFAULT_FRAME_RATIO,
                  daemon: bool = True,
-                 delay: Optional[float] = None):
-        super().__init__(input, output, frame_analyzer, area_of_interest, frame_ratio, daemon)
+                 delay: Optional[float] = None,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 use_processes: bool = False,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_delay: float = DEFAULT_BATCH_DELAY,
+                 frame_ratio_controller: Optional[FrameRatioController] = None,
+                 frame_buffer_pool: Optional[FrameBufferPool] = None,
+                 frame_modification_cache: Optional[FrameModificationCache] = None,
+                 scene_change_detector: Optional[SceneChangeDetector] = None):
+        super().__init__(input, output, frame_analyzer, area_of_interest, frame_ratio, daemon, input_buffer_size,
+                         input_buffer_policy, frame_ratio_controller, frame_buffer_pool,
+                         frame_modification_cache=frame_modification_cache,
+                         scene_change_detector=scene_change_detector)
 
         if delay is not None and delay < 0:
             raise ValueError("delay must be None or a non negative float")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive number")
+        if batch_delay < 0:
+            raise ValueError("batch_delay must be a non negative float")
 
         self._analyzer_thread: List[Optional[Thread]] = [None] * num_threads
         self._delay: Optional[float] = delay
+        self._use_processes: bool = use_processes
+        self._batch_size: int = batch_size
+        self._batch_delay: float = batch_delay
+
+        self._check_frame_analyzer(frame_analyzer)
 
         self._modification_persistence: int = modification_persistence
 
-        self._current_frame: Optional[Tuple[Optional[int], Optional[ndarray]]] = None
-        self._current_area_of_interest: Optional[ndarray] = None
-        self._current_modification: Optional[Tuple[FrameModification, int]] = None
+        # Only the latest frames (or their areas of interest) are kept while the analyzers are busy, along with their
+        # timestamps and their number in the input, if their modifications can be cached
+        self._pending_frames: Deque[Tuple[int, ndarray, Optional[FrameTimestamps], Optional[int]]] = \
+            deque(maxlen=batch_size)
+        # Modification, number of frames it was applied to and timestamps of the frame it was built from
+        self._current_modification: Optional[List] = None
+        # Latest committed modification and its timestamps, which are applied again while the scene does not change
+        self._latest_result: Optional[Tuple[FrameModification, Optional[FrameTimestamps]]] = None
+
+        # Frames are numbered when an analyzer thread takes them, and their results are committed in that order
+        self._next_sequence: int = 0
+        self._next_commit_sequence: int = 0
+        self._pending_results: Dict[int, Tuple[Optional[FrameModification], Optional[FrameTimestamps]]] = {}
+        self._discarded_results: int = 0
+        self._reordered_results: int = 0
+
+        # Frame ratio requested by the analyzer threads. It is applied by the play thread, which moves the frame number
+        self._requested_frame_ratio: Optional[int] = None
+
+        # Batches are also numbered when they are taken, so that analyzers with state analyze them in that order
+        self._next_analysis_turn: int = 0
+        self._current_analysis_turn: int = 0
+        self._finished_analysis_turns: Set[int] = set()
 
         self._frame_analyzer_lock: Lock = Lock()
         self._current_modification_lock: Lock = Lock()
         self._current_frame_condition: Condition = Condition(lock=Lock())
+        self._analysis_turn_condition: Condition = Condition(lock=Lock())
 
         self._tl_analyze_frame: TimeLogger = TimeLogger("Analyze Cycle", self.__class__.__name__)
 
-    @AnalyzerFrameProcessor.frame_analyzer.setter
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return super().frame_analyzer
+
+    @frame_analyzer.setter
     def frame_analyzer(self, frame_analyzer: FrameAnalyzer):
         if self._frame_analyzer != frame_analyzer:
+            self._check_frame_analyzer(frame_analyzer)
+
             with self._frame_analyzer_lock:
-                AnalyzerFrameProcessor.frame_analyzer.fset(self, frame_analyzer)
+                self._set_frame_analyzer(frame_analyzer)
+
+    def _check_frame_analyzer(self, frame_analyzer: FrameAnalyzer):
+        # Each analyzer process has its own copy of the analyzer, so the state would be split between the processes
+        if self._use_processes and len(self._analyzer_thread) > 1 and frame_analyzer.new_state() is not None:
+            raise ValueError("analyzers with state can not be used with several analyzer processes")
+
+    @property
+    def discarded_results(self) -> int:
+        with self._current_modification_lock:
+            return self._discarded_results
+
+    @property
+    def reordered_results(self) -> int:
+        with self._current_modification_lock:
+            return self._reordered_results
 
     def _process_frame(self, frame: ndarray):
-        if self._num_frame % self._frame_ratio == 0:
+        self._apply_requested_frame_ratio()
+
+        num_frame = self._num_frame
+        if num_frame is None:
+            raise RuntimeError("self._num_frame should not be None")
+
+        is_frame_to_analyze = self._is_frame_to_analyze(num_frame)
+
+        if is_frame_to_analyze:
+            frame_to_analyze = self._view_frame_to_analyze(frame)
+
+            cached_modification = self._get_cached_modification(num_frame, frame_to_analyze)
+            analyze = cached_modification is None and not self._is_analysis_skipped(frame_to_analyze)
+        else:
+            cached_modification = None
+            analyze = False
+
+        if cached_modification is not None:
+            with self._current_frame_condition:
+                # Pending frames are older than this one, so their modifications would be superseded anyway
+                self._clear_pending_frames()
+
+                sequence = self._next_sequence
+                self._next_sequence += 1
+
+            self._commit_result(sequence, cached_modification)
+        elif analyze:
             # Frame is copied to prevent analyzers from analyzing manipulated frames
-            frame_copy = frame.copy()
+            frame_copy = self._copy_frame(self._view_frame_to_analyze(frame))
 
             with self._current_frame_condition:
-                self._current_frame = [self._num_frame // self._frame_ratio, frame_copy]
-                if self._has_area_of_interest():
-                    self._current_area_of_interest = self._area_of_interest.extract_from(frame_copy)
+                if len(self._pending_frames) == self._pending_frames.maxlen:
+                    _, dropped_frame, _, _ = self._pending_frames.popleft()
+                    self._release_frame(dropped_frame)
+
+                # The analysis has its own timestamps, as the ones of the frame are stamped while it is being output
+                analysis_timestamps = None if self._frame_timestamps is None else \
+                    FrameTimestamps(self._frame_timestamps.captured)
+
+                cache_num_frame = num_frame if self._is_frame_modification_cacheable() else None
+
+                self._pending_frames.append(
+                    (self._analysis_frame_index(num_frame), frame_copy, analysis_timestamps, cache_num_frame)
+                )
                 self._current_frame_condition.notify()
+        elif is_frame_to_analyze:
+            with self._current_modification_lock:
+                if self._latest_result is not None:
+                    self._current_modification = [self._latest_result[0], 0, self._latest_result[1]]
 
         if self._delay is not None:
             time.sleep(self._delay)
@@ -70,7 +189,8 @@ class AsyncAnalyzerFrameProcessor(AnalyzerFrameProcessor):
         super()._process_frame(frame)
 
     def _manipulate_frame(self, frame: ndarray) -> ndarray:
-        if self._num_frame is None:
+        num_frame = self._num_frame
+        if num_frame is None:
             raise RuntimeError("self._num_frame should not be None")
 
         with self._current_modification_lock:
@@ -84,15 +204,59 @@ class AsyncAnalyzerFrameProcessor(AnalyzerFrameProcessor):
         if modification is None:
             return frame
         else:
-            if self._has_area_of_interest():
-                frame_aoi = self._area_of_interest.extract_from(frame)
-                frame_aoi = modification[0].modify(self._num_frame // self._frame_ratio, frame_aoi)
+            frame_index = self._analysis_frame_index(num_frame)
+            frame_position = self._analysis_frame_position(num_frame)
+            frame_aoi = self._extract_area_of_interest(frame)
+
+            modified_frame = self._modify_frame(modification[0], frame_index, frame_position, frame, frame_aoi)
+
+            self._stamp_modification(modification[2])
+
+            return modified_frame
+
+    def _adjust_frame_ratio(self, analysis_time: float, parallelism: int = 1):
+        frame_ratio_controller = self._frame_ratio_controller
+
+        if frame_ratio_controller is not None:
+            fps = self._get_input_fps()
+
+            with self._frame_ratio_lock:
+                frame_ratio = self._frame_ratio if self._requested_frame_ratio is None else self._requested_frame_ratio
+
+                self._requested_frame_ratio = frame_ratio_controller.update(
+                    frame_ratio, analysis_time, fps, parallelism
+                )
+
+    def _apply_requested_frame_ratio(self):
+        with self._frame_ratio_lock:
+            frame_ratio = self._requested_frame_ratio
+            self._requested_frame_ratio = None
 
-                return self._area_of_interest.replace_on(frame, frame_aoi)
-            else:
-                return modification[0].modify(self._num_frame // self._frame_ratio, frame)
+        if frame_ratio is not None:
+            self.frame_ratio = frame_ratio
 
     def _on_start(self):
+        super()._on_start()
+
+        with self._frame_ratio_lock:
+            self._requested_frame_ratio = None
+
+        with self._current_frame_condition:
+            self._clear_pending_frames()
+
+            with self._current_modification_lock:
+                self._next_sequence = 0
+                self._next_commit_sequence = 0
+                self._pending_results.clear()
+                self._latest_result = None
+                self._discarded_results = 0
+                self._reordered_results = 0
+
+            with self._analysis_turn_condition:
+                self._next_analysis_turn = 0
+                self._current_analysis_turn = 0
+                self._finished_analysis_turns.clear()
+
         if self._analyzer_thread[0] is None:
             for i in range(0, len(self._analyzer_thread)):
                 self._analyzer_thread[i] = Thread(target=self._analyze_frame, daemon=self._daemon,
@@ -103,39 +267,206 @@ class AsyncAnalyzerFrameProcessor(AnalyzerFrameProcessor):
         with self._current_frame_condition:
             self._current_frame_condition.notify_all()
 
+        with self._analysis_turn_condition:
+            self._analysis_turn_condition.notify_all()
+
+    def _on_finish(self):
+        with self._current_frame_condition:
+            self._clear_pending_frames()
+            self._current_frame_condition.notify_all()
+
+    def _clear_pending_frames(self):
+        for _, pending_frame, _, _ in self._pending_frames:
+            self._release_frame(pending_frame)
+        self._pending_frames.clear()
+
     def stop_and_join(self):
-        threads = self._analyzer_thread
+        threads = [thread for thread in self._analyzer_thread if thread is not None]
         super().stop_and_wait()
         for thread in threads:
             thread.join()
 
     def _analyze_frame(self):
+        # Each analyzer thread owns its own analyzer process, so the analyses are not serialized by the GIL
+        analyzer_process = FrameAnalyzerProcess(self._frame_analyzer, self._daemon) if self._use_processes else None
+
+        if analyzer_process is not None:
+            analyzer_process.start()
+
+        try:
+            self._analyze_frames(analyzer_process)
+        finally:
+            if analyzer_process is not None:
+                analyzer_process.close()
+
+    def _analyze_frames(self, analyzer_process: Optional[FrameAnalyzerProcess]):
+        analyzer_process_lost = False
+
         while True:
             with self._current_frame_condition:
-                if self._current_frame is None:
-                    self._current_frame_condition.wait()
-                frame = self._current_frame
-                aoi = self._current_area_of_interest
-                self._current_frame = None
+                pending_frames = self._wait_for_pending_frames()
+
+                first_sequence = self._next_sequence
+                self._next_sequence += len(pending_frames)
+
+                if pending_frames:
+                    analysis_turn = self._next_analysis_turn
+                    self._next_analysis_turn += 1
+
+            if not self._alive:
+                for _, pending_frame, _, _ in pending_frames:
+                    self._release_frame(pending_frame)
+                break
+            elif not pending_frames:
+                continue
 
             with self._tl_analyze_frame:
                 with self._frame_analyzer_lock:
                     frame_analyzer = self._frame_analyzer
+                    stateful_frame_analyzer = self._stateful_frame_analyzer
+
+                frames = [(num_frame, frame) for num_frame, frame, _, _ in pending_frames]
 
-                if self._alive:
-                    if self._has_area_of_interest():
-                        num_frame, _ = frame
-                        modification = frame_analyzer.analyze(num_frame, aoi)
+                modifications: Sequence[Optional[FrameModification]] = [None] * len(frames)
+                analysis_start = time.perf_counter()
+                try:
+                    # Analyzers with state must see the frames in order, so the analyses of the threads are serialized
+                    if analyzer_process is None and len(self._analyzer_thread) > 1 and stateful_frame_analyzer:
+                        if not self._wait_for_analysis_turn(analysis_turn):
+                            continue
+
+                    if analyzer_process is not None:
+                        analyzer_process.frame_analyzer = frame_analyzer
+                        modifications = analyzer_process.analyze_batch(frames)
                     else:
-                        modification = frame_analyzer.analyze(*frame)
-                else:
+                        with frame_analyzer.analysis_context([frame for _, frame in frames]):
+                            if len(frames) == 1:
+                                modifications = [frame_analyzer.analyze(*frames[0])]
+                            else:
+                                modifications = frame_analyzer.analyze_batch(frames)
+                except Exception as error:
+                    # Only the errors of the analyzer are recovered from, not the lost connections to analyzer processes
+                    if analyzer_process is not None and isinstance(error, (EOFError, ConnectionError)):
+                        LIVIA_LOGGER.exception("Connection with the analyzer process lost")
+                        analyzer_process_lost = True
+                        modifications = [NoFrameModification()] * len(frames)
+                    else:
+                        self._get_logger_for(frame_analyzer).exception("Error analyzing frames")
+                        continue
+                finally:
+                    analysis_end = time.perf_counter()
+
+                    self._finish_analysis_turn(analysis_turn)
+
+                    for _, _, timestamps, _ in pending_frames:
+                        if timestamps is not None:
+                            timestamps.analysis_started = analysis_start
+                            timestamps.analysis_finished = analysis_end
+
+                    # A result is always committed, even if empty, so that later results are not held forever
+                    for offset, modification in enumerate(modifications):
+                        self._commit_result(first_sequence + offset, modification, pending_frames[offset][2])
+
+                    if frame_analyzer is self._frame_analyzer:
+                        for (_, frame, _, cache_num_frame), modification in zip(pending_frames, modifications):
+                            if cache_num_frame is not None and modification is not None:
+                                self._cache_modification(cache_num_frame, modification, frame)
+
+                    # The frames are released once their modifications are cached, as caches may keep references to them
+                    for _, frame in frames:
+                        self._release_frame(frame)
+
+                if analyzer_process_lost:
                     break
 
-                if self._alive:
-                    with self._current_modification_lock:
-                        self._current_modification = [modification, 0]
-                else:
+                self._analysis_latency.add(analysis_end - analysis_start)
+                self._adjust_frame_ratio((analysis_end - analysis_start) / len(frames), len(self._analyzer_thread))
+
+                if not self._alive:
                     break
 
         for i in range(0, len(self._analyzer_thread)):
             self._analyzer_thread[i] = None
+
+        if analyzer_process_lost:
+            self.__stop_without_analyzer()
+
+    def __stop_without_analyzer(self):
+        # The processor is stopped as if requested, so the other analyzer threads end and the finished event is sent
+        try:
+            self.stop()
+        except FrameProcessError:
+            # It was already stopped
+            pass
+
+    def _wait_for_analysis_turn(self, analysis_turn: int) -> bool:
+        with self._analysis_turn_condition:
+            while self._current_analysis_turn != analysis_turn and self._alive:
+                self._analysis_turn_condition.wait()
+
+            return self._current_analysis_turn == analysis_turn
+
+    def _finish_analysis_turn(self, analysis_turn: int):
+        with self._analysis_turn_condition:
+            self._finished_analysis_turns.add(analysis_turn)
+
+            while self._current_analysis_turn in self._finished_analysis_turns:
+                self._finished_analysis_turns.remove(self._current_analysis_turn)
+                self._current_analysis_turn += 1
+
+            self._analysis_turn_condition.notify_all()
+
+    @staticmethod
+    def _get_logger_for(frame_analyzer: FrameAnalyzer) -> Logger:
+        try:
+            return FrameAnalyzerManager.get_logger_for(frame_analyzer)
+        except ValueError:
+            return LIVIA_LOGGER
+
+    def _wait_for_pending_frames(self) -> List[Tuple[int, ndarray, Optional[FrameTimestamps], Optional[int]]]:
+        while not self._pending_frames and self._alive:
+            self._current_frame_condition.wait()
+
+        if self._batch_size > 1 and self._batch_delay > 0:
+            end_time = time.perf_counter() + self._batch_delay
+
+            while len(self._pending_frames) < self._batch_size and self._alive:
+                remaining_time = end_time - time.perf_counter()
+                if remaining_time <= 0:
+                    break
+
+                self._current_frame_condition.wait(remaining_time)
+
+        pending_frames = list(self._pending_frames)
+        self._pending_frames.clear()
+
+        return pending_frames
+
+    def _commit_result(self, sequence: int, modification: Optional[FrameModification],
+                       timestamps: Optional[FrameTimestamps] = None):
+        with self._current_modification_lock:
+            if sequence < self._next_commit_sequence:
+                self._discarded_results += 1
+                return
+
+            if sequence > self._next_commit_sequence:
+                self._reordered_results += 1
+
+            self._pending_results[sequence] = (modification, timestamps)
+
+            latest_modification = None
+            latest_timestamps = None
+            while self._next_commit_sequence in self._pending_results:
+                ready_modification, ready_timestamps = self._pending_results.pop(self._next_commit_sequence)
+                self._next_commit_sequence += 1
+
+                if ready_modification is not None:
+                    if latest_modification is not None:
+                        # Superseded before being applied to any frame
+                        self._discarded_results += 1
+                    latest_modification = ready_modification
+                    latest_timestamps = ready_timestamps
+
+            if latest_modification is not None and self._alive:
+                self._current_modification = [latest_modification, 0, latest_timestamps]
+                self._latest_result = (latest_modification, latest_timestamps)
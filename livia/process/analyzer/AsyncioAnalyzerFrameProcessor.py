@@ -0,0 +1,92 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Optional
+
+from numpy import ndarray
+
+from livia.buffer.FrameBufferPool import FrameBufferPool
+from livia.buffer.RingBuffer import OverflowPolicy
+from livia.input.AsyncFrameInput import AsyncFrameInput
+from livia.input.ExecutorAsyncFrameInput import ExecutorAsyncFrameInput
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.output.AsyncFrameOutput import AsyncFrameOutput
+from livia.process.AsyncioFrameProcessor import AsyncioFrameProcessor
+from livia.process.FrameProcessor import DEFAULT_INPUT_BUFFER_SIZE
+from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameRatioController import FrameRatioController
+from livia.process.analyzer.HasFrameAnalyzer import HasFrameAnalyzer, DEFAULT_FRAME_RATIO
+from livia.process.analyzer.SceneChangeDetector import SceneChangeDetector
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
+
+
+class AsyncioAnalyzerFrameProcessor(AsyncioFrameProcessor, HasFrameAnalyzer):
+    def __init__(self,
+                 input: AsyncFrameInput,
+                 output: AsyncFrameOutput,
+                 frame_analyzer: FrameAnalyzer,
+                 area_of_interest: Optional[AreaOfInterest] = None,
+                 frame_ratio: int = DEFAULT_FRAME_RATIO,
+                 executor: Optional[Executor] = None,
+                 input_buffer_size: int = DEFAULT_INPUT_BUFFER_SIZE,
+                 input_buffer_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 frame_ratio_controller: Optional[FrameRatioController] = None,
+                 frame_buffer_pool: Optional[FrameBufferPool] = None,
+                 read_only_frames: bool = False,
+                 frame_modification_cache: Optional[FrameModificationCache] = None,
+                 scene_change_detector: Optional[SceneChangeDetector] = None):
+        AsyncioFrameProcessor.__init__(self, input, output, input_buffer_size, input_buffer_policy)
+        HasFrameAnalyzer.__init__(self, frame_analyzer, area_of_interest, frame_ratio, frame_ratio_controller,
+                                  frame_buffer_pool, read_only_frames, frame_modification_cache, scene_change_detector)
+
+        self._executor: Optional[Executor] = executor
+
+    def _get_input_fps(self) -> float:
+        return self._input.get_fps()
+
+    def _get_seekable_input(self) -> Optional[SeekableFrameInput]:
+        # Asynchronous inputs can only be seeked through the input they wrap
+        input = self._input.input if isinstance(self._input, ExecutorAsyncFrameInput) else self._input
+
+        return input if isinstance(input, SeekableFrameInput) else None
+
+    def _on_start(self):
+        self._reset_analysis()
+
+    async def _manipulate_frame(self, frame: ndarray) -> ndarray:
+        num_frame = self._num_frame
+        if num_frame is None:
+            raise RuntimeError("self._num_frame should not be None")
+
+        # The frame ratio may change with the analysis, which starts with the next frame
+        frame_index = self._analysis_frame_index(num_frame)
+        frame_position = self._analysis_frame_position(num_frame)
+        frame_aoi = self._extract_area_of_interest(frame)
+
+        frame_to_analyze = self._prepare_analysis(num_frame, frame, frame_aoi)
+        if frame_to_analyze is not None:
+            analysis_start = time.perf_counter()
+            try:
+                # Analysis is blocking, so it runs outside the event loop
+                modification = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._run_analysis, frame_index, frame_to_analyze
+                )
+                analysis_end = time.perf_counter()
+
+                # The frame is released once the modification is cached, as caches may keep references to it
+                self._finish_analysis(num_frame, frame_to_analyze, modification, analysis_start, analysis_end)
+            finally:
+                self._release_frame(frame_to_analyze)
+
+        return self._apply_current_modification(frame_index, frame_position, frame, frame_aoi)
+
+    @property
+    def input(self) -> AsyncFrameInput:
+        return super().input
+
+    @input.setter
+    def input(self, input: AsyncFrameInput):
+        if input != self._input:
+            self._set_input(input)
+            self._clear_input_caches()
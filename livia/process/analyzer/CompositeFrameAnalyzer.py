@@ -1,24 +1,213 @@
+from __future__ import annotations
+
 from abc import abstractmethod, ABC
+from concurrent.futures import Executor, Future
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar, cast
 
 from numpy import ndarray
 
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameDetections import FrameDetections
 from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.modification.CompositeFrameModification import CompositeFrameModification
+from livia.process.analyzer.modification.DeferredFrameModification import DeferredFrameModification
 from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.preprocessing.FramePreprocessingCache import FramePreprocessingCache
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+T = TypeVar("T")
 
 
 class CompositeFrameAnalyzer(FrameAnalyzer, ABC):
     def __init__(self, child: FrameAnalyzer = NoChangeFrameAnalyzer()):
         self._child: FrameAnalyzer = child
+        self._executor: Optional[Executor] = None
+        self._preprocessing_cache: Optional[FramePreprocessingCache] = None
+
+    def __getstate__(self):
+        # Executors can not be sent to other processes, where the analyzer runs sequentially
+        state = self.__dict__.copy()
+        state["_executor"] = None
+
+        return state
 
     def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
-        return self._composite_analyze(num_frame, frame, self._child.analyze(num_frame, frame))
+        if not self._is_parallel():
+            return self._composite_analyze(num_frame, frame, self._child.analyze(num_frame, frame))
+
+        child_modification = DeferredFrameModification()
+        with self._child_analysis(self._child.analyze, num_frame, frame) as child_analysis:
+            modification = self._composite_analyze(num_frame, frame, child_modification)
+
+        child_modification.resolve(child_analysis.result())
+
+        return modification
+
+    def analyze_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameModification]:
+        if not self._is_parallel():
+            return self._composite_analyze_batch(frames, self._child.analyze_batch(frames))
+
+        deferred_modifications = [DeferredFrameModification() for _ in frames]
+        child_modifications: List[FrameModification] = list(deferred_modifications)
+        with self._child_analysis(self._child.analyze_batch, frames) as child_analysis:
+            modifications = self._composite_analyze_batch(frames, child_modifications)
+
+        for deferred_modification, modification in zip(deferred_modifications, child_analysis.result()):
+            deferred_modification.resolve(modification)
+
+        return modifications
 
     @abstractmethod
     def _composite_analyze(self, num_frame: int, frame: ndarray,
                            child_modification: FrameModification) -> FrameModification:
         pass
 
+    def _composite_analyze_batch(self, frames: Sequence[Tuple[int, ndarray]],
+                                 child_modifications: List[FrameModification]) -> List[FrameModification]:
+        return [
+            self._composite_analyze(num_frame, frame, child_modification)
+            for (num_frame, frame), child_modification in zip(frames, child_modifications)
+        ]
+
+    def analyze_batch_with_states(self, frames: Sequence[Tuple[int, ndarray]],
+                                  states: Sequence[Any]) -> Tuple[List[FrameModification], List[Any]]:
+        states = [(None, None) if state is None else state for state in states]
+        child_states = [child_state for _, child_state in states]
+        composite_states = [composite_state for composite_state, _ in states]
+
+        if not self._is_parallel():
+            child_modifications, child_states = self._child.analyze_batch_with_states(frames, child_states)
+            modifications, composite_states = self._composite_analyze_batch_with_states(
+                frames, child_modifications, composite_states
+            )
+        else:
+            deferred_modifications = [DeferredFrameModification() for _ in frames]
+            with self._child_analysis(self._child.analyze_batch_with_states, frames, child_states) as child_analysis:
+                modifications, composite_states = self._composite_analyze_batch_with_states(
+                    frames, list(deferred_modifications), composite_states
+                )
+
+            child_modifications, child_states = child_analysis.result()
+            for deferred_modification, child_modification in zip(deferred_modifications, child_modifications):
+                deferred_modification.resolve(child_modification)
+
+        return modifications, list(zip(composite_states, child_states))
+
+    def _composite_analyze_batch_with_states(
+            self, frames: Sequence[Tuple[int, ndarray]], child_modifications: List[FrameModification],
+            states: Sequence[Any]
+    ) -> Tuple[List[FrameModification], List[Any]]:
+        modifications: List[FrameModification] = []
+        new_states: List[Any] = []
+        for (num_frame, frame), child_modification, state in zip(frames, child_modifications, states):
+            self._set_composite_state(state)
+            modifications.append(self._composite_analyze(num_frame, frame, child_modification))
+            new_states.append(self._get_composite_state())
+
+        return modifications, new_states
+
+    def get_detections(self, modification: FrameModification) -> Optional[List[FrameDetections]]:
+        if not isinstance(modification, CompositeFrameModification):
+            return None
+
+        detections = self._get_composite_detections(modification)
+        if detections is None:
+            return None
+
+        child_modification = modification.child
+        if isinstance(child_modification, DeferredFrameModification):
+            child_modification = child_modification.modification
+
+        child_detections = self._child.get_detections(child_modification)
+        if child_detections is None:
+            return None
+
+        return [detections] + child_detections
+
+    def build_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                           detections: Sequence[FrameDetections]) -> FrameModification:
+        if len(detections) == 0:
+            raise ValueError("detections must contain the detections of each analyzer of the chain")
+
+        child_modification = self._child.build_modification_from_detections(num_frame, frame, detections[1:])
+
+        return self._build_composite_modification_from_detections(num_frame, frame, detections[0],
+                                                                  child_modification)
+
+    def _get_composite_detections(self, modification: CompositeFrameModification) -> Optional[FrameDetections]:
+        return None
+
+    def _build_composite_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                                      detections: FrameDetections,
+                                                      child_modification: FrameModification) -> FrameModification:
+        raise NotImplementedError()
+
+    def requires_writeable_frame(self) -> bool:
+        return self._child.requires_writeable_frame()
+
+    def analysis_context(self, frames: Iterable[ndarray]) -> ContextManager[None]:
+        # The preprocessing cache is shared with the whole chain, so the frames only have to be issued to it once
+        if self._preprocessing_cache is None:
+            return nullcontext()
+        else:
+            return self._preprocessing_cache.analyzing(frames)
+
+    def accepts_strided_frames(self) -> bool:
+        return self._composite_accepts_strided_frames() and self._child.accepts_strided_frames()
+
+    def _composite_accepts_strided_frames(self) -> bool:
+        return False
+
+    # Analyzers that only wrap the modification of their child override it, so that their child is analyzed in
+    # parallel with them
+    def depends_on_child_modification(self) -> bool:
+        return True
+
+    def _is_parallel(self) -> bool:
+        return self._executor is not None \
+               and not self.depends_on_child_modification() \
+               and not self._child.requires_writeable_frame()
+
+    def _preprocess_frame(self, num_frame: int, frame: ndarray, transform: FrameTransform) -> Any:
+        if self._preprocessing_cache is None:
+            return transform.apply(frame)
+        else:
+            return self._preprocessing_cache.preprocess(frame, transform)
+
+    def _child_analysis(self, analysis: Callable[..., T], *args: Any) -> _ChildAnalysis[T]:
+        if self._executor is None:
+            raise RuntimeError("self._executor should not be None")
+
+        return _ChildAnalysis(self._executor, analysis, *args)
+
+    def new_state(self) -> Any:
+        composite_state = self._new_composite_state()
+        child_state = self._child.new_state()
+
+        return None if composite_state is None and child_state is None else (composite_state, child_state)
+
+    def get_state(self) -> Any:
+        composite_state = self._get_composite_state()
+        child_state = self._child.get_state()
+
+        return None if composite_state is None and child_state is None else (composite_state, child_state)
+
+    def set_state(self, state: Any) -> None:
+        composite_state, child_state = (None, None) if state is None else state
+
+        self._set_composite_state(composite_state)
+        self._child.set_state(child_state)
+
+    def _new_composite_state(self) -> Any:
+        return None
+
+    def _get_composite_state(self) -> Any:
+        return None
+
+    def _set_composite_state(self, state: Any) -> None:
+        pass
+
     @property
     def child(self) -> FrameAnalyzer:
         return self._child
@@ -26,3 +215,66 @@ class CompositeFrameAnalyzer(FrameAnalyzer, ABC):
     @child.setter
     def child(self, child: FrameAnalyzer):
         self._child = child
+
+        if isinstance(child, CompositeFrameAnalyzer):
+            if child.executor is None:
+                child.executor = self._executor
+            if child.preprocessing_cache is None:
+                child.preprocessing_cache = self._preprocessing_cache
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Optional[Executor]):
+        # The executor is shared with the whole chain of composite analyzers
+        self._executor = executor
+
+        if isinstance(self._child, CompositeFrameAnalyzer):
+            self._child.executor = executor
+
+    @property
+    def preprocessing_cache(self) -> Optional[FramePreprocessingCache]:
+        return self._preprocessing_cache
+
+    @preprocessing_cache.setter
+    def preprocessing_cache(self, preprocessing_cache: Optional[FramePreprocessingCache]):
+        # The preprocessing cache is shared with the whole chain of composite analyzers, so that they can reuse the
+        # frames preprocessed by the others
+        self._preprocessing_cache = preprocessing_cache
+
+        if isinstance(self._child, CompositeFrameAnalyzer):
+            self._child.preprocessing_cache = preprocessing_cache
+
+
+class _ChildAnalysis(Generic[T]):
+    def __init__(self, executor: Executor, analysis: Callable[..., T], *args: Any):
+        self.__analysis: Callable[..., T] = analysis
+        self.__args: Tuple[Any, ...] = args
+        self.__future: Future = executor.submit(analysis, *args)
+        self.__result: Optional[T] = None
+        self.__finished: bool = False
+
+    def __enter__(self) -> _ChildAnalysis[T]:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # If the executor did not start the child analysis yet (e.g. all its workers are busy with the parents of a
+        # nested chain), it is run in this thread to prevent a deadlock
+        if self.__future.cancel():
+            if exc_type is None:
+                self.__result = self.__analysis(*self.__args)
+                self.__finished = True
+        else:
+            self.__future.exception()
+
+            if exc_type is None:
+                self.__result = self.__future.result()
+                self.__finished = True
+
+    def result(self) -> T:
+        if not self.__finished:
+            raise RuntimeError("The child analysis has not finished")
+
+        return cast(T, self.__result)
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Any, ContextManager, Iterable, List, Optional, Sequence, Tuple
 
 from numpy import ndarray
 
+from livia.process.analyzer.FrameDetections import FrameDetections
 from livia.process.analyzer.modification.FrameModification import FrameModification
 
 
@@ -9,3 +12,50 @@ class FrameAnalyzer(ABC):
     @abstractmethod
     def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
         pass
+
+    def analyze_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameModification]:
+        return [self.analyze(num_frame, frame) for num_frame, frame in frames]
+
+    def requires_writeable_frame(self) -> bool:
+        return False
+
+    # Processors analyze the frames they issue inside this context, so that analyzers can tell them apart from other
+    # frames with the same number or buffer (e.g. to share their preprocessed versions)
+    def analysis_context(self, frames: Iterable[ndarray]) -> ContextManager[None]:
+        return nullcontext()
+
+    # Analyzers that accept strided frames can analyze views of a region of a frame without copying them first
+    def accepts_strided_frames(self) -> bool:
+        return False
+
+    # Analyzers that keep information between frames (e.g. tracked objects) expose it as a state, so that the same
+    # analyzer can be shared by several streams. Stateless analyzers return None as their state
+    def new_state(self) -> Any:
+        return None
+
+    def get_state(self) -> Any:
+        return None
+
+    def set_state(self, state: Any) -> None:
+        pass
+
+    def analyze_batch_with_states(self, frames: Sequence[Tuple[int, ndarray]],
+                                  states: Sequence[Any]) -> Tuple[List[FrameModification], List[Any]]:
+        modifications = []
+        new_states = []
+        for (num_frame, frame), state in zip(frames, states):
+            self.set_state(state)
+            modifications.append(self.analyze(num_frame, frame))
+            new_states.append(self.get_state())
+
+        return modifications, new_states
+
+    # Analyzers whose modifications can be rebuilt from the objects they detect and their classifications describe
+    # them with the detections of each analyzer of the chain, so that they can be stored as plain data (e.g. in
+    # sidecar files). Analyzers that can not do it return None
+    def get_detections(self, modification: FrameModification) -> Optional[List[FrameDetections]]:
+        return None
+
+    def build_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                           detections: Sequence[FrameDetections]) -> FrameModification:
+        raise NotImplementedError()
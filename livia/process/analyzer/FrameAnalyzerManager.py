@@ -1,17 +1,20 @@
+import inspect
 import logging
 import os
 import pkgutil
 from importlib import import_module
 from logging import Logger
-from typing import List, Dict, Union, Type, Callable
+from typing import List, Dict, Union, Type, Callable, Tuple
 
 from livia import LIVIA_LOGGER
+from livia.livia_property import get_property_metadata, is_livia_property
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerMetadata
 
 
 class FrameAnalyzerManager:
     __analyzers: List[FrameAnalyzerMetadata] = []
+    __class_properties: Dict[type, List[Tuple[str, property]]] = {}
 
     @staticmethod
     def register_analyzer(frame_analyzer_metadata: FrameAnalyzerMetadata):
@@ -55,6 +58,55 @@ class FrameAnalyzerManager:
 
         return logging.getLogger(analyzer_metadata.id)
 
+    @staticmethod
+    def get_configuration(frame_analyzer: FrameAnalyzer) -> Tuple:
+        # This import must be done here to avoid cross import
+        from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
+        from livia.process.analyzer.MultiAreaFrameAnalyzer import MultiAreaFrameAnalyzer
+
+        analyzer_class = frame_analyzer.__class__
+
+        try:
+            analyzer_id = FrameAnalyzerManager.get_metadata_for(frame_analyzer).id
+        except ValueError:
+            analyzer_id = f"{analyzer_class.__module__}.{analyzer_class.__qualname__}"
+
+        # The id of the analyzer always comes first. Properties are read from the class, as analyzers that are not
+        # registered also have them
+        configuration = (
+            analyzer_id,
+            tuple(
+                (prop_id, repr(prop.fget(frame_analyzer)))
+                for prop_id, prop in FrameAnalyzerManager.__get_class_properties(analyzer_class)
+                if prop.fget is not None
+            )
+        )
+
+        if isinstance(frame_analyzer, CompositeFrameAnalyzer):
+            return configuration + (FrameAnalyzerManager.get_configuration(frame_analyzer.child),)
+        elif isinstance(frame_analyzer, MultiAreaFrameAnalyzer):
+            areas = tuple(
+                (name, area.x, area.y, area.width, area.height)
+                for name, area in frame_analyzer.areas_of_interest.items()
+            )
+
+            return configuration + (areas, FrameAnalyzerManager.get_configuration(frame_analyzer.frame_analyzer))
+        else:
+            return configuration
+
+    @staticmethod
+    def __get_class_properties(analyzer_class: type) -> List[Tuple[str, property]]:
+        properties = FrameAnalyzerManager.__class_properties.get(analyzer_class)
+
+        if properties is None:
+            properties = [
+                (get_property_metadata(prop).id, prop)
+                for _, prop in inspect.getmembers(analyzer_class, is_livia_property)
+            ]
+            FrameAnalyzerManager.__class_properties[analyzer_class] = properties
+
+        return properties
+
     @staticmethod
     def load_module(module):
         for module_loader, name, is_package in pkgutil.iter_modules([os.path.dirname(module.__file__)]):
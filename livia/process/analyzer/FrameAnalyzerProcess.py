@@ -0,0 +1,205 @@
+import os
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from typing import Optional, Any, Hashable, List, Sequence, Tuple
+
+from numpy import ndarray
+
+from livia.process.FrameProcessError import FrameProcessError
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.modification.FrameModificationSerializer import FrameModificationSerializer
+
+_SET_ANALYZER_COMMAND: int = 1
+_ANALYZE_COMMAND: int = 2
+
+_FRAME_ALIGNMENT: int = 64
+
+# Forking is not safe when the process is created from a multi-threaded process, such as a frame processor
+DEFAULT_START_METHOD: str = "spawn"
+
+
+def _run_frame_analyzer(connection: Connection, frame_analyzer: FrameAnalyzer):
+    # shared_memory is only available since Python 3.8
+    from multiprocessing.shared_memory import SharedMemory
+
+    memory: Optional[SharedMemory] = None
+
+    try:
+        while True:
+            message = connection.recv()
+
+            if message is None:
+                break
+
+            command, arguments = message
+
+            if command == _SET_ANALYZER_COMMAND:
+                frame_analyzer = arguments
+            elif command == _ANALYZE_COMMAND:
+                memory_name, frames_layout = arguments
+
+                if memory is None or memory.name != memory_name:
+                    if memory is not None:
+                        memory.close()
+                    memory = SharedMemory(name=memory_name)
+
+                frames = [
+                    (num_frame, ndarray(shape, dtype, buffer=memory.buf, offset=offset))
+                    for num_frame, offset, shape, dtype in frames_layout
+                ]
+                shared_frames = [frame for _, frame in frames]
+
+                try:
+                    with frame_analyzer.analysis_context(shared_frames):
+                        if len(frames) == 1:
+                            modifications = [frame_analyzer.analyze(*frames[0])]
+                        else:
+                            modifications = frame_analyzer.analyze_batch(frames)
+
+                    connection.send((True, FrameModificationSerializer.dumps(modifications, shared_frames)))
+                except Exception as error:
+                    connection.send((False, _make_picklable(error)))
+
+                del frames, shared_frames
+    except EOFError:
+        pass
+    finally:
+        if memory is not None:
+            try:
+                memory.close()
+            except BufferError:
+                # The analyzer may still hold views of the last frame
+                pass
+
+
+def _make_picklable(error: Exception) -> Exception:
+    import pickle
+
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return FrameProcessError(repr(error))
+
+
+def _align(size: int) -> int:
+    return (size + _FRAME_ALIGNMENT - 1) // _FRAME_ALIGNMENT * _FRAME_ALIGNMENT
+
+
+class FrameAnalyzerProcess:
+    def __init__(self,
+                 frame_analyzer: FrameAnalyzer,
+                 daemon: bool = True,
+                 start_method: Optional[str] = DEFAULT_START_METHOD):
+        self.__frame_analyzer: FrameAnalyzer = frame_analyzer
+        # The child process has its own copy of the analyzer, so it must be sent again when its properties change
+        self.__configuration: Hashable = FrameAnalyzerManager.get_configuration(frame_analyzer)
+        self.__daemon: bool = daemon
+        self.__context: Any = get_context(start_method)
+
+        self.__process: Optional[Any] = None
+        self.__connection: Optional[Connection] = None
+        self.__memory: Optional[Any] = None
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self.__frame_analyzer
+
+    @frame_analyzer.setter
+    def frame_analyzer(self, frame_analyzer: FrameAnalyzer):
+        configuration = FrameAnalyzerManager.get_configuration(frame_analyzer)
+
+        if self.__frame_analyzer != frame_analyzer or self.__configuration != configuration:
+            self.__frame_analyzer = frame_analyzer
+            self.__configuration = configuration
+
+            if self.__connection is not None:
+                self.__connection.send((_SET_ANALYZER_COMMAND, frame_analyzer))
+
+    def is_alive(self) -> bool:
+        return self.__process is not None and self.__process.is_alive()
+
+    def start(self):
+        if self.__process is not None:
+            raise FrameProcessError("Analyzer process is already running")
+
+        if os.name == "posix":
+            # The resource tracker must be shared with the child process, otherwise it would release the shared memory
+            # when the child process finishes
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+
+        connection, child_connection = self.__context.Pipe()
+
+        self.__process = self.__context.Process(target=_run_frame_analyzer,
+                                                args=(child_connection, self.__frame_analyzer),
+                                                daemon=self.__daemon,
+                                                name="Frame Analyzer Process")
+        self.__process.start()
+        self.__connection = connection
+
+        child_connection.close()
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        return self.analyze_batch([(num_frame, frame)])[0]
+
+    def analyze_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameModification]:
+        if self.__connection is None:
+            raise FrameProcessError("Analyzer process is not running")
+
+        memory = self.__reserve_memory(sum(_align(frame.nbytes) for _, frame in frames))
+
+        frames_layout = []
+        offset = 0
+        for num_frame, frame in frames:
+            ndarray(frame.shape, frame.dtype, buffer=memory.buf, offset=offset)[...] = frame
+            frames_layout.append((num_frame, offset, frame.shape, frame.dtype.str))
+            offset += _align(frame.nbytes)
+
+        self.__connection.send((_ANALYZE_COMMAND, (memory.name, frames_layout)))
+        successful, result = self.__connection.recv()
+
+        if successful:
+            return FrameModificationSerializer.loads(result, [frame for _, frame in frames])
+        else:
+            raise result
+
+    def close(self):
+        if self.__connection is not None:
+            try:
+                self.__connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+            self.__process.join()
+            self.__connection.close()
+
+            self.__process = None
+            self.__connection = None
+
+        if self.__memory is not None:
+            self.__memory.close()
+            self.__memory.unlink()
+            self.__memory = None
+
+    def __reserve_memory(self, size: int) -> Any:
+        # shared_memory is only available since Python 3.8
+        from multiprocessing.shared_memory import SharedMemory
+
+        if self.__memory is None or self.__memory.size < size:
+            if self.__memory is not None:
+                self.__memory.close()
+                self.__memory.unlink()
+
+            self.__memory = SharedMemory(create=True, size=size)
+
+        return self.__memory
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,18 @@
+from typing import Iterable, List, Optional
+
+from livia.process.analyzer.classification.Classification import Classification
+from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
+
+
+class FrameDetections:
+    def __init__(self, objects: Iterable[DetectedObject] = (), classification: Optional[Classification] = None):
+        self.__objects: List[DetectedObject] = list(objects)
+        self.__classification: Optional[Classification] = classification
+
+    @property
+    def objects(self) -> List[DetectedObject]:
+        return self.__objects.copy()
+
+    @property
+    def classification(self) -> Optional[Classification]:
+        return self.__classification
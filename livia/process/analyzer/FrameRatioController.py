@@ -0,0 +1,74 @@
+import math
+from collections import deque
+from threading import Lock
+from typing import Deque
+
+DEFAULT_MIN_FRAME_RATIO: int = 1
+DEFAULT_MAX_FRAME_RATIO: int = 30
+DEFAULT_HYSTERESIS: float = 0.2
+DEFAULT_NUM_SAMPLES: int = 10
+
+
+class FrameRatioController:
+    def __init__(self,
+                 min_frame_ratio: int = DEFAULT_MIN_FRAME_RATIO,
+                 max_frame_ratio: int = DEFAULT_MAX_FRAME_RATIO,
+                 hysteresis: float = DEFAULT_HYSTERESIS,
+                 num_samples: int = DEFAULT_NUM_SAMPLES):
+        if min_frame_ratio < 1:
+            raise ValueError("min_frame_ratio must be a positive number")
+        if max_frame_ratio < min_frame_ratio:
+            raise ValueError("max_frame_ratio must be greater than or equal to min_frame_ratio")
+        if hysteresis < 0:
+            raise ValueError("hysteresis must be a non negative float")
+        if num_samples < 1:
+            raise ValueError("num_samples must be a positive number")
+
+        self.__min_frame_ratio: int = min_frame_ratio
+        self.__max_frame_ratio: int = max_frame_ratio
+        self.__hysteresis: float = hysteresis
+        self.__num_samples: int = num_samples
+        self.__analysis_times: Deque[float] = deque(maxlen=num_samples)
+        self.__lock: Lock = Lock()
+
+    @property
+    def min_frame_ratio(self) -> int:
+        return self.__min_frame_ratio
+
+    @property
+    def max_frame_ratio(self) -> int:
+        return self.__max_frame_ratio
+
+    @property
+    def hysteresis(self) -> float:
+        return self.__hysteresis
+
+    @property
+    def num_samples(self) -> int:
+        return self.__num_samples
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__analysis_times.clear()
+
+    def update(self, frame_ratio: int, analysis_time: float, fps: float, parallelism: int = 1) -> int:
+        with self.__lock:
+            self.__analysis_times.append(analysis_time)
+
+            if fps is None or fps <= 0:
+                return self.__clamp(frame_ratio)
+
+            mean_analysis_time = sum(self.__analysis_times) / len(self.__analysis_times)
+
+            # Number of input frames that arrive while each analyzer is busy with one frame
+            required_ratio = mean_analysis_time * fps / max(parallelism, 1)
+
+            if required_ratio > frame_ratio:
+                # Falling behind is corrected at once
+                return self.__clamp(math.ceil(required_ratio))
+            else:
+                # The ratio is lowered only when the new one keeps up with a margin, to prevent oscillations
+                return self.__clamp(min(frame_ratio, math.ceil(required_ratio * (1 + self.__hysteresis))))
+
+    def __clamp(self, frame_ratio: int) -> int:
+        return max(self.__min_frame_ratio, min(self.__max_frame_ratio, frame_ratio))
@@ -0,0 +1,101 @@
+from enum import Enum
+from threading import Lock
+from typing import Dict, Tuple
+
+import cv2
+import numpy as np
+from numpy import ndarray
+
+from livia.process.analyzer.object_detection.ObjectLocation import ObjectLocation
+
+DEFAULT_PADDING_COLOR: Tuple[int, int, int] = (0, 0, 0)
+
+
+class ScalingMode(Enum):
+    STRETCH = 1
+    LETTERBOX = 2
+
+
+class FrameScaler:
+    def __init__(self,
+                 size: Tuple[int, int],
+                 mode: ScalingMode = ScalingMode.LETTERBOX,
+                 padding_color: Tuple[int, int, int] = DEFAULT_PADDING_COLOR):
+        if size[0] < 1 or size[1] < 1:
+            raise ValueError("size must contain positive numbers")
+
+        self.__size: Tuple[int, int] = size
+        self.__mode: ScalingMode = mode
+        self.__padding_color: Tuple[int, int, int] = padding_color
+
+        # Scale factors, offsets, scaled size and interpolation of each frame size, which are only calculated once
+        self.__geometries: Dict[Tuple[int, int], Tuple[float, float, int, int, Tuple[int, int], int]] = {}
+        self.__geometries_lock: Lock = Lock()
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.__size
+
+    @property
+    def mode(self) -> ScalingMode:
+        return self.__mode
+
+    @property
+    def padding_color(self) -> Tuple[int, int, int]:
+        return self.__padding_color
+
+    def scale(self, frame: ndarray) -> ndarray:
+        _, _, x_offset, y_offset, scaled_size, interpolation = self.__get_geometry((frame.shape[1], frame.shape[0]))
+
+        scaled_frame = cv2.resize(frame, scaled_size, interpolation=interpolation)
+
+        if self.__mode == ScalingMode.LETTERBOX and scaled_size != self.__size:
+            width, height = self.__size
+            padded_frame = np.empty((height, width) + frame.shape[2:], dtype=frame.dtype)
+            padded_frame[...] = self.__padding_color[:frame.shape[2]] if frame.ndim == 3 else self.__padding_color[0]
+            padded_frame[y_offset:y_offset + scaled_size[1], x_offset:x_offset + scaled_size[0]] = scaled_frame
+
+            return padded_frame
+        else:
+            return scaled_frame
+
+    def to_frame_location(self, location: ObjectLocation, frame_size: Tuple[int, int]) -> ObjectLocation:
+        x_scale, y_scale, x_offset, y_offset, _, _ = self.__get_geometry(frame_size)
+        width, height = frame_size
+
+        return ObjectLocation(
+            min(max((location.x0 - x_offset) / x_scale, 0), width),
+            min(max((location.y0 - y_offset) / y_scale, 0), height),
+            min(max((location.x1 - x_offset) / x_scale, 0), width),
+            min(max((location.y1 - y_offset) / y_scale, 0), height)
+        )
+
+    def __get_geometry(self, frame_size: Tuple[int, int]) -> Tuple[float, float, int, int, Tuple[int, int], int]:
+        with self.__geometries_lock:
+            geometry = self.__geometries.get(frame_size)
+
+            if geometry is None:
+                geometry = self.__calculate_geometry(frame_size)
+                self.__geometries[frame_size] = geometry
+
+            return geometry
+
+    def __calculate_geometry(self, frame_size: Tuple[int, int]) -> Tuple[float, float, int, int, Tuple[int, int], int]:
+        width, height = frame_size
+        target_width, target_height = self.__size
+
+        if self.__mode == ScalingMode.STRETCH:
+            x_scale = target_width / width
+            y_scale = target_height / height
+            scaled_size = self.__size
+            x_offset, y_offset = 0, 0
+        else:
+            # The aspect ratio is kept and the frame is centered, padding the rest
+            x_scale = y_scale = min(target_width / width, target_height / height)
+            scaled_size = (max(1, round(width * x_scale)), max(1, round(height * y_scale)))
+            x_offset = (target_width - scaled_size[0]) // 2
+            y_offset = (target_height - scaled_size[1]) // 2
+
+        interpolation = cv2.INTER_AREA if x_scale < 1 or y_scale < 1 else cv2.INTER_LINEAR
+
+        return x_scale, y_scale, x_offset, y_offset, scaled_size, interpolation
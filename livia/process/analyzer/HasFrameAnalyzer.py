@@ -0,0 +1,393 @@
+import time
+from threading import Lock
+from typing import Hashable, Optional, Tuple
+
+from numpy import ndarray, ascontiguousarray
+
+from livia.benchmarking.LatencyHistogram import LatencyHistogram
+from livia.buffer.FrameBufferPool import FrameBufferPool
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.process.FrameTimestamps import FrameTimestamps
+from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+from livia.process.analyzer.FrameRatioController import FrameRatioController
+from livia.process.analyzer.SceneChangeDetector import SceneChangeDetector
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
+from livia.process.analyzer.listener.FrameAnalyzerChangeEvent import FrameAnalyzerChangeEvent
+from livia.process.analyzer.listener.FrameAnalyzerChangeListener import FrameAnalyzerChangeListener
+from livia.process.analyzer.listener.FrameRatioChangeEvent import FrameRatioChangeEvent
+from livia.process.analyzer.listener.FrameRatioChangeListener import FrameRatioChangeListener
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.modification.NoFrameModification import NoFrameModification
+from livia.process.listener.EventListeners import EventListeners
+
+DEFAULT_FRAME_RATIO: int = 1
+
+
+# Analysis of the frames shared by the processors, whatever they are driven by. The processor owns the number and the
+# timestamps of the current frame, and gives access to its input
+class HasFrameAnalyzer:
+    _num_frame: Optional[int]
+    _frame_timestamps: Optional[FrameTimestamps]
+
+    def __init__(self,
+                 frame_analyzer: FrameAnalyzer,
+                 area_of_interest: Optional[AreaOfInterest] = None,
+                 frame_ratio: int = DEFAULT_FRAME_RATIO,
+                 frame_ratio_controller: Optional[FrameRatioController] = None,
+                 frame_buffer_pool: Optional[FrameBufferPool] = None,
+                 read_only_frames: bool = False,
+                 frame_modification_cache: Optional[FrameModificationCache] = None,
+                 scene_change_detector: Optional[SceneChangeDetector] = None):
+        if frame_ratio < 1:
+            raise ValueError("frame_ratio must be a positive number")
+
+        self.__current_modification: FrameModification = NoFrameModification()
+        self.__current_modification_timestamps: Optional[FrameTimestamps] = None
+        self._area_of_interest: Optional[AreaOfInterest] = area_of_interest
+        self._frame_ratio: int = frame_ratio
+        self._frame_ratio_controller: Optional[FrameRatioController] = frame_ratio_controller
+        self._frame_buffer_pool: Optional[FrameBufferPool] = frame_buffer_pool
+        self._read_only_frames: bool = read_only_frames
+        self._frame_modification_cache: Optional[FrameModificationCache] = frame_modification_cache
+        self._scene_change_detector: Optional[SceneChangeDetector] = scene_change_detector
+
+        # Frame number and analysis index from which the current frame ratio is applied. They are moved each time the
+        # frame ratio changes, so that the analysis indexes keep growing
+        self._frame_ratio_origin: Tuple[int, int] = (0, 0)
+        self._frame_ratio_lock: Lock = Lock()
+        self._frame_ratio_change_listeners: EventListeners[FrameRatioChangeListener] =\
+            EventListeners[FrameRatioChangeListener]()
+
+        self._analysis_latency: LatencyHistogram = LatencyHistogram()
+        self._modification_age: LatencyHistogram = LatencyHistogram()
+
+        self._frame_analyzer: FrameAnalyzer = frame_analyzer
+        # Analyzers with state (e.g. tracked objects) build modifications that depend on the previous frames
+        self._stateful_frame_analyzer: bool = frame_analyzer.new_state() is not None
+        self._frame_analyzer_change_listeners: EventListeners[FrameAnalyzerChangeListener] =\
+            EventListeners[FrameAnalyzerChangeListener]()
+
+    def _get_input_fps(self) -> float:
+        raise NotImplementedError()
+
+    # Modifications are only cached for the inputs that can be seeked, as the frames of other inputs are not repeated
+    def _get_seekable_input(self) -> Optional[SeekableFrameInput]:
+        raise NotImplementedError()
+
+    def _has_area_of_interest(self) -> bool:
+        return self._area_of_interest is not None
+
+    def _view_frame_to_analyze(self, frame: ndarray) -> ndarray:
+        area_of_interest = self._area_of_interest
+
+        return frame if area_of_interest is None else area_of_interest.view_from(frame)
+
+    def _extract_area_of_interest(self, frame: ndarray) -> Optional[ndarray]:
+        area_of_interest = self._area_of_interest
+
+        return None if area_of_interest is None else area_of_interest.extract_from(frame)
+
+    def _copy_frame(self, frame: ndarray) -> ndarray:
+        # Pooled frames are reused once they are released, so analyzers must not keep references to the frames they
+        # analyze (e.g. in their modifications). Modification caches do keep them, so frames are not pooled with them
+        if self._frame_buffer_pool is None or self._frame_modification_cache is not None:
+            return frame.copy()
+        else:
+            return self._frame_buffer_pool.copy(frame)
+
+    def _release_frame(self, frame: ndarray):
+        if self._frame_buffer_pool is not None and self._frame_buffer_pool.is_leased(frame):
+            self._frame_buffer_pool.release(frame)
+
+    def _clear_preprocessing_cache(self):
+        if isinstance(self._frame_analyzer, CompositeFrameAnalyzer) \
+                and self._frame_analyzer.preprocessing_cache is not None:
+            self._frame_analyzer.preprocessing_cache.clear()
+
+    def _clear_input_caches(self):
+        # Cached modifications are identified by their input, whose id may be reused by a new one
+        if self._frame_modification_cache is not None:
+            self._frame_modification_cache.clear()
+
+        self._clear_preprocessing_cache()
+
+    def _is_frame_modification_cacheable(self) -> bool:
+        return self._frame_modification_cache is not None \
+               and self._get_seekable_input() is not None \
+               and (self._frame_modification_cache.stores_snapshots() or not self._stateful_frame_analyzer)
+
+    def _frame_modification_configuration(self) -> Hashable:
+        area_of_interest = self._area_of_interest
+        area = None if area_of_interest is None else \
+            (area_of_interest.x, area_of_interest.y, area_of_interest.width, area_of_interest.height)
+
+        return FrameAnalyzerManager.get_configuration(self._frame_analyzer), area
+
+    def _get_cached_modification(self, num_frame: int, frame: ndarray) -> Optional[FrameModification]:
+        frame_modification_cache = self._frame_modification_cache
+        input = self._get_seekable_input()
+
+        if frame_modification_cache is not None and input is not None and self._is_frame_modification_cacheable():
+            return frame_modification_cache.get(
+                input, num_frame, self._frame_modification_configuration(), frame, self._frame_analyzer
+            )
+        else:
+            return None
+
+    def _cache_modification(self, num_frame: int, modification: FrameModification, frame: ndarray):
+        frame_modification_cache = self._frame_modification_cache
+        input = self._get_seekable_input()
+
+        if frame_modification_cache is not None and input is not None and self._is_frame_modification_cacheable():
+            frame_modification_cache.put(
+                input, num_frame, self._frame_modification_configuration(), modification, frame,
+                self._frame_analyzer
+            )
+
+    def _is_analysis_skipped(self, frame: ndarray) -> bool:
+        # When the scene does not change, the modification of the last analyzed frame is still valid
+        return self._scene_change_detector is not None and not self._scene_change_detector.has_changed(frame)
+
+    def _has_frame_ratio_controller(self) -> bool:
+        return self._frame_ratio_controller is not None
+
+    def _is_frame_to_analyze(self, num_frame: int) -> bool:
+        with self._frame_ratio_lock:
+            base_frame, _ = self._current_frame_ratio_origin(num_frame)
+
+            return (num_frame - base_frame) % self._frame_ratio == 0
+
+    def _analysis_frame_index(self, num_frame: int) -> int:
+        with self._frame_ratio_lock:
+            base_frame, base_index = self._current_frame_ratio_origin(num_frame)
+
+            return base_index + (num_frame - base_frame) // self._frame_ratio
+
+    def _analysis_frame_position(self, num_frame: int) -> float:
+        # Fractional analysis index, used to place the frames that are not analyzed between the analyzed ones
+        with self._frame_ratio_lock:
+            base_frame, base_index = self._current_frame_ratio_origin(num_frame)
+
+            return base_index + (num_frame - base_frame) / self._frame_ratio
+
+    def _current_frame_ratio_origin(self, num_frame: int) -> Tuple[int, int]:
+        if num_frame < self._frame_ratio_origin[0]:
+            # The input went backwards (e.g. it was restarted or seeked)
+            self._frame_ratio_origin = (0, 0)
+
+        return self._frame_ratio_origin
+
+    def _adjust_frame_ratio(self, analysis_time: float, parallelism: int = 1):
+        frame_ratio_controller = self._frame_ratio_controller
+
+        if frame_ratio_controller is not None:
+            self.frame_ratio = frame_ratio_controller.update(
+                self._frame_ratio, analysis_time, self._get_input_fps(), parallelism
+            )
+
+    def _stamp_modification(self, analyzed_timestamps: Optional[FrameTimestamps]):
+        timestamps = self._frame_timestamps
+
+        if timestamps is not None and analyzed_timestamps is not None:
+            timestamps.analysis_started = analyzed_timestamps.analysis_started
+            timestamps.analysis_finished = analyzed_timestamps.analysis_finished
+            timestamps.modification_captured = analyzed_timestamps.captured
+            timestamps.modification_applied = time.perf_counter()
+
+            if timestamps.modification_age is not None:
+                self._modification_age.add(timestamps.modification_age)
+
+    def _reset_analysis(self):
+        self._analysis_latency.reset()
+        self._modification_age.reset()
+
+        if self._frame_ratio_controller is not None:
+            self._frame_ratio_controller.reset()
+
+        if self._scene_change_detector is not None:
+            self._scene_change_detector.reset()
+
+        self._clear_preprocessing_cache()
+
+    # The analysis of a frame is split in steps, so that processors can run the analysis itself as they need (e.g. in
+    # an executor) between its preparation and the application of the current modification
+    def _prepare_analysis(self, num_frame: int, frame: ndarray, frame_aoi: Optional[ndarray]) -> Optional[ndarray]:
+        # Returns the frame to analyze, or None if the current modification is kept or replaced by a cached one
+        if not self._is_frame_to_analyze(num_frame):
+            return None
+
+        frame_to_analyze = frame if frame_aoi is None else frame_aoi
+
+        cached_modification = self._get_cached_modification(num_frame, frame_to_analyze)
+        if cached_modification is not None:
+            self.__current_modification = cached_modification
+            self.__current_modification_timestamps = None
+
+            return None
+
+        if self._is_analysis_skipped(frame_to_analyze):
+            return None
+
+        if self._read_only_frames and not self._frame_analyzer.requires_writeable_frame():
+            # The analysis ends before the frame is modified, so the analyzer can safely see the frame itself
+            frame_view = frame_to_analyze
+            if not frame_view.flags['C_CONTIGUOUS'] and not self._frame_analyzer.accepts_strided_frames():
+                frame_view = ascontiguousarray(frame_view)
+
+            frame_view = frame_view.view()
+            frame_view.flags.writeable = False
+
+            return frame_view
+        else:
+            return self._copy_frame(self._view_frame_to_analyze(frame))
+
+    def _run_analysis(self, frame_index: int, frame: ndarray) -> FrameModification:
+        frame_analyzer = self._frame_analyzer
+
+        with frame_analyzer.analysis_context([frame]):
+            return frame_analyzer.analyze(frame_index, frame)
+
+    def _finish_analysis(self, num_frame: int, frame: ndarray, modification: FrameModification,
+                         analysis_start: float, analysis_end: float):
+        self._cache_modification(num_frame, modification, frame)
+
+        self.__current_modification = modification
+        self.__current_modification_timestamps = self._frame_timestamps
+        if self._frame_timestamps is not None:
+            self._frame_timestamps.analysis_started = analysis_start
+            self._frame_timestamps.analysis_finished = analysis_end
+
+        self._analysis_latency.add(analysis_end - analysis_start)
+        self._adjust_frame_ratio(analysis_end - analysis_start)
+
+    def _apply_current_modification(self, frame_index: int, frame_position: float, frame: ndarray,
+                                    frame_aoi: Optional[ndarray]) -> ndarray:
+        modified_frame = self._modify_frame(self.__current_modification, frame_index, frame_position, frame, frame_aoi)
+
+        self._stamp_modification(self.__current_modification_timestamps)
+
+        return modified_frame
+
+    def _modify_frame(self, modification: FrameModification, frame_index: int, frame_position: float, frame: ndarray,
+                      frame_aoi: Optional[ndarray]) -> ndarray:
+        area_of_interest = self._area_of_interest
+
+        if area_of_interest is None or frame_aoi is None:
+            return modification.modify_at(frame_index, frame, frame_position)
+        else:
+            modified_frame_aoi = modification.modify_at(frame_index, frame_aoi, frame_position)
+
+            return area_of_interest.replace_on(frame, modified_frame_aoi)
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self._frame_analyzer
+
+    @frame_analyzer.setter
+    def frame_analyzer(self, frame_analyzer: FrameAnalyzer):
+        if self._frame_analyzer != frame_analyzer:
+            self._set_frame_analyzer(frame_analyzer)
+
+    def _set_frame_analyzer(self, frame_analyzer: FrameAnalyzer):
+        old_frame_analyzer = self._frame_analyzer
+        self._frame_analyzer = frame_analyzer
+        self._stateful_frame_analyzer = frame_analyzer.new_state() is not None
+
+        if self._frame_modification_cache is not None:
+            self._frame_modification_cache.clear()
+        if self._scene_change_detector is not None:
+            self._scene_change_detector.invalidate()
+
+        event = FrameAnalyzerChangeEvent(self, frame_analyzer, old_frame_analyzer)
+        self._frame_analyzer_change_listeners.notify(FrameAnalyzerChangeListener.analyzer_changed, event)
+
+    @property
+    def analysis_latency(self) -> LatencyHistogram:
+        return self._analysis_latency
+
+    @property
+    def modification_age(self) -> LatencyHistogram:
+        return self._modification_age
+
+    @property
+    def frame_ratio(self) -> int:
+        return self._frame_ratio
+
+    @frame_ratio.setter
+    def frame_ratio(self, frame_ratio: int):
+        if frame_ratio < 1:
+            raise ValueError("frame_ratio must be a positive number")
+
+        with self._frame_ratio_lock:
+            old_frame_ratio = self._frame_ratio
+            if old_frame_ratio == frame_ratio:
+                return
+
+            num_frame = self._num_frame
+            if num_frame is not None:
+                base_frame, base_index = self._current_frame_ratio_origin(num_frame)
+                # The new ratio starts with the next frame, which is always analyzed
+                next_index = base_index + (num_frame - base_frame) // old_frame_ratio + 1
+                self._frame_ratio_origin = (num_frame + 1, next_index)
+
+            self._frame_ratio = frame_ratio
+
+        event = FrameRatioChangeEvent(self, frame_ratio, old_frame_ratio)
+        self._frame_ratio_change_listeners.notify(FrameRatioChangeListener.frame_ratio_changed, event)
+
+    @property
+    def read_only_frames(self) -> bool:
+        return self._read_only_frames
+
+    @read_only_frames.setter
+    def read_only_frames(self, read_only_frames: bool):
+        self._read_only_frames = read_only_frames
+
+    @property
+    def frame_modification_cache(self) -> Optional[FrameModificationCache]:
+        return self._frame_modification_cache
+
+    @frame_modification_cache.setter
+    def frame_modification_cache(self, frame_modification_cache: Optional[FrameModificationCache]):
+        self._frame_modification_cache = frame_modification_cache
+
+    @property
+    def scene_change_detector(self) -> Optional[SceneChangeDetector]:
+        return self._scene_change_detector
+
+    @scene_change_detector.setter
+    def scene_change_detector(self, scene_change_detector: Optional[SceneChangeDetector]):
+        self._scene_change_detector = scene_change_detector
+
+    @property
+    def skipped_analyses(self) -> int:
+        return 0 if self._scene_change_detector is None else self._scene_change_detector.skipped
+
+    @property
+    def frame_ratio_controller(self) -> Optional[FrameRatioController]:
+        return self._frame_ratio_controller
+
+    @frame_ratio_controller.setter
+    def frame_ratio_controller(self, frame_ratio_controller: Optional[FrameRatioController]):
+        self._frame_ratio_controller = frame_ratio_controller
+
+    def add_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener):
+        self._frame_analyzer_change_listeners.append(listener)
+
+    def remove_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener):
+        self._frame_analyzer_change_listeners.remove(listener)
+
+    def has_frame_analyzer_change_listener(self, listener: FrameAnalyzerChangeListener) -> bool:
+        return listener in self._frame_analyzer_change_listeners
+
+    def add_frame_ratio_change_listener(self, listener: FrameRatioChangeListener):
+        self._frame_ratio_change_listeners.append(listener)
+
+    def remove_frame_ratio_change_listener(self, listener: FrameRatioChangeListener):
+        self._frame_ratio_change_listeners.remove(listener)
+
+    def has_frame_ratio_change_listener(self, listener: FrameRatioChangeListener) -> bool:
+        return listener in self._frame_ratio_change_listeners
@@ -0,0 +1,140 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from numpy import ndarray, ascontiguousarray
+
+from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.modification.MultiAreaFrameModification import MultiAreaFrameModification
+
+
+class MultiAreaFrameAnalyzer(FrameAnalyzer):
+    def __init__(self, frame_analyzer: FrameAnalyzer, areas_of_interest: Dict[str, AreaOfInterest]):
+        if len(areas_of_interest) == 0:
+            raise ValueError("areas_of_interest must not be empty")
+
+        self._frame_analyzer: FrameAnalyzer = frame_analyzer
+        self._areas_of_interest: Dict[str, AreaOfInterest] = dict(areas_of_interest)
+        # Each area is analyzed as an independent stream, so stateful analyzers keep a state for each area
+        self._area_states: Optional[Dict[str, Any]] = self.new_state()
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self._frame_analyzer
+
+    @property
+    def areas_of_interest(self) -> Dict[str, AreaOfInterest]:
+        return dict(self._areas_of_interest)
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        return self.analyze_batch([(num_frame, frame)])[0]
+
+    def analyze_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameModification]:
+        if self._area_states is None:
+            # The areas of all the frames are analyzed together
+            area_frames = [
+                (num_frame, self.__extract_area(area_of_interest, frame))
+                for num_frame, frame in frames
+                for area_of_interest in self._areas_of_interest.values()
+            ]
+            area_modifications, _ = self.__analyze_areas(area_frames, None)
+
+            num_areas = len(self._areas_of_interest)
+
+            return [
+                self.__build_modification(area_modifications[index:index + num_areas])
+                for index in range(0, len(area_modifications), num_areas)
+            ]
+        else:
+            # The state of each frame is the one left by the previous frame
+            modifications: List[FrameModification] = []
+            for frame in frames:
+                frame_modifications, new_states = self.analyze_batch_with_states([frame], [self._area_states])
+
+                modifications.extend(frame_modifications)
+                self._area_states = new_states[0]
+
+            return modifications
+
+    def analyze_batch_with_states(self, frames: Sequence[Tuple[int, ndarray]],
+                                  states: Sequence[Any]) -> Tuple[List[FrameModification], List[Any]]:
+        modifications: List[FrameModification] = []
+        new_states = []
+        for (num_frame, frame), frame_state in zip(frames, states):
+            if frame_state is None:
+                frame_state = self.new_state()
+
+            area_frames = [
+                (num_frame, self.__extract_area(area_of_interest, frame))
+                for area_of_interest in self._areas_of_interest.values()
+            ]
+
+            if frame_state is None:
+                area_modifications, _ = self.__analyze_areas(area_frames, None)
+            else:
+                area_modifications, area_states = self.__analyze_areas(
+                    area_frames, [frame_state[name] for name in self._areas_of_interest]
+                )
+                frame_state = dict(zip(self._areas_of_interest, area_states))
+
+            modifications.append(self.__build_modification(area_modifications))
+            new_states.append(frame_state)
+
+        return modifications, new_states
+
+    def requires_writeable_frame(self) -> bool:
+        return self._frame_analyzer.requires_writeable_frame()
+
+    def accepts_strided_frames(self) -> bool:
+        # Areas that the analyzer can not accept as views are copied before being analyzed
+        return True
+
+    def new_state(self) -> Any:
+        states = {name: self._frame_analyzer.new_state() for name in self._areas_of_interest}
+
+        return None if all(state is None for state in states.values()) else states
+
+    def get_state(self) -> Any:
+        return self._area_states
+
+    def set_state(self, state: Any) -> None:
+        self._area_states = state
+
+    def __extract_area(self, area_of_interest: AreaOfInterest, frame: ndarray) -> ndarray:
+        frame_aoi = area_of_interest.view_from(frame)
+
+        if frame_aoi.flags['C_CONTIGUOUS'] or self._frame_analyzer.accepts_strided_frames():
+            return frame_aoi
+        else:
+            return ascontiguousarray(frame_aoi)
+
+    def __analyze_areas(self, area_frames: List[Tuple[int, ndarray]],
+                        area_states: Optional[List[Any]]) -> Tuple[List[FrameModification], List[Any]]:
+        # Areas of different sizes can not be stacked in the same batch, so each size is analyzed as a batch
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for index, (_, area_frame) in enumerate(area_frames):
+            groups.setdefault(area_frame.shape, []).append(index)
+
+        modifications: List[Optional[FrameModification]] = [None] * len(area_frames)
+        new_states: List[Any] = [None] * len(area_frames)
+        for indices in groups.values():
+            group_frames = [area_frames[index] for index in indices]
+
+            if area_states is None:
+                group_modifications = self._frame_analyzer.analyze_batch(group_frames)
+                group_states: List[Any] = [None] * len(indices)
+            else:
+                group_modifications, group_states = self._frame_analyzer.analyze_batch_with_states(
+                    group_frames, [area_states[index] for index in indices]
+                )
+
+            for index, modification, state in zip(indices, group_modifications, group_states):
+                modifications[index] = modification
+                new_states[index] = state
+
+        return cast(List[FrameModification], modifications), new_states
+
+    def __build_modification(self, area_modifications: List[FrameModification]) -> MultiAreaFrameModification:
+        modifications = dict(zip(self._areas_of_interest, area_modifications))
+
+        return MultiAreaFrameModification(self._areas_of_interest, modifications)
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import time
+from logging import Logger
+from threading import Thread, Lock, Condition, Event
+from typing import Any, List, Optional, Sequence, Tuple
+
+from numpy import ndarray
+
+from livia import LIVIA_LOGGER
+from livia.input.FrameInput import FrameInput
+from livia.output.FrameOutput import FrameOutput
+from livia.process.FrameProcessError import FrameProcessError
+from livia.process.analyzer.AnalyzerFrameProcessor import AnalyzerFrameProcessor, DEFAULT_FRAME_RATIO
+from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.AsyncAnalyzerFrameProcessor import DEFAULT_BATCH_DELAY
+from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.modification.NoFrameModification import NoFrameModification
+from livia.process.listener import build_listener
+from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+
+
+class AnalysisRequest:
+    def __init__(self, stream: int, num_frame: int, frame: ndarray):
+        self.__stream: int = stream
+        self.__num_frame: int = num_frame
+        self.__frame: ndarray = frame
+        self.__modification: Optional[FrameModification] = None
+        self.__done: Event = Event()
+
+    @property
+    def stream(self) -> int:
+        return self.__stream
+
+    @property
+    def num_frame(self) -> int:
+        return self.__num_frame
+
+    @property
+    def frame(self) -> ndarray:
+        return self.__frame
+
+    def complete(self, modification: FrameModification):
+        self.__modification = modification
+        self.__done.set()
+
+    def wait(self) -> FrameModification:
+        self.__done.wait()
+
+        modification = self.__modification
+        if modification is None:
+            raise RuntimeError("The modification of a completed request should not be None")
+
+        return modification
+
+
+class StreamFrameAnalyzer(FrameAnalyzer):
+    def __init__(self, processor: MultiStreamAnalyzerFrameProcessor, stream: int):
+        self.__processor: MultiStreamAnalyzerFrameProcessor = processor
+        self.__stream: int = stream
+
+    @property
+    def stream(self) -> int:
+        return self.__stream
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        return self.__processor._request_analysis(self.__stream, num_frame, frame)
+
+    def requires_writeable_frame(self) -> bool:
+        return self.__processor.frame_analyzer.requires_writeable_frame()
+
+
+class MultiStreamAnalyzerFrameProcessor:
+    def __init__(self,
+                 streams: Sequence[Tuple[FrameInput, FrameOutput]],
+                 frame_analyzer: FrameAnalyzer,
+                 area_of_interest: Optional[AreaOfInterest] = None,
+                 frame_ratio: int = DEFAULT_FRAME_RATIO,
+                 daemon: bool = True,
+                 batch_delay: float = DEFAULT_BATCH_DELAY):
+        if len(streams) == 0:
+            raise ValueError("streams must not be empty")
+        if batch_delay < 0:
+            raise ValueError("batch_delay must be a non negative float")
+
+        self._frame_analyzer: FrameAnalyzer = frame_analyzer
+        self._daemon: bool = daemon
+        self._batch_delay: float = batch_delay
+
+        # Each stream is played by its own processor, which delegates the analysis of its frames to the shared analyzer
+        self._processors: List[AnalyzerFrameProcessor] = [
+            AnalyzerFrameProcessor(input, output, StreamFrameAnalyzer(self, stream), area_of_interest, frame_ratio,
+                                   daemon)
+            for stream, (input, output) in enumerate(streams)
+        ]
+        self._stream_states: List[Any] = [frame_analyzer.new_state() for _ in self._processors]
+
+        self._alive: bool = False
+        self._playing_streams: int = 0
+        self._pending_requests: List[AnalysisRequest] = []
+        self._analysis_thread: Optional[Thread] = None
+
+        self._frame_analyzer_lock: Lock = Lock()
+        self._requests_condition: Condition = Condition(lock=Lock())
+
+        finished_listener = build_listener(ProcessChangeListener, finished=lambda event: self._on_stream_finished())
+        for processor in self._processors:
+            processor.add_process_change_listener(finished_listener)
+
+    @property
+    def processors(self) -> List[AnalyzerFrameProcessor]:
+        return list(self._processors)
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self._frame_analyzer
+
+    @frame_analyzer.setter
+    def frame_analyzer(self, frame_analyzer: FrameAnalyzer):
+        with self._frame_analyzer_lock:
+            if self._frame_analyzer != frame_analyzer:
+                self._frame_analyzer = frame_analyzer
+                self._stream_states = [frame_analyzer.new_state() for _ in self._processors]
+
+    def is_alive(self) -> bool:
+        with self._requests_condition:
+            return self._alive
+
+    def start(self):
+        with self._requests_condition:
+            if self._alive:
+                raise FrameProcessError("Process is already running")
+
+            self._alive = True
+            self._playing_streams = len(self._processors)
+
+            with self._frame_analyzer_lock:
+                if isinstance(self._frame_analyzer, CompositeFrameAnalyzer) \
+                        and self._frame_analyzer.preprocessing_cache is not None:
+                    self._frame_analyzer.preprocessing_cache.clear()
+            self._analysis_thread = Thread(target=self._analyze_requests, daemon=self._daemon,
+                                           name="Multi-Stream Analyzer Thread")
+            self._analysis_thread.start()
+
+        for processor in self._processors:
+            processor.start()
+
+    def stop(self):
+        with self._requests_condition:
+            if not self._alive:
+                raise FrameProcessError("Process is not running")
+
+            self._alive = False
+            self._requests_condition.notify_all()
+
+        for processor in self._processors:
+            if processor.is_alive():
+                processor.stop()
+
+    def stop_and_wait(self):
+        analysis_thread = self._analysis_thread
+
+        self.stop()
+
+        for processor in self._processors:
+            processor.wait()
+        if analysis_thread is not None:
+            analysis_thread.join()
+
+    def close(self):
+        for processor in self._processors:
+            processor.close()
+
+    def _on_stream_finished(self):
+        with self._requests_condition:
+            self._playing_streams -= 1
+
+            if self._playing_streams == 0:
+                self._alive = False
+            self._requests_condition.notify_all()
+
+    def _request_analysis(self, stream: int, num_frame: int, frame: ndarray) -> FrameModification:
+        request = AnalysisRequest(stream, num_frame, frame)
+
+        with self._requests_condition:
+            if not self._alive:
+                return NoFrameModification()
+
+            self._pending_requests.append(request)
+            self._requests_condition.notify_all()
+
+        return request.wait()
+
+    def _wait_for_requests(self) -> List[AnalysisRequest]:
+        while not self._pending_requests and self._alive:
+            self._requests_condition.wait()
+
+        if self._batch_delay > 0:
+            # A frame from each of the streams that are still playing is waited for, at most, batch_delay seconds
+            end_time = time.perf_counter() + self._batch_delay
+
+            while self._alive and len(self._pending_requests) < self._playing_streams:
+                remaining_time = end_time - time.perf_counter()
+                if remaining_time <= 0:
+                    break
+
+                self._requests_condition.wait(remaining_time)
+
+        requests = self._pending_requests
+        self._pending_requests = []
+
+        return requests
+
+    def _analyze_requests(self):
+        while True:
+            with self._requests_condition:
+                requests = self._wait_for_requests()
+                alive = self._alive
+
+            if not alive:
+                for request in requests:
+                    request.complete(NoFrameModification())
+                break
+            elif not requests:
+                continue
+
+            try:
+                modifications = self._analyze_batch(requests)
+            except Exception:
+                # Failing the requests would stop the streams without finishing them, so their frames are not modified
+                self._get_logger_for(self._frame_analyzer).exception("Error analyzing frames")
+
+                for request in requests:
+                    request.complete(NoFrameModification())
+            else:
+                for request, modification in zip(requests, modifications):
+                    request.complete(modification)
+
+        self._analysis_thread = None
+
+    def _analyze_batch(self, requests: List[AnalysisRequest]) -> List[FrameModification]:
+        frames = [(request.num_frame, request.frame) for request in requests]
+
+        with self._frame_analyzer_lock:
+            frame_analyzer = self._frame_analyzer
+
+            if all(state is None for state in self._stream_states):
+                with frame_analyzer.analysis_context([request.frame for request in requests]):
+                    if len(frames) == 1:
+                        return [frame_analyzer.analyze(*frames[0])]
+                    else:
+                        return frame_analyzer.analyze_batch(frames)
+            else:
+                # Each frame is analyzed with the state of its stream, so streams do not interfere with each other
+                states = [self._stream_states[request.stream] for request in requests]
+
+                with frame_analyzer.analysis_context([request.frame for request in requests]):
+                    modifications, new_states = frame_analyzer.analyze_batch_with_states(frames, states)
+
+                for request, new_state in zip(requests, new_states):
+                    self._stream_states[request.stream] = new_state
+
+                return modifications
+
+    @staticmethod
+    def _get_logger_for(frame_analyzer: FrameAnalyzer) -> Logger:
+        try:
+            return FrameAnalyzerManager.get_logger_for(frame_analyzer)
+        except ValueError:
+            return LIVIA_LOGGER
@@ -1,6 +1,9 @@
+from typing import List, Optional, Sequence
+
 from numpy import ndarray
 
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameDetections import FrameDetections
 from livia.process.analyzer.FrameAnalyzerMetadata import frame_analyzer
 from livia.process.analyzer.modification.FrameModification import FrameModification
 from livia.process.analyzer.modification.NoFrameModification import NoFrameModification
@@ -18,3 +21,13 @@ class NoChangeFrameAnalyzer(FrameAnalyzer):
 
     def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
         return NoFrameModification()
+
+    def accepts_strided_frames(self) -> bool:
+        return True
+
+    def get_detections(self, modification: FrameModification) -> Optional[List[FrameDetections]]:
+        return [] if isinstance(modification, NoFrameModification) else None
+
+    def build_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                           detections: Sequence[FrameDetections]) -> FrameModification:
+        return NoFrameModification()
@@ -0,0 +1,102 @@
+from threading import Lock
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from numpy import ndarray
+
+DEFAULT_CHANGE_THRESHOLD: float = 0.02
+DEFAULT_FINGERPRINT_SIZE: Tuple[int, int] = (16, 16)
+
+
+class SceneChangeDetector:
+    def __init__(self,
+                 threshold: float = DEFAULT_CHANGE_THRESHOLD,
+                 fingerprint_size: Tuple[int, int] = DEFAULT_FINGERPRINT_SIZE,
+                 max_skipped_frames: Optional[int] = None):
+        if threshold < 0:
+            raise ValueError("threshold must be a non negative float")
+        if fingerprint_size[0] < 1 or fingerprint_size[1] < 1:
+            raise ValueError("fingerprint_size must contain positive numbers")
+        if max_skipped_frames is not None and max_skipped_frames < 0:
+            raise ValueError("max_skipped_frames must be None or a non negative number")
+
+        self.__threshold: float = threshold
+        self.__fingerprint_size: Tuple[int, int] = fingerprint_size
+        self.__max_skipped_frames: Optional[int] = max_skipped_frames
+
+        # Fingerprint of the last frame considered as changed, which is the last analyzed frame
+        self.__reference: Optional[ndarray] = None
+        self.__consecutive_skipped: int = 0
+        self.__skipped: int = 0
+        self.__lock: Lock = Lock()
+
+    @property
+    def threshold(self) -> float:
+        return self.__threshold
+
+    @threshold.setter
+    def threshold(self, threshold: float):
+        if threshold < 0:
+            raise ValueError("threshold must be a non negative float")
+
+        self.__threshold = threshold
+
+    @property
+    def fingerprint_size(self) -> Tuple[int, int]:
+        return self.__fingerprint_size
+
+    @property
+    def max_skipped_frames(self) -> Optional[int]:
+        return self.__max_skipped_frames
+
+    @property
+    def skipped(self) -> int:
+        with self.__lock:
+            return self.__skipped
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__reference = None
+            self.__consecutive_skipped = 0
+            self.__skipped = 0
+
+    def invalidate(self) -> None:
+        # The next frame is considered as changed, but the skipped frames count is kept
+        with self.__lock:
+            self.__reference = None
+            self.__consecutive_skipped = 0
+
+    def fingerprint(self, frame: ndarray) -> ndarray:
+        # Area interpolation averages the pixels, so the fingerprint is robust to sensor noise
+        fingerprint = cv2.resize(frame, self.__fingerprint_size, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+        return fingerprint.mean(axis=2) if fingerprint.ndim == 3 else fingerprint
+
+    def difference(self, fingerprint: ndarray) -> Optional[float]:
+        with self.__lock:
+            reference = self.__reference
+
+        if reference is None or reference.shape != fingerprint.shape:
+            return None
+        else:
+            return float(np.abs(fingerprint - reference).mean()) / 255
+
+    def has_changed(self, frame: ndarray) -> bool:
+        fingerprint = self.fingerprint(frame)
+        difference = self.difference(fingerprint)
+
+        with self.__lock:
+            changed = difference is None \
+                      or difference >= self.__threshold \
+                      or (self.__max_skipped_frames is not None
+                          and self.__consecutive_skipped >= self.__max_skipped_frames)
+
+            if changed:
+                self.__reference = fingerprint
+                self.__consecutive_skipped = 0
+            else:
+                self.__consecutive_skipped += 1
+                self.__skipped += 1
+
+            return changed
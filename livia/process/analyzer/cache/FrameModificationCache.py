@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Hashable, Optional
+
+from numpy import ndarray
+
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class FrameModificationCache(ABC):
+    # The analyzer and the analyzed frame are received so that caches that store the modifications elsewhere can store
+    # them as data and rebuild them with the analyzer and the frame that is being analyzed when they are read
+    @abstractmethod
+    def get(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            frame: ndarray, frame_analyzer: FrameAnalyzer) -> Optional[FrameModification]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def put(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            modification: FrameModification, frame: ndarray, frame_analyzer: FrameAnalyzer) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+    # Caches that store a snapshot of the modifications can also be used with analyzers that keep a state between
+    # frames, whose modifications may change after they are built
+    def stores_snapshots(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,85 @@
+from threading import Lock
+from typing import Hashable, Optional, OrderedDict, Tuple
+
+from numpy import ndarray
+
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+DEFAULT_CACHE_CAPACITY: int = 1024
+
+
+class LRUFrameModificationCache(FrameModificationCache):
+    def __init__(self, capacity: int = DEFAULT_CACHE_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number")
+
+        self.__capacity: int = capacity
+        self.__modifications: OrderedDict[Tuple[int, int], FrameModification] = OrderedDict()
+        # Modifications built with any other configuration (analyzer, property values, area of interest...) are no
+        # longer valid, so only the modifications of the latest configuration are kept
+        self.__configuration: Optional[Hashable] = None
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+        self.__lock: Lock = Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def hits(self) -> int:
+        with self.__lock:
+            return self.__hits
+
+    @property
+    def misses(self) -> int:
+        with self.__lock:
+            return self.__misses
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__modifications)
+
+    def get(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            frame: ndarray, frame_analyzer: FrameAnalyzer) -> Optional[FrameModification]:
+        key = (id(input), num_frame)
+
+        with self.__lock:
+            self.__check_configuration(configuration)
+
+            modification = self.__modifications.get(key)
+
+            if modification is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__modifications.move_to_end(key)
+
+            return modification
+
+    def put(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            modification: FrameModification, frame: ndarray, frame_analyzer: FrameAnalyzer) -> None:
+        key = (id(input), num_frame)
+
+        with self.__lock:
+            self.__check_configuration(configuration)
+
+            self.__modifications[key] = modification
+            self.__modifications.move_to_end(key)
+
+            if len(self.__modifications) > self.__capacity:
+                self.__modifications.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__modifications.clear()
+            self.__configuration = None
+
+    def __check_configuration(self, configuration: Hashable):
+        if self.__configuration != configuration:
+            self.__modifications.clear()
+            self.__configuration = configuration
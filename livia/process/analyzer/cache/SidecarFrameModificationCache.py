@@ -0,0 +1,282 @@
+import hashlib
+import json
+import math
+import os
+import struct
+from threading import Lock
+from typing import BinaryIO, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from livia import LIVIA_LOGGER
+from livia.input.FileFrameInput import FileFrameInput
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameDetections import FrameDetections
+from livia.process.analyzer.cache.FrameModificationCache import FrameModificationCache
+from livia.process.analyzer.classification.Classification import Classification
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
+from livia.process.analyzer.object_detection.ObjectLocation import ObjectLocation
+
+SIDECAR_EXTENSION: str = ".livia"
+
+_SIDECAR_MAGIC: bytes = b"LIVIASC2"
+# Each record is made of the number of the frame and the size of its detections, followed by them
+_RECORD_HEADER: struct.Struct = struct.Struct("<qI")
+# The detections of a frame are made of the number of analyzers in the chain and, for each analyzer, the number of
+# objects and whether there is a classification, followed by the boxes and scores of the objects, their class names
+# and the classification, if any. Missing scores are stored as NaN and missing names with the maximum length
+_COUNT: struct.Struct = struct.Struct("<H")
+_DETECTIONS_HEADER: struct.Struct = struct.Struct("<I?")
+_SCORE: struct.Struct = struct.Struct("<d")
+_NO_NAME: int = 0xFFFF
+_DTYPE: np.dtype = np.dtype("<f8")
+
+
+class SidecarFrameModificationCache(FrameModificationCache):
+    def __init__(self, directory: Optional[str] = None):
+        self.__directory: Optional[str] = directory
+
+        self.__sidecar_path: Optional[str] = None
+        self.__sidecar_file: Optional[BinaryIO] = None
+        # Offset and size of the modification of each frame in the sidecar file
+        self.__records: Dict[int, Tuple[int, int]] = {}
+
+        self.__lock: Lock = Lock()
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self.__directory
+
+    @property
+    def sidecar_path(self) -> Optional[str]:
+        with self.__lock:
+            return self.__sidecar_path
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__records)
+
+    def get_sidecar_path(self, input: FileFrameInput, configuration: Hashable) -> str:
+        # Sidecars are named after the analyzer id and a hash of the rest of its configuration, which is serialized in
+        # a canonical form so that the same configuration is always stored in the same sidecar
+        canonical_configuration = json.dumps(configuration, sort_keys=True, default=str)
+        configuration_hash = hashlib.sha1(canonical_configuration.encode("utf-8")).hexdigest()[:16]
+        analyzer_id = configuration[0][0] if isinstance(configuration, tuple) and isinstance(configuration[0], tuple) \
+            else "analysis"
+
+        directory, video_name = os.path.split(os.path.abspath(input.path))
+        if self.__directory is not None:
+            directory = self.__directory
+
+        return os.path.join(directory, f"{video_name}.{analyzer_id}.{configuration_hash}{SIDECAR_EXTENSION}")
+
+    def stores_snapshots(self) -> bool:
+        return True
+
+    def get(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            frame: ndarray, frame_analyzer: FrameAnalyzer) -> Optional[FrameModification]:
+        # Only the detections are stored, not the state of the analyzer, so analyzers that keep a state between frames
+        # would not update it with the frames read from the sidecar
+        if not isinstance(input, FileFrameInput) or frame_analyzer.new_state() is not None:
+            return None
+
+        with self.__lock:
+            sidecar_file = self.__open_sidecar(self.get_sidecar_path(input, configuration))
+
+            record = self.__records.get(num_frame)
+            if record is None:
+                return None
+
+            offset, size = record
+            sidecar_file.seek(offset)
+            data = sidecar_file.read(size)
+
+        try:
+            detections = SidecarFrameModificationCache.__loads_detections(data)
+        except (struct.error, ValueError, UnicodeDecodeError) as error:
+            LIVIA_LOGGER.warning(f"Detections of frame {num_frame} could not be read from the sidecar: {error}")
+            return None
+
+        return frame_analyzer.build_modification_from_detections(num_frame, frame, detections)
+
+    def put(self, input: SeekableFrameInput, num_frame: int, configuration: Hashable,
+            modification: FrameModification, frame: ndarray, frame_analyzer: FrameAnalyzer) -> None:
+        if not isinstance(input, FileFrameInput) or frame_analyzer.new_state() is not None:
+            return
+
+        # Only the modifications that the analyzer can rebuild from its detections are stored
+        detections = frame_analyzer.get_detections(modification)
+        if detections is None:
+            return
+
+        try:
+            data = SidecarFrameModificationCache.__dumps_detections(detections)
+        except (struct.error, ValueError) as error:
+            LIVIA_LOGGER.warning(f"Detections of frame {num_frame} could not be stored in the sidecar: {error}")
+            return
+
+        with self.__lock:
+            sidecar_file = self.__open_sidecar(self.get_sidecar_path(input, configuration))
+
+            if num_frame in self.__records:
+                return
+
+            sidecar_file.seek(0, os.SEEK_END)
+            sidecar_file.write(_RECORD_HEADER.pack(num_frame, len(data)))
+            offset = sidecar_file.tell()
+            sidecar_file.write(data)
+            sidecar_file.flush()
+
+            self.__records[num_frame] = (offset, len(data))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__close_sidecar()
+
+    def close(self) -> None:
+        self.clear()
+
+    def __open_sidecar(self, sidecar_path: str) -> BinaryIO:
+        if self.__sidecar_path == sidecar_path and self.__sidecar_file is not None:
+            return self.__sidecar_file
+
+        self.__close_sidecar()
+
+        sidecar_file = open(sidecar_path, "r+b") if os.path.exists(sidecar_path) else None
+
+        if sidecar_file is not None and sidecar_file.read(len(_SIDECAR_MAGIC)) != _SIDECAR_MAGIC:
+            # Sidecars of other versions (or other files with the same name) are replaced
+            LIVIA_LOGGER.warning(f"{sidecar_path} is not a valid sidecar file, it will be replaced")
+            sidecar_file.close()
+            sidecar_file = None
+
+        if sidecar_file is not None:
+            self.__records = self.__read_records(sidecar_file)
+        else:
+            sidecar_file = open(sidecar_path, "w+b")
+            sidecar_file.write(_SIDECAR_MAGIC)
+            sidecar_file.flush()
+
+            self.__records = {}
+
+        self.__sidecar_path = sidecar_path
+        self.__sidecar_file = sidecar_file
+
+        return sidecar_file
+
+    @staticmethod
+    def __read_records(sidecar_file: BinaryIO) -> Dict[int, Tuple[int, int]]:
+        records = {}
+        end = sidecar_file.seek(0, os.SEEK_END)
+
+        position = sidecar_file.seek(len(_SIDECAR_MAGIC))
+        while position + _RECORD_HEADER.size <= end:
+            num_frame, size = _RECORD_HEADER.unpack(sidecar_file.read(_RECORD_HEADER.size))
+            offset = position + _RECORD_HEADER.size
+
+            if offset + size > end:
+                break
+
+            records[num_frame] = (offset, size)
+            position = sidecar_file.seek(offset + size)
+
+        if position < end:
+            # The last record was not completely written (e.g. the process was killed), so it is discarded
+            sidecar_file.truncate(position)
+
+        return records
+
+    def __close_sidecar(self):
+        if self.__sidecar_file is not None:
+            self.__sidecar_file.close()
+
+        self.__sidecar_path = None
+        self.__sidecar_file = None
+        self.__records = {}
+
+    @staticmethod
+    def __dumps_detections(detections: Sequence[FrameDetections]) -> bytes:
+        data = [_COUNT.pack(len(detections))]
+
+        for analyzer_detections in detections:
+            objects = analyzer_detections.objects
+            classification = analyzer_detections.classification
+
+            data.append(_DETECTIONS_HEADER.pack(len(objects), classification is not None))
+            data.append(np.array([obj.location.coords for obj in objects], dtype=_DTYPE).reshape(-1, 4).tobytes())
+            data.append(np.array(
+                [math.nan if obj.score is None else obj.score for obj in objects], dtype=_DTYPE
+            ).tobytes())
+
+            for obj in objects:
+                data.append(SidecarFrameModificationCache.__dumps_name(obj.class_name))
+
+            if classification is not None:
+                data.append(SidecarFrameModificationCache.__dumps_name(classification.class_name))
+                data.append(_SCORE.pack(math.nan if classification.score is None else classification.score))
+
+        return b"".join(data)
+
+    @staticmethod
+    def __loads_detections(data: bytes) -> List[FrameDetections]:
+        detections = []
+
+        num_detections, = _COUNT.unpack_from(data, 0)
+        offset = _COUNT.size
+
+        for _ in range(num_detections):
+            num_objects, has_classification = _DETECTIONS_HEADER.unpack_from(data, offset)
+            offset += _DETECTIONS_HEADER.size
+
+            boxes = np.frombuffer(data, dtype=_DTYPE, count=num_objects * 4, offset=offset).reshape(-1, 4)
+            offset += boxes.nbytes
+            scores = np.frombuffer(data, dtype=_DTYPE, count=num_objects, offset=offset)
+            offset += scores.nbytes
+
+            objects = []
+            for box, score in zip(boxes.tolist(), scores.tolist()):
+                class_name, offset = SidecarFrameModificationCache.__loads_name(data, offset)
+                objects.append(DetectedObject(ObjectLocation(*box), class_name, None if math.isnan(score) else score))
+
+            if has_classification:
+                class_name, offset = SidecarFrameModificationCache.__loads_name(data, offset)
+                score, = _SCORE.unpack_from(data, offset)
+                offset += _SCORE.size
+
+                if class_name is None:
+                    raise ValueError("classifications must have a class name")
+
+                classification = Classification(class_name, None if math.isnan(score) else score)
+            else:
+                classification = None
+
+            detections.append(FrameDetections(objects, classification))
+
+        return detections
+
+    @staticmethod
+    def __dumps_name(name: Optional[str]) -> bytes:
+        if name is None:
+            return _COUNT.pack(_NO_NAME)
+
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) >= _NO_NAME:
+            raise ValueError(f"name is too long: {name[:20]}...")
+
+        return _COUNT.pack(len(encoded_name)) + encoded_name
+
+    @staticmethod
+    def __loads_name(data: bytes, offset: int) -> Tuple[Optional[str], int]:
+        length, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+
+        if length == _NO_NAME:
+            return None, offset
+
+        if offset + length > len(data):
+            raise ValueError("name exceeds the record")
+
+        return data[offset:offset + length].decode("utf-8"), offset + length
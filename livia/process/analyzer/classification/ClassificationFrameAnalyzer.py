@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Tuple
+from typing import Tuple, List, Optional, Sequence
 
 from numpy import ndarray
 
@@ -7,9 +7,12 @@ from livia.benchmarking.TimeLogger import TimeLogger
 from livia.livia_property import livia_property
 from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameDetections import FrameDetections
 from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
-from livia.process.analyzer.classification import ClassificationFrameModification, DEFAULT_TEXT_COLOR
+from livia.process.analyzer.classification import DEFAULT_TEXT_COLOR
 from livia.process.analyzer.classification.Classification import Classification
+from livia.process.analyzer.classification.ClassificationFrameModification import ClassificationFrameModification
+from livia.process.analyzer.modification.CompositeFrameModification import CompositeFrameModification
 from livia.process.analyzer.modification.FrameModification import FrameModification
 
 
@@ -26,7 +29,7 @@ class ClassificationFrameAnalyzer(CompositeFrameAnalyzer):
     def info_color(self) -> Tuple[int, int, int]:
         return self._info_color
 
-    @info_color.setter
+    @info_color.setter  # type: ignore
     def info_color(self, info_color: Tuple[int, int, int]):
         self._info_color = info_color
 
@@ -37,10 +40,41 @@ class ClassificationFrameAnalyzer(CompositeFrameAnalyzer):
 
         return self._create_modification(classify, child_modification)
 
+    def _composite_analyze_batch(self, frames: Sequence[Tuple[int, ndarray]],
+                                 child_modifications: List[FrameModification]) -> List[FrameModification]:
+        with self._tl_classification:
+            classifications = self._classify_batch(frames)
+
+        return [
+            self._create_modification(classification, child_modification)
+            for classification, child_modification in zip(classifications, child_modifications)
+        ]
+
     @abstractmethod
     def _classify(self, num_frame, frame: ndarray) -> Classification:
         raise NotImplementedError()
 
+    def _classify_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[Classification]:
+        return [self._classify(num_frame, frame) for num_frame, frame in frames]
+
+    def depends_on_child_modification(self) -> bool:
+        # The modification of the child is only wrapped, so it can be analyzed in parallel
+        return False
+
     def _create_modification(self, classification: Classification,
                              child_modification: FrameModification) -> ClassificationFrameModification:
         return ClassificationFrameModification(classification, self._info_color, child_modification)
+
+    def _get_composite_detections(self, modification: CompositeFrameModification) -> Optional[FrameDetections]:
+        if isinstance(modification, ClassificationFrameModification):
+            return FrameDetections(classification=modification.classification)
+        else:
+            return None
+
+    def _build_composite_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                                      detections: FrameDetections,
+                                                      child_modification: FrameModification) -> FrameModification:
+        if detections.classification is None:
+            raise ValueError("detections must contain a classification")
+
+        return self._create_modification(detections.classification, child_modification)
@@ -5,17 +5,17 @@ from typing import TYPE_CHECKING
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 
 if TYPE_CHECKING:
-    from livia.process.analyzer.AnalyzerFrameProcessor import AnalyzerFrameProcessor
+    from livia.process.analyzer.HasFrameAnalyzer import HasFrameAnalyzer
 
 
 class FrameAnalyzerChangeEvent:
-    def __init__(self, processor: AnalyzerFrameProcessor, new: FrameAnalyzer, old: FrameAnalyzer):
-        self.__processor: AnalyzerFrameProcessor = processor
+    def __init__(self, processor: HasFrameAnalyzer, new: FrameAnalyzer, old: FrameAnalyzer):
+        self.__processor: HasFrameAnalyzer = processor
         self.__new: FrameAnalyzer = new
         self.__old: FrameAnalyzer = old
 
     @property
-    def processor(self) -> AnalyzerFrameProcessor:
+    def processor(self) -> HasFrameAnalyzer:
         return self.__processor
 
     @property
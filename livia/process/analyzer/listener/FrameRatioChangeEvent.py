@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from livia.process.analyzer.HasFrameAnalyzer import HasFrameAnalyzer
+
+
+class FrameRatioChangeEvent:
+    def __init__(self, processor: HasFrameAnalyzer, new: int, old: int):
+        self.__processor: HasFrameAnalyzer = processor
+        self.__new: int = new
+        self.__old: int = old
+
+    @property
+    def processor(self) -> HasFrameAnalyzer:
+        return self.__processor
+
+    @property
+    def new(self) -> int:
+        return self.__new
+
+    @property
+    def old(self) -> int:
+        return self.__old
@@ -0,0 +1,7 @@
+from livia.process.analyzer.listener.FrameRatioChangeEvent import FrameRatioChangeEvent
+from livia.process.listener import EventListener
+
+
+class FrameRatioChangeListener(EventListener):
+    def frame_ratio_changed(self, event: FrameRatioChangeEvent) -> None:
+        pass
@@ -10,9 +10,20 @@ class CompositeFrameModification(FrameModification):
     def __init__(self, child: FrameModification = NoFrameModification()):
         self._child = child
 
+    @property
+    def child(self) -> FrameModification:
+        return self._child
+
     def modify(self, num_frame: int, frame: ndarray) -> ndarray:
         return self._composite_modify(num_frame, self._child.modify(num_frame, frame))
 
+    def modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        return self._composite_modify_at(num_frame, self._child.modify_at(num_frame, frame, frame_position),
+                                         frame_position)
+
     @abstractmethod
     def _composite_modify(self, num_frame: int, frame: ndarray) -> ndarray:
         raise NotImplementedError()
+
+    def _composite_modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        return self._composite_modify(num_frame, frame)
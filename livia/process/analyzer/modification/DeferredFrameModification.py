@@ -0,0 +1,29 @@
+from typing import Optional
+
+from numpy import ndarray
+
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class DeferredFrameModification(FrameModification):
+    def __init__(self):
+        self.__modification: Optional[FrameModification] = None
+
+    @property
+    def modification(self) -> FrameModification:
+        if self.__modification is None:
+            raise RuntimeError("modification is not resolved yet")
+
+        return self.__modification
+
+    def is_resolved(self) -> bool:
+        return self.__modification is not None
+
+    def resolve(self, modification: FrameModification):
+        self.__modification = modification
+
+    def modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        return self.modification.modify(num_frame, frame)
+
+    def modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        return self.modification.modify_at(num_frame, frame, frame_position)
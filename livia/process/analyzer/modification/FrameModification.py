@@ -7,3 +7,6 @@ class FrameModification(ABC):
     @abstractmethod
     def modify(self, num_frame: int, frame: ndarray) -> ndarray:
         raise NotImplementedError()
+
+    def modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        return self.modify(num_frame, frame)
@@ -0,0 +1,44 @@
+import io
+import pickle
+from typing import Any, Optional, Sequence, Dict
+
+from numpy import ndarray
+
+
+class _FramePickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, frames: Sequence[ndarray]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.__frame_indexes: Dict[int, int] = {id(frame): index for index, frame in enumerate(frames)}
+        self.__frames: Sequence[ndarray] = frames
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        index = self.__frame_indexes.get(id(obj))
+
+        return index if index is not None and self.__frames[index] is obj else None
+
+
+class _FrameUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, frames: Sequence[ndarray]):
+        super().__init__(file)
+        self.__frames: Sequence[ndarray] = frames
+
+    def persistent_load(self, pid: Any) -> Any:
+        if isinstance(pid, int) and 0 <= pid < len(self.__frames):
+            return self.__frames[pid]
+        else:
+            raise pickle.UnpicklingError(f"Unsupported persistent id: {pid}")
+
+
+class FrameModificationSerializer:
+    @staticmethod
+    def dumps(modifications: Any, frames: Sequence[ndarray] = ()) -> bytes:
+        # References to the analyzed frames are stored as their index instead of the pixels, so that the serialized
+        # modifications only contain the analysis results
+        with io.BytesIO() as file:
+            _FramePickler(file, frames).dump(modifications)
+            return file.getvalue()
+
+    @staticmethod
+    def loads(data: bytes, frames: Sequence[ndarray] = ()) -> Any:
+        with io.BytesIO(data) as file:
+            return _FrameUnpickler(file, frames).load()
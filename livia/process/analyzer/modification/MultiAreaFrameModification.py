@@ -0,0 +1,34 @@
+from typing import Dict
+
+from numpy import ndarray
+
+from livia.process.analyzer.AreaOfInterest import AreaOfInterest
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class MultiAreaFrameModification(FrameModification):
+    def __init__(self, areas_of_interest: Dict[str, AreaOfInterest], modifications: Dict[str, FrameModification]):
+        self._areas_of_interest: Dict[str, AreaOfInterest] = areas_of_interest
+        self._modifications: Dict[str, FrameModification] = modifications
+
+    @property
+    def modifications(self) -> Dict[str, FrameModification]:
+        return dict(self._modifications)
+
+    def modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        for name, modification in self._modifications.items():
+            area_of_interest = self._areas_of_interest[name]
+
+            frame_aoi = modification.modify(num_frame, area_of_interest.extract_from(frame))
+            area_of_interest.replace_on(frame, frame_aoi)
+
+        return frame
+
+    def modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        for name, modification in self._modifications.items():
+            area_of_interest = self._areas_of_interest[name]
+
+            frame_aoi = modification.modify_at(num_frame, area_of_interest.extract_from(frame), frame_position)
+            area_of_interest.replace_on(frame, frame_aoi)
+
+        return frame
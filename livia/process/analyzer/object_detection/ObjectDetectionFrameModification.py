@@ -28,6 +28,10 @@ class ObjectDetectionFrameModification(CompositeFrameModification):
         self._show_scores: bool = show_scores
         self._show_class_names: bool = show_class_names
 
+    @property
+    def frame_detection(self) -> FrameObjectDetection:
+        return self._frame_detection
+
     def _composite_modify(self, num_frame: int, frame: ndarray) -> ndarray:
         self._pre_draw(num_frame, frame)
 
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Tuple
+from typing import Tuple, List, Optional, Sequence
 
 from numpy import ndarray
 
@@ -8,8 +8,10 @@ from livia.livia_property import livia_property
 from livia.process.analyzer import DEFAULT_BOX_COLOR, DEFAULT_BOX_THICKNESS
 from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameDetections import FrameDetections
 from livia.process.analyzer.HasThreshold import HasThreshold
 from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.modification.CompositeFrameModification import CompositeFrameModification
 from livia.process.analyzer.modification.FrameModification import FrameModification
 from livia.process.analyzer.object_detection.FrameObjectDetection import FrameObjectDetection
 from livia.process.analyzer.object_detection.ObjectDetectionFrameModification import ObjectDetectionFrameModification
@@ -75,13 +77,47 @@ class ObjectDetectorFrameAnalyzer(CompositeFrameAnalyzer, HasThreshold):
 
         return self._create_modification(detected_objects, child_modification)
 
+    def _composite_analyze_batch(self, frames: Sequence[Tuple[int, ndarray]],
+                                 child_modifications: List[FrameModification]) -> List[FrameModification]:
+        with self._tl_detect_objects:
+            frames_detected_objects = self._detect_objects_batch(frames)
+
+        return [
+            self._create_modification(detected_objects, child_modification)
+            for detected_objects, child_modification in zip(frames_detected_objects, child_modifications)
+        ]
+
+    def detect_objects(self, num_frame: int, frame: ndarray) -> FrameObjectDetection:
+        return self._detect_objects(num_frame, frame)
+
+    def detect_objects_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameObjectDetection]:
+        return self._detect_objects_batch(frames)
+
     @abstractmethod
     def _detect_objects(self, num_frame: int, frame: ndarray) -> FrameObjectDetection:
         raise NotImplementedError()
 
+    def _detect_objects_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameObjectDetection]:
+        return [self._detect_objects(num_frame, frame) for num_frame, frame in frames]
+
+    def depends_on_child_modification(self) -> bool:
+        # The modification of the child is only wrapped, so it can be analyzed in parallel
+        return False
+
     def _create_modification(self, objects: FrameObjectDetection,
                              child_modification: FrameModification) -> ObjectDetectionFrameModification:
         return ObjectDetectionFrameModification(objects, self.threshold,
                                                 self._box_color, self._box_thickness,
                                                 self._show_scores, self._show_class_names,
                                                 child=child_modification)
+
+    def _get_composite_detections(self, modification: CompositeFrameModification) -> Optional[FrameDetections]:
+        if isinstance(modification, ObjectDetectionFrameModification):
+            return FrameDetections(modification.frame_detection.objects)
+        else:
+            return None
+
+    def _build_composite_modification_from_detections(self, num_frame: int, frame: ndarray,
+                                                      detections: FrameDetections,
+                                                      child_modification: FrameModification) -> FrameModification:
+        return self._create_modification(FrameObjectDetection(frame, detections.objects), child_modification)
@@ -0,0 +1,102 @@
+from typing import List, Sequence, Tuple, Union
+
+from numpy import ndarray
+
+from livia.livia_property import livia_property
+from livia.process.analyzer import DEFAULT_BOX_COLOR, DEFAULT_BOX_THICKNESS
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameScaler import FrameScaler
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
+from livia.process.analyzer.object_detection.FrameObjectDetection import FrameObjectDetection
+from livia.process.analyzer.object_detection.ObjectDetectorFrameAnalyzer import ObjectDetectorFrameAnalyzer
+
+DEFAULT_SCALED_SIZE: Tuple[int, int] = (640, 640)
+
+
+# Not registered, as it wraps other detector and can not be built without arguments
+class ScalingObjectDetectorFrameAnalyzer(ObjectDetectorFrameAnalyzer):
+    def __init__(self,
+                 object_detector: ObjectDetectorFrameAnalyzer,
+                 frame_scaler: FrameScaler,
+                 initial_threshold: float = 0.0,
+                 box_color: Tuple[int, int, int] = DEFAULT_BOX_COLOR,
+                 box_thickness: int = DEFAULT_BOX_THICKNESS,
+                 show_scores: bool = False,
+                 show_class_names: bool = False,
+                 child: FrameAnalyzer = NoChangeFrameAnalyzer()):
+        super().__init__(initial_threshold, box_color=box_color, box_thickness=box_thickness, show_scores=show_scores,
+                         show_class_names=show_class_names, child=child)
+
+        self._object_detector: ObjectDetectorFrameAnalyzer = object_detector
+        self._frame_scaler: FrameScaler = frame_scaler
+
+    @property
+    def object_detector(self) -> ObjectDetectorFrameAnalyzer:
+        return self._object_detector
+
+    @livia_property(id="scaled-size", name="Scaled size", default_value=DEFAULT_SCALED_SIZE)
+    def scaled_size(self) -> Tuple[int, int]:
+        return self._frame_scaler.size
+
+    @scaled_size.setter  # type: ignore
+    def scaled_size(self, scaled_size: Union[Sequence[int], str]):
+        size = ScalingObjectDetectorFrameAnalyzer._parse_scaled_size(scaled_size)
+
+        if size != self._frame_scaler.size:
+            self._frame_scaler = FrameScaler(size, self._frame_scaler.mode, self._frame_scaler.padding_color)
+
+    @staticmethod
+    def _parse_scaled_size(scaled_size: Union[Sequence[int], str]) -> Tuple[int, int]:
+        # Sizes may be received as text (e.g. "640x480" or "640, 480") when they are set from a configuration
+        if isinstance(scaled_size, str):
+            values: Sequence = scaled_size.strip("()[] ").replace("x", ",").split(",")
+        else:
+            values = scaled_size
+
+        try:
+            width, height = (int(value) for value in values)
+        except (TypeError, ValueError):
+            raise ValueError(f"scaled_size must contain two positive numbers: {scaled_size!r}")
+
+        if width < 1 or height < 1:
+            raise ValueError(f"scaled_size must contain two positive numbers: {scaled_size!r}")
+
+        return width, height
+
+    @property
+    def frame_scaler(self) -> FrameScaler:
+        return self._frame_scaler
+
+    @frame_scaler.setter
+    def frame_scaler(self, frame_scaler: FrameScaler):
+        self._frame_scaler = frame_scaler
+
+    def _composite_accepts_strided_frames(self) -> bool:
+        # Frames are always scaled into new arrays
+        return True
+
+    def _detect_objects(self, num_frame: int, frame: ndarray) -> FrameObjectDetection:
+        return self._detect_objects_batch([(num_frame, frame)])[0]
+
+    def _detect_objects_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameObjectDetection]:
+        frame_scaler = self._frame_scaler
+
+        scaled_frames = [(num_frame, frame_scaler.scale(frame)) for num_frame, frame in frames]
+        scaled_detections = self._object_detector.detect_objects_batch(scaled_frames)
+
+        # The detections are mapped back to the original frames, so that they are drawn at full resolution
+        detections = []
+        for (_, frame), scaled_detection in zip(frames, scaled_detections):
+            frame_size = (frame.shape[1], frame.shape[0])
+
+            detections.append(FrameObjectDetection(frame, [
+                DetectedObject(
+                    frame_scaler.to_frame_location(detected_object.location, frame_size),
+                    detected_object.class_name,
+                    detected_object.score
+                )
+                for detected_object in scaled_detection.objects
+            ]))
+
+        return detections
@@ -0,0 +1,185 @@
+from concurrent.futures import Executor
+from typing import List, Optional, Sequence, Tuple
+
+from numpy import ndarray, ascontiguousarray
+
+from livia.livia_property import livia_property
+from livia.process.analyzer import DEFAULT_BOX_COLOR, DEFAULT_BOX_THICKNESS
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
+from livia.process.analyzer.object_detection.FrameObjectDetection import FrameObjectDetection
+from livia.process.analyzer.object_detection.ObjectDetectorFrameAnalyzer import ObjectDetectorFrameAnalyzer
+from livia.process.analyzer.object_detection.ObjectLocation import ObjectLocation
+
+DEFAULT_TILE_SIZE: Tuple[int, int] = (640, 640)
+DEFAULT_TILE_OVERLAP: float = 0.2
+DEFAULT_MERGE_THRESHOLD: float = 0.6
+
+
+# Not registered, as it wraps other detector and can not be built without arguments
+class TiledObjectDetectorFrameAnalyzer(ObjectDetectorFrameAnalyzer):
+    def __init__(self,
+                 object_detector: ObjectDetectorFrameAnalyzer,
+                 tile_size: Tuple[int, int] = DEFAULT_TILE_SIZE,
+                 tile_overlap: float = DEFAULT_TILE_OVERLAP,
+                 merge_threshold: float = DEFAULT_MERGE_THRESHOLD,
+                 tile_executor: Optional[Executor] = None,
+                 initial_threshold: float = 0.0,
+                 box_color: Tuple[int, int, int] = DEFAULT_BOX_COLOR,
+                 box_thickness: int = DEFAULT_BOX_THICKNESS,
+                 show_scores: bool = False,
+                 show_class_names: bool = False,
+                 child: FrameAnalyzer = NoChangeFrameAnalyzer()):
+        if tile_size[0] < 1 or tile_size[1] < 1:
+            raise ValueError("tile_size must contain positive numbers")
+        if not 0 <= tile_overlap < 1:
+            raise ValueError("tile_overlap must be in range [0, 1)")
+        if not 0 <= merge_threshold <= 1:
+            raise ValueError("merge_threshold must be in range [0, 1]")
+
+        super().__init__(initial_threshold, box_color=box_color, box_thickness=box_thickness, show_scores=show_scores,
+                         show_class_names=show_class_names, child=child)
+
+        self._object_detector: ObjectDetectorFrameAnalyzer = object_detector
+        self._tile_size: Tuple[int, int] = tile_size
+        self._tile_overlap: float = tile_overlap
+        self._merge_threshold: float = merge_threshold
+        self._tile_executor: Optional[Executor] = tile_executor
+
+    @property
+    def object_detector(self) -> ObjectDetectorFrameAnalyzer:
+        return self._object_detector
+
+    @property
+    def tile_size(self) -> Tuple[int, int]:
+        return self._tile_size
+
+    @livia_property(id="tile-overlap", name="Tile overlap", default_value=DEFAULT_TILE_OVERLAP)
+    def tile_overlap(self) -> float:
+        return self._tile_overlap
+
+    @tile_overlap.setter  # type: ignore
+    def tile_overlap(self, tile_overlap: float):
+        if not 0 <= tile_overlap < 1:
+            raise ValueError("tile_overlap must be in range [0, 1)")
+
+        self._tile_overlap = tile_overlap
+
+    @livia_property(id="merge-threshold", name="Merge threshold", default_value=DEFAULT_MERGE_THRESHOLD)
+    def merge_threshold(self) -> float:
+        return self._merge_threshold
+
+    @merge_threshold.setter  # type: ignore
+    def merge_threshold(self, merge_threshold: float):
+        if not 0 <= merge_threshold <= 1:
+            raise ValueError("merge_threshold must be in range [0, 1]")
+
+        self._merge_threshold = merge_threshold
+
+    def _composite_accepts_strided_frames(self) -> bool:
+        # Tiles are copied when the detector does not accept them as views
+        return True
+
+    def _detect_objects(self, num_frame: int, frame: ndarray) -> FrameObjectDetection:
+        return self._detect_objects_batch([(num_frame, frame)])[0]
+
+    def _detect_objects_batch(self, frames: Sequence[Tuple[int, ndarray]]) -> List[FrameObjectDetection]:
+        frames_tiles = [self.calculate_tiles(frame.shape[1], frame.shape[0]) for _, frame in frames]
+
+        # The tiles of all the frames are detected at once
+        tile_frames = [
+            (num_frame, self.__extract_tile(frame, tile))
+            for (num_frame, frame), tiles in zip(frames, frames_tiles)
+            for tile in tiles
+        ]
+
+        if self._tile_executor is None:
+            tile_detections = self._object_detector.detect_objects_batch(tile_frames)
+        else:
+            tile_detections = list(self._tile_executor.map(
+                lambda tile_frame: self._object_detector.detect_objects(*tile_frame), tile_frames
+            ))
+
+        detections = []
+        index = 0
+        for (num_frame, frame), tiles in zip(frames, frames_tiles):
+            objects: List[DetectedObject] = []
+            for tile, detection in zip(tiles, tile_detections[index:index + len(tiles)]):
+                objects.extend(self.__to_frame_coordinates(detected_object, tile)
+                               for detected_object in detection.objects)
+            index += len(tiles)
+
+            detections.append(FrameObjectDetection(frame, self._merge_objects(objects)))
+
+        return detections
+
+    def calculate_tiles(self, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        tile_width = min(self._tile_size[0], width)
+        tile_height = min(self._tile_size[1], height)
+
+        xs = TiledObjectDetectorFrameAnalyzer.__calculate_tile_starts(width, tile_width, self._tile_overlap)
+        ys = TiledObjectDetectorFrameAnalyzer.__calculate_tile_starts(height, tile_height, self._tile_overlap)
+
+        return [(x, y, tile_width, tile_height) for y in ys for x in xs]
+
+    def _merge_objects(self, objects: List[DetectedObject]) -> List[DetectedObject]:
+        # Objects at the seams are detected in several tiles, sometimes truncated. An object is considered a duplicate
+        # of a better scored one of the same class when most of the smaller of them is covered by the other
+        merged_objects: List[DetectedObject] = []
+        for detected_object in sorted(objects, key=lambda obj: obj.score or 0.0, reverse=True):
+            for index, merged_object in enumerate(merged_objects):
+                if merged_object.class_name == detected_object.class_name \
+                        and self.__calculate_coverage(merged_object.location, detected_object.location) \
+                        >= self._merge_threshold:
+                    location = merged_object.location.create_union_rectangle(detected_object.location)
+                    merged_objects[index] = DetectedObject(location, merged_object.class_name, merged_object.score)
+                    break
+            else:
+                merged_objects.append(detected_object)
+
+        return merged_objects
+
+    def __extract_tile(self, frame: ndarray, tile: Tuple[int, int, int, int]) -> ndarray:
+        x, y, width, height = tile
+        tile_frame = frame[y:y + height, x:x + width]
+
+        if tile_frame.flags['C_CONTIGUOUS'] or self._object_detector.accepts_strided_frames():
+            return tile_frame
+        else:
+            return ascontiguousarray(tile_frame)
+
+    @staticmethod
+    def __to_frame_coordinates(detected_object: DetectedObject, tile: Tuple[int, int, int, int]) -> DetectedObject:
+        x, y, _, _ = tile
+        location = detected_object.location
+
+        return DetectedObject(
+            ObjectLocation(location.x0 + x, location.y0 + y, location.x1 + x, location.y1 + y),
+            detected_object.class_name,
+            detected_object.score
+        )
+
+    @staticmethod
+    def __calculate_coverage(location: ObjectLocation, other_location: ObjectLocation) -> float:
+        smaller_area = min(location.area, other_location.area)
+        if smaller_area <= 0:
+            return 0.0
+
+        x0 = max(location.x0, other_location.x0)
+        y0 = max(location.y0, other_location.y0)
+        x1 = min(location.x1, other_location.x1)
+        y1 = min(location.y1, other_location.y1)
+
+        return 0.0 if x0 >= x1 or y0 >= y1 else (x1 - x0) * (y1 - y0) / smaller_area
+
+    @staticmethod
+    def __calculate_tile_starts(length: int, tile_length: int, overlap: float) -> List[int]:
+        step = max(1, int(tile_length * (1 - overlap)))
+
+        starts = list(range(0, length - tile_length + 1, step))
+        if starts[-1] + tile_length < length:
+            # The last tile is aligned with the border of the frame
+            starts.append(length - tile_length)
+
+        return starts
@@ -1,6 +1,6 @@
 from abc import abstractmethod, ABC
 from copy import copy
-from typing import Tuple, Optional, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from numpy import ndarray
 from numpy.typing import NDArray
@@ -25,7 +25,8 @@ class ObjectTrackingFrameAnalyzer(CompositeFrameAnalyzer, ABC):
                  box_thickness: int = DEFAULT_BOX_THICKNESS,
                  show_scores: bool = False,
                  show_class_names: bool = False,
-                 child: FrameAnalyzer = NoChangeFrameAnalyzer()):
+                 child: FrameAnalyzer = NoChangeFrameAnalyzer(),
+                 predict_positions: bool = False):
         CompositeFrameAnalyzer.__init__(self, child)
 
         self._box_color: Tuple[int, int, int] = box_color
@@ -33,6 +34,7 @@ class ObjectTrackingFrameAnalyzer(CompositeFrameAnalyzer, ABC):
         self._show_scores: bool = show_scores
         self._show_class_names: bool = show_class_names
         self._window_size: Optional[int] = window_size
+        self._predict_positions: bool = predict_positions
 
         self._tracked_objects: TrackedObjects = TrackedObjects()
         self.__tl_detect_objects = TimeLogger("Detect objects", self)
@@ -79,10 +81,22 @@ class ObjectTrackingFrameAnalyzer(CompositeFrameAnalyzer, ABC):
     def show_class_names(self, show_class_labels: bool):
         self._show_class_names = show_class_labels
 
+    @livia_property(id="predict-positions", name="Predict positions", default_value=False)
+    def predict_positions(self) -> bool:
+        return self._predict_positions
+
+    @predict_positions.setter  # type: ignore
+    def predict_positions(self, predict_positions: bool):
+        self._predict_positions = predict_positions
+
     def process_frame(self, num_frame: int, frame: Union[ndarray, NDArray], update: bool = True) -> TrackedObjects:
         with self.__tl_detect_objects:
             objects_in_frame = self._detect_objects_in_frame(num_frame, frame)
 
+        return self._process_detection(num_frame, objects_in_frame, update)
+
+    def _process_detection(self, num_frame: int, objects_in_frame: FrameObjectDetection,
+                           update: bool = True) -> TrackedObjects:
         with self.__tl_group_intra_frame:
             intra_frame_detections = self._group_intra_frame_objects(num_frame, objects_in_frame)
 
@@ -98,10 +112,54 @@ class ObjectTrackingFrameAnalyzer(CompositeFrameAnalyzer, ABC):
 
         return self._create_modification(self._tracked_objects, child_modification)
 
+    def _composite_analyze_batch(self, frames: Sequence[Tuple[int, ndarray]],
+                                 child_modifications: List[FrameModification]) -> List[FrameModification]:
+        modifications, _ = self._composite_analyze_batch_with_states(frames, child_modifications, None)
+
+        return modifications
+
+    def _composite_analyze_batch_with_states(
+            self, frames: Sequence[Tuple[int, ndarray]], child_modifications: List[FrameModification],
+            states: Optional[Sequence[Any]]
+    ) -> Tuple[List[FrameModification], List[Any]]:
+        # Objects are detected in all the frames at once and only the tracking is done frame by frame
+        with self.__tl_detect_objects:
+            objects_in_frames = self._detect_objects_in_frames(frames)
+
+        modifications: List[FrameModification] = []
+        new_states: List[Any] = []
+        for index, ((num_frame, _), objects_in_frame) in enumerate(zip(frames, objects_in_frames)):
+            if states is not None:
+                self._set_composite_state(states[index])
+
+            self._tracked_objects = self._process_detection(num_frame, objects_in_frame)
+
+            modifications.append(self._create_modification(self._tracked_objects, child_modifications[index]))
+            new_states.append(self._tracked_objects)
+
+        return modifications, new_states
+
+    def depends_on_child_modification(self) -> bool:
+        # The modification of the child is only wrapped, so it can be analyzed in parallel
+        return False
+
+    def _new_composite_state(self) -> Any:
+        return TrackedObjects()
+
+    def _get_composite_state(self) -> Any:
+        return self._tracked_objects
+
+    def _set_composite_state(self, state: Any) -> None:
+        self._tracked_objects = state
+
     @abstractmethod
     def _detect_objects_in_frame(self, num_frame: int, frame: Union[ndarray, NDArray]) -> FrameObjectDetection:
         raise NotImplementedError()
 
+    def _detect_objects_in_frames(self, frames: Sequence[Tuple[int, Union[ndarray, NDArray]]]) \
+            -> List[FrameObjectDetection]:
+        return [self._detect_objects_in_frame(num_frame, frame) for num_frame, frame in frames]
+
     @abstractmethod
     def _group_intra_frame_objects(self,
                                    num_frame: int,
@@ -118,4 +176,5 @@ class ObjectTrackingFrameAnalyzer(CompositeFrameAnalyzer, ABC):
     def _create_modification(self, tracked_objects: TrackedObjects,
                              child_modification: FrameModification) -> ObjectTrackingFrameModification:
         return ObjectTrackingFrameModification(tracked_objects, self._box_color, self._box_thickness, self._show_scores,
-                                               self._show_class_names, child=child_modification)
+                                               self._show_class_names, child=child_modification,
+                                               predict_positions=self._predict_positions)
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 import cv2
 from numpy import ndarray
@@ -10,6 +10,8 @@ from livia.process.analyzer.modification.NoFrameModification import NoFrameModif
 from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
 from livia.process.analyzer.object_tracking.TrackedObjects import TrackedObjects
 
+DEFAULT_MAX_PREDICTED_FRAMES: float = 2.0
+
 
 class ObjectTrackingFrameModification(CompositeFrameModification):
     def __init__(self,
@@ -18,18 +20,40 @@ class ObjectTrackingFrameModification(CompositeFrameModification):
                  box_thickness: int = DEFAULT_BOX_THICKNESS,
                  show_scores: bool = False,
                  show_class_names: bool = False,
-                 child: FrameModification = NoFrameModification()):
+                 child: FrameModification = NoFrameModification(),
+                 predict_positions: bool = False,
+                 max_predicted_frames: Optional[float] = DEFAULT_MAX_PREDICTED_FRAMES):
+        if max_predicted_frames is not None and max_predicted_frames < 0:
+            raise ValueError("max_predicted_frames must be None or a non negative float")
+
         super().__init__(child)
         self._tracked_objects: TrackedObjects = tracked_objects
         self._box_color: Tuple[int, int, int] = box_color
         self._box_thickness: int = box_thickness
         self._show_scores: bool = show_scores
         self._show_class_names: bool = show_class_names
+        self._predict_positions: bool = predict_positions
+        self._max_predicted_frames: Optional[float] = max_predicted_frames
+
+    @property
+    def predict_positions(self) -> bool:
+        return self._predict_positions
 
     def _composite_modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        return self._draw_objects(num_frame, frame, self._get_objects_to_draw(num_frame, frame))
+
+    def _composite_modify_at(self, num_frame: int, frame: ndarray, frame_position: float) -> ndarray:
+        if self._predict_positions:
+            detected_objects = self._get_predicted_objects_to_draw(num_frame, frame, frame_position)
+        else:
+            detected_objects = self._get_objects_to_draw(num_frame, frame)
+
+        return self._draw_objects(num_frame, frame, detected_objects)
+
+    def _draw_objects(self, num_frame: int, frame: ndarray, detected_objects: List[DetectedObject]) -> ndarray:
         self._pre_draw(num_frame, frame)
 
-        for detected_object in self._get_objects_to_draw(num_frame, frame):
+        for detected_object in detected_objects:
             self._draw_object(num_frame, frame, detected_object)
 
         self._post_draw(num_frame, frame)
@@ -40,6 +64,15 @@ class ObjectTrackingFrameModification(CompositeFrameModification):
         return [tracked_object.last_frame_consensus for tracked_object in self._tracked_objects.tracked_objects if
                 tracked_object.last_frame_consensus is not None]
 
+    def _get_predicted_objects_to_draw(self, num_frame: int, frame: ndarray,
+                                       frame_position: float) -> List[DetectedObject]:
+        predicted_objects = (
+            tracked_object.predict_consensus(frame_position, self._max_predicted_frames)
+            for tracked_object in self._tracked_objects.tracked_objects
+        )
+
+        return [predicted_object for predicted_object in predicted_objects if predicted_object is not None]
+
     def _pre_draw(self, num_frame: int, frame: ndarray):
         pass
 
@@ -1,11 +1,13 @@
 from collections import deque, Counter
 from copy import deepcopy, copy
 from enum import Enum
+from itertools import islice
 from random import randrange
 from typing import Deque, List, Optional, Union, Iterable, Dict, Any, Tuple
 
 from livia.process.analyzer import DEFAULT_WINDOW_SIZE
 from livia.process.analyzer.object_detection.DetectedObject import DetectedObject
+from livia.process.analyzer.object_detection.ObjectLocation import ObjectLocation
 from livia.process.analyzer.object_tracking.DetectedObjectGroup import DetectedObjectGroup
 from livia.process.analyzer.object_tracking.FrameDetectedObjectGroup import FrameDetectedObjectGroup
 
@@ -90,6 +92,36 @@ class TrackedObject:
     def last_frame_consensus(self) -> Optional[DetectedObject]:
         return self.__detection_by_frame[-1][0].object_group.create_consensus()
 
+    def predict_consensus(self, num_frame: float, max_frames: Optional[float] = None) -> Optional[DetectedObject]:
+        if not self.has_detection_in_last_frame():
+            return None
+
+        last_detection = self.__detection_by_frame[-1][0]
+        last_consensus = last_detection.object_group.create_consensus()
+
+        frames_ahead = num_frame - last_detection.num_frame
+        if max_frames is not None:
+            frames_ahead = min(frames_ahead, max_frames)
+
+        previous_detection = next(filter(self.__has_detection, islice(reversed(self.__detection_by_frame), 1, None)),
+                                  None)
+
+        if last_consensus is None or previous_detection is None or frames_ahead <= 0:
+            return last_consensus
+
+        previous_consensus = previous_detection[0].object_group.create_consensus()
+        if previous_consensus is None:
+            return last_consensus
+
+        # Constant velocity model, using the movement between the last two frames with detections
+        steps = frames_ahead / (last_detection.num_frame - previous_detection[0].num_frame)
+        location = ObjectLocation(*(
+            last_coord + (last_coord - previous_coord) * steps
+            for last_coord, previous_coord in zip(last_consensus.location.coords, previous_consensus.location.coords)
+        ))
+
+        return DetectedObject(location, last_consensus.class_name, last_consensus.score)
+
     def __has_detection(
             self, group: Union[FrameDetectedObjectGroup, Tuple[FrameDetectedObjectGroup, Dict[str, Any]]]
     ) -> bool:
@@ -4,11 +4,14 @@ import time
 from abc import ABC, abstractmethod
 from copy import copy
 from logging import Logger
-from typing import List, Tuple, Optional, TypeVar, Generic
+from threading import Thread, current_thread
+from typing import Any, Callable, List, Tuple, Optional, TypeVar, Generic, Sequence, cast
 
 from numpy import ndarray
 
+from livia import LIVIA_LOGGER
 from livia.benchmarking.TimeLogger import TimeLogger
+from livia.buffer.RingBuffer import RingBuffer
 from livia.livia_property import livia_property
 from livia.process.analyzer import DEFAULT_WINDOW_SIZE, DEFAULT_BOX_COLOR, DEFAULT_BOX_THICKNESS
 from livia.process.analyzer.CompositeFrameAnalyzer import CompositeFrameAnalyzer
@@ -23,9 +26,11 @@ from livia.process.analyzer.object_tracking.TrackedObject import TrackedObject
 from livia.process.analyzer.object_tracking.TrackedObjects import TrackedObjects
 from livia.process.analyzer.object_tracking.classification.ObjectTrackingAndClassifyingFrameModification import \
     ObjectTrackingAndClassifyingFrameModification
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
 
 T = TypeVar("T")
 DEFAULT_TEXT_COLOR: Optional[Tuple[int, int, int]] = None
+DEFAULT_PIPELINE_DEPTH: int = 2
 
 
 class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Generic[T]):
@@ -37,10 +42,15 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
             box_thickness: int = DEFAULT_BOX_THICKNESS,
             show_scores: bool = False,
             show_class_names: bool = False,
-            child: FrameAnalyzer = NoChangeFrameAnalyzer()
+            child: FrameAnalyzer = NoChangeFrameAnalyzer(),
+            pipelined: bool = False,
+            pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+            frame_transform: Optional[FrameTransform] = None
     ):
         if window_size <= 0:
             raise ValueError("window_size must be a positive number")
+        if pipeline_depth < 1:
+            raise ValueError("pipeline_depth must be a positive number")
 
         CompositeFrameAnalyzer.__init__(self, child)
 
@@ -50,6 +60,12 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
         self._show_scores: bool = show_scores
         self._show_class_names: bool = show_class_names
         self._window_size: int = window_size
+        self._pipelined: bool = pipelined
+        self._pipeline_depth: int = pipeline_depth
+        self._frame_transform: Optional[FrameTransform] = frame_transform
+        # The pipeline is started with the first pipelined batch and kept for the next ones
+        self._pipeline: Optional[_StagePipeline] = None
+        self._unbatched_pipeline_warned: bool = False
 
         self._tracked_objects: TrackedObjects = TrackedObjects(window_size=self._window_size)
 
@@ -66,6 +82,13 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
         self._logger: Logger = FrameAnalyzerManager.get_logger_for(self)
         self._log_headers()
 
+    def __getstate__(self):
+        # The threads of the pipeline can not be sent to other processes, where it is started again
+        state = super().__getstate__()
+        state["_pipeline"] = None
+
+        return state
+
     @livia_property(id="window-size", name="Window size", default_value=DEFAULT_WINDOW_SIZE)
     def window_size(self) -> int:
         return self._window_size
@@ -111,8 +134,41 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
     def show_class_names(self, show_class_labels: bool):
         self._show_class_names = show_class_labels
 
+    @property
+    def pipelined(self) -> bool:
+        return self._pipelined
+
+    @pipelined.setter
+    def pipelined(self, pipelined: bool):
+        self._pipelined = pipelined
+
+        if not pipelined:
+            self.close_pipeline()
+
+    def close_pipeline(self):
+        pipeline = self._pipeline
+        self._pipeline = None
+
+        if pipeline is not None:
+            pipeline.close()
+
+    @property
+    def pipeline_depth(self) -> int:
+        return self._pipeline_depth
+
+    @property
+    def frame_transform(self) -> Optional[FrameTransform]:
+        return self._frame_transform
+
+    @frame_transform.setter
+    def frame_transform(self, frame_transform: Optional[FrameTransform]):
+        self._frame_transform = frame_transform
+
     def _composite_analyze(self, num_frame: int, frame: ndarray,
                            child_modification: FrameModification) -> ObjectTrackingAndClassifyingFrameModification:
+        if self._pipelined:
+            self.__warn_unbatched_pipeline()
+
         with self._tl_process_frame:
             with self._tl_preprocess_frame:
                 preprocessed_frame = self.preprocess_frame(num_frame, frame)
@@ -128,13 +184,165 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
             with self._tl_build_modification:
                 return self.build_modification(num_frame, frame, tracked_objects, classification, child_modification)
 
+    def _composite_analyze_batch(self, frames: Sequence[Tuple[int, ndarray]],
+                                 child_modifications: List[FrameModification]) -> List[FrameModification]:
+        modifications, _ = self._composite_analyze_batch_with_states(frames, child_modifications, None)
+
+        return modifications
+
+    def _composite_analyze_batch_with_states(
+            self, frames: Sequence[Tuple[int, ndarray]], child_modifications: List[FrameModification],
+            states: Optional[Sequence[Any]]
+    ) -> Tuple[List[FrameModification], List[Any]]:
+        if self._pipelined:
+            if len(frames) > 1:
+                return self._pipelined_analyze_batch_with_states(frames, child_modifications, states)
+
+            self.__warn_unbatched_pipeline()
+
+        # Frames are preprocessed and objects detected in all the frames at once. Tracking and classification depend
+        # on the tracked objects, so they are done frame by frame
+        with self._tl_process_frame:
+            with self._tl_preprocess_frame:
+                preprocessed_frames = [
+                    (num_frame, self.preprocess_frame(num_frame, frame)) for num_frame, frame in frames
+                ]
+
+            with self._tl_tracking:
+                with self._tl_detect_objects:
+                    objects_in_frames = self._detect_objects_in_frames(preprocessed_frames)
+
+            modifications: List[FrameModification] = []
+            new_states: List[Any] = []
+            for index, (num_frame, frame) in enumerate(frames):
+                if states is not None:
+                    self._set_composite_state(states[index])
+
+                preprocessed_frame = preprocessed_frames[index][1]
+
+                with self._tl_tracking:
+                    tracked_objects = self.track_detected_objects(num_frame, objects_in_frames[index])
+
+                with self._tl_classify:
+                    classification = self._classify_objects(num_frame, preprocessed_frame, tracked_objects)
+
+                self._log_classification(num_frame, classification)
+
+                with self._tl_build_modification:
+                    modifications.append(self.build_modification(
+                        num_frame, frame, tracked_objects, classification, child_modifications[index]
+                    ))
+
+                new_states.append(self._tracked_objects)
+
+        return modifications, new_states
+
+    def _pipelined_analyze_batch_with_states(
+            self, frames: Sequence[Tuple[int, ndarray]], child_modifications: List[FrameModification],
+            states: Optional[Sequence[Any]]
+    ) -> Tuple[List[FrameModification], List[Any]]:
+        # Preprocessing and detection run in their own stages, ahead of tracking and classification, which are done in
+        # frame order in this thread. While a frame is classified, the next ones are detected and preprocessed
+        pipeline = self.__get_pipeline()
+
+        modifications: List[FrameModification] = []
+        new_states: List[Any] = []
+        in_flight = 0
+        next_index = 0
+
+        with self._tl_process_frame:
+            try:
+                for index, (num_frame, frame) in enumerate(frames):
+                    # No more frames than the depth of the pipeline are fed to it, so its stages are never blocked
+                    while next_index < len(frames) and in_flight < self._pipeline_depth:
+                        pipeline.put(frames[next_index])
+                        next_index += 1
+                        in_flight += 1
+
+                    in_flight -= 1
+                    preprocessed_frame, objects_in_frame = pipeline.get()
+
+                    if states is not None:
+                        self._set_composite_state(states[index])
+
+                    with self._tl_tracking:
+                        tracked_objects = self.track_detected_objects(num_frame, objects_in_frame)
+
+                    with self._tl_classify:
+                        classification = self._classify_objects(num_frame, preprocessed_frame, tracked_objects)
+
+                    self._log_classification(num_frame, classification)
+
+                    with self._tl_build_modification:
+                        modifications.append(self.build_modification(
+                            num_frame, frame, tracked_objects, classification, child_modifications[index]
+                        ))
+
+                    new_states.append(self._tracked_objects)
+            finally:
+                # If the analysis failed, the frames left in the pipeline are discarded, so that it can be reused
+                pipeline.discard(in_flight)
+
+        return modifications, new_states
+
+    def __get_pipeline(self) -> "_StagePipeline":
+        if self._pipeline is None:
+            self._pipeline = _StagePipeline([
+                ("Preprocessing", self.__preprocess_stage),
+                ("Object Detection", self.__detect_objects_stage)
+            ], self._pipeline_depth)
+
+        return self._pipeline
+
+    def __preprocess_stage(self, item: Tuple[int, ndarray]) -> Tuple[int, T]:
+        num_frame, frame = item
+
+        with self._tl_preprocess_frame:
+            return num_frame, self.preprocess_frame(num_frame, frame)
+
+    def __detect_objects_stage(self, item: Tuple[int, T]) -> Tuple[T, FrameObjectDetection]:
+        num_frame, preprocessed_frame = item
+
+        with self._tl_detect_objects:
+            return preprocessed_frame, self._detect_objects_in_frame(num_frame, preprocessed_frame)
+
+    def __warn_unbatched_pipeline(self):
+        # Frames analyzed one by one can not overlap, as each one has to be analyzed before the next one is received
+        if not self._unbatched_pipeline_warned:
+            self._unbatched_pipeline_warned = True
+            LIVIA_LOGGER.warning("Pipelined analysis only overlaps the frames of a batch, so frames analyzed one "
+                                 "by one are not pipelined")
+
+    def depends_on_child_modification(self) -> bool:
+        # The modification of the child is only wrapped, so it can be analyzed in parallel
+        return False
+
+    def _new_composite_state(self) -> Any:
+        return TrackedObjects(window_size=self._window_size)
+
+    def _get_composite_state(self) -> Any:
+        return self._tracked_objects
+
+    def _set_composite_state(self, state: Any) -> None:
+        # The window size may have changed while the state was not in use
+        state.window_size = self._window_size
+        self._tracked_objects = state
+
     def preprocess_frame(self, num_frame: int, frame: ndarray) -> T:
-        return frame
+        if self._frame_transform is None:
+            # Without a transform, the analyzer works with the frames themselves
+            return cast(T, frame)
+        else:
+            return self._preprocess_frame(num_frame, frame, self._frame_transform)
 
     def track_objects(self, num_frame: int, frame: T, update: bool = True) -> TrackedObjects:
         with self._tl_detect_objects:
             objects_in_frame = self._detect_objects_in_frame(num_frame, frame)
 
+        return self.track_detected_objects(num_frame, objects_in_frame, update)
+
+    def track_detected_objects(self, num_frame: int, objects_in_frame: FrameObjectDetection,
+                               update: bool = True) -> TrackedObjects:
         self._log_detected_objects_in_frame(num_frame, objects_in_frame)
 
         with self._tl_group_intra_frame:
@@ -216,6 +424,9 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
     def _detect_objects_in_frame(self, num_frame: int, frame: T) -> FrameObjectDetection:
         raise NotImplementedError()
 
+    def _detect_objects_in_frames(self, frames: Sequence[Tuple[int, T]]) -> List[FrameObjectDetection]:
+        return [self._detect_objects_in_frame(num_frame, frame) for num_frame, frame in frames]
+
     @abstractmethod
     def _group_intra_frame_objects(self,
                                    num_frame: int,
@@ -240,7 +451,73 @@ class ObjectTrackingAndClassifyingFrameAnalyzer(CompositeFrameAnalyzer, ABC, Gen
             num_frame: int,
             frame: ndarray,
             tracked_objects: Optional[TrackedObjects],
-            classifications: Optional[List[Tuple[DetectedObject, Optional[Tuple[Optional[str], Optional[float]]]]]],
+            classifications: Optional[
+                List[Tuple[TrackedObject, DetectedObject, Optional[Tuple[Optional[str], Optional[float]]]]]
+            ],
             child_modification: FrameModification
     ) -> ObjectTrackingAndClassifyingFrameModification:
         raise NotImplementedError()
+
+
+class _StagePipeline:
+    def __init__(self, stages: Sequence[Tuple[str, Callable[[Any], Any]]], depth: int):
+        # Each stage hands its results to the next one, in the same order, with the error raised by the item if any
+        self.__buffers: List[RingBuffer[Tuple[Any, Optional[Exception]]]] = [
+            RingBuffer(depth) for _ in range(len(stages) + 1)
+        ]
+        self.__threads: List[Thread] = [
+            Thread(target=_StagePipeline.__run_stage, args=(stage, self.__buffers[index], self.__buffers[index + 1]),
+                   daemon=True, name=f"{name} Pipeline Thread")
+            for index, (name, stage) in enumerate(stages)
+        ]
+
+        for thread in self.__threads:
+            thread.start()
+
+    def put(self, item: Any) -> None:
+        if not self.__buffers[0].put((item, None)):
+            raise RuntimeError("The pipeline is closed")
+
+    def get(self) -> Any:
+        result = self.__buffers[-1].get()
+        if result is None:
+            raise RuntimeError("The pipeline is closed")
+
+        item, error = result
+        if error is not None:
+            raise error
+
+        return item
+
+    def discard(self, count: int) -> None:
+        for _ in range(count):
+            if self.__buffers[-1].get() is None:
+                break
+
+    def close(self) -> None:
+        for buffer in self.__buffers:
+            buffer.close()
+
+        for thread in self.__threads:
+            if thread is not current_thread():
+                thread.join()
+
+    @staticmethod
+    def __run_stage(stage: Callable[[Any], Any], input_buffer: RingBuffer[Tuple[Any, Optional[Exception]]],
+                    output_buffer: RingBuffer[Tuple[Any, Optional[Exception]]]):
+        while True:
+            result = input_buffer.get()
+            if result is None:
+                break
+
+            item, error = result
+            if error is None:
+                try:
+                    item = stage(item)
+                except Exception as stage_error:
+                    item, error = None, stage_error
+
+            if not output_buffer.put((item, error)):
+                break
+
+        output_buffer.close()
@@ -0,0 +1,35 @@
+from typing import Hashable, Tuple
+
+from numpy import ndarray
+
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+
+class ChainedFrameTransform(FrameTransform):
+    def __init__(self, *transforms: FrameTransform):
+        if len(transforms) == 0:
+            raise ValueError("transforms must not be empty")
+
+        self.__transforms: Tuple[FrameTransform, ...] = transforms
+
+    @property
+    def transforms(self) -> Tuple[FrameTransform, ...]:
+        return self.__transforms
+
+    @property
+    def signature(self) -> Hashable:
+        return tuple(transform.signature for transform in self.__transforms)
+
+    # Transform applied before the last one, whose result can be shared with other chains that start the same way
+    @property
+    def head(self) -> FrameTransform:
+        if len(self.__transforms) == 2:
+            return self.__transforms[0]
+        else:
+            return ChainedFrameTransform(*self.__transforms[:-1])
+
+    def apply(self, frame: ndarray) -> ndarray:
+        for transform in self.__transforms:
+            frame = transform.apply(frame)
+
+        return frame
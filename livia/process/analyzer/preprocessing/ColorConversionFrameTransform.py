@@ -0,0 +1,22 @@
+from typing import Hashable
+
+import cv2
+from numpy import ndarray
+
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+
+class ColorConversionFrameTransform(FrameTransform):
+    def __init__(self, code: int = cv2.COLOR_BGR2RGB):
+        self.__code: int = code
+
+    @property
+    def code(self) -> int:
+        return self.__code
+
+    @property
+    def signature(self) -> Hashable:
+        return "color-conversion", self.__code
+
+    def apply(self, frame: ndarray) -> ndarray:
+        return cv2.cvtColor(frame, self.__code)
@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Any, Dict, Hashable, Iterable, Iterator, Optional, OrderedDict, Set, Tuple
+
+from numpy import ndarray
+
+from livia.process.analyzer.preprocessing.ChainedFrameTransform import ChainedFrameTransform
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+DEFAULT_PREPROCESSING_CACHE_CAPACITY: int = 16
+
+
+class FramePreprocessingCache:
+    def __init__(self, capacity: int = DEFAULT_PREPROCESSING_CACHE_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number")
+
+        self.__capacity: int = capacity
+        # Frames are identified by the tokens issued while they are analyzed, as neither their numbers (e.g. with
+        # several streams) nor their buffers (e.g. when they are pooled) identify them
+        self.__frame_tokens: Dict[int, Tuple[ndarray, int]] = {}
+        self.__next_token: int = 0
+        self.__results: OrderedDict[Tuple[int, Hashable], Any] = OrderedDict()
+        self.__pending_keys: Set[Tuple[int, Hashable]] = set()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+        self.__condition: Condition = Condition(lock=Lock())
+
+    def __getstate__(self):
+        # Only the configuration is sent to other processes, where the cache is rebuilt empty
+        return {"capacity": self.__capacity}
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity"])
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def hits(self) -> int:
+        with self.__condition:
+            return self.__hits
+
+    @property
+    def misses(self) -> int:
+        with self.__condition:
+            return self.__misses
+
+    def __len__(self) -> int:
+        with self.__condition:
+            return len(self.__results)
+
+    # Processors analyze the frames inside this context, so that their preprocessed versions are shared only while
+    # they are analyzed
+    @contextmanager
+    def analyzing(self, frames: Iterable[ndarray]) -> Iterator[None]:
+        frames = list(frames)
+
+        with self.__condition:
+            tokens = []
+            for frame in frames:
+                self.__frame_tokens[id(frame)] = (frame, self.__next_token)
+                tokens.append(self.__next_token)
+                self.__next_token += 1
+
+        try:
+            yield
+        finally:
+            with self.__condition:
+                for frame in frames:
+                    frame_token = self.__frame_tokens.get(id(frame))
+                    if frame_token is not None and frame_token[0] is frame:
+                        del self.__frame_tokens[id(frame)]
+
+                released_tokens = set(tokens)
+                for key in [key for key in self.__results if key[0] in released_tokens]:
+                    del self.__results[key]
+
+    # The results are shared by all the analyzers that request the same transform, so they must not be modified
+    def preprocess(self, frame: ndarray, transform: FrameTransform) -> Any:
+        token = self.__get_token(frame)
+
+        # Frames that are not being analyzed by a processor can not be told apart from others, so they are not cached
+        if token is None:
+            return transform.apply(frame)
+
+        key = (token, transform.signature)
+
+        with self.__condition:
+            # If other analyzer is already applying the same transform to the frame, its result is waited for
+            while key in self.__pending_keys:
+                self.__condition.wait()
+
+            if key in self.__results:
+                self.__hits += 1
+                self.__results.move_to_end(key)
+
+                return self.__results[key]
+
+            self.__misses += 1
+            self.__pending_keys.add(key)
+
+        try:
+            if isinstance(transform, ChainedFrameTransform) and len(transform.transforms) > 1:
+                result = transform.transforms[-1].apply(self.preprocess(frame, transform.head))
+            else:
+                result = transform.apply(frame)
+        except BaseException:
+            with self.__condition:
+                self.__pending_keys.discard(key)
+                self.__condition.notify_all()
+            raise
+
+        with self.__condition:
+            self.__pending_keys.discard(key)
+            self.__results[key] = result
+            self.__results.move_to_end(key)
+
+            while len(self.__results) > self.__capacity:
+                self.__results.popitem(last=False)
+
+            self.__condition.notify_all()
+
+        return result
+
+    def clear(self) -> None:
+        with self.__condition:
+            self.__results.clear()
+
+    def __get_token(self, frame: ndarray) -> Optional[int]:
+        with self.__condition:
+            frame_token = self.__frame_tokens.get(id(frame))
+
+        return frame_token[1] if frame_token is not None and frame_token[0] is frame else None
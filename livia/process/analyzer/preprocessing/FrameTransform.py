@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Hashable
+
+from numpy import ndarray
+
+
+class FrameTransform(ABC):
+    # Transforms with the same signature must produce the same result for the same frame, so that their results can
+    # be shared by all the analyzers that use them
+    @property
+    @abstractmethod
+    def signature(self) -> Hashable:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def apply(self, frame: ndarray) -> Any:
+        raise NotImplementedError()
@@ -0,0 +1,35 @@
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+DEFAULT_NORMALIZATION_SCALE: float = 1 / 255
+
+
+class NormalizationFrameTransform(FrameTransform):
+    def __init__(self,
+                 scale: float = DEFAULT_NORMALIZATION_SCALE,
+                 mean: Optional[Tuple[float, ...]] = None,
+                 std: Optional[Tuple[float, ...]] = None,
+                 dtype: type = np.float32):
+        self.__scale: float = scale
+        self.__mean: Optional[Tuple[float, ...]] = mean
+        self.__std: Optional[Tuple[float, ...]] = std
+        self.__dtype: np.dtype = np.dtype(dtype)
+
+    @property
+    def signature(self) -> Hashable:
+        return "normalization", self.__scale, self.__mean, self.__std, self.__dtype.str
+
+    def apply(self, frame: ndarray) -> ndarray:
+        normalized_frame = frame.astype(self.__dtype)
+        normalized_frame *= self.__scale
+
+        if self.__mean is not None:
+            normalized_frame -= np.asarray(self.__mean, dtype=self.__dtype)
+        if self.__std is not None:
+            normalized_frame /= np.asarray(self.__std, dtype=self.__dtype)
+
+        return normalized_frame
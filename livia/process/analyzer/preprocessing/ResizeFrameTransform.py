@@ -0,0 +1,30 @@
+from typing import Hashable, Tuple
+
+import cv2
+from numpy import ndarray
+
+from livia.process.analyzer.preprocessing.FrameTransform import FrameTransform
+
+
+class ResizeFrameTransform(FrameTransform):
+    def __init__(self, size: Tuple[int, int], interpolation: int = cv2.INTER_LINEAR):
+        if size[0] < 1 or size[1] < 1:
+            raise ValueError("size must contain positive numbers")
+
+        self.__size: Tuple[int, int] = size
+        self.__interpolation: int = interpolation
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.__size
+
+    @property
+    def interpolation(self) -> int:
+        return self.__interpolation
+
+    @property
+    def signature(self) -> Hashable:
+        return "resize", self.__size, self.__interpolation
+
+    def apply(self, frame: ndarray) -> ndarray:
+        return cv2.resize(frame, self.__size, interpolation=self.__interpolation)
@@ -0,0 +1,143 @@
+import time
+from threading import Thread, Condition, Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from livia import LIVIA_LOGGER
+from livia.process.listener.EventListeners import EventListeners
+
+DEFAULT_COALESCING_INTERVAL: float = 0.0
+
+
+class EventDispatcher:
+    def __init__(self, coalescing_interval: float = DEFAULT_COALESCING_INTERVAL, daemon: bool = True):
+        if coalescing_interval < 0:
+            raise ValueError("coalescing_interval must be a non negative float")
+
+        self.__coalescing_interval: float = coalescing_interval
+        self.__daemon: bool = daemon
+
+        # Only the latest event of each kind is kept for each set of listeners. Events that are replaced before being
+        # delivered are counted as coalesced
+        self.__pending_events: Dict[Tuple[int, str], Tuple[EventListeners, Any]] = {}
+        self.__last_delivery: Dict[Tuple[int, str], float] = {}
+        self.__coalesced: int = 0
+        self.__closed: bool = False
+        self.__delivering: bool = False
+
+        self.__dispatcher_thread: Optional[Thread] = None
+        self.__condition: Condition = Condition(lock=Lock())
+
+    @property
+    def coalescing_interval(self) -> float:
+        return self.__coalescing_interval
+
+    @property
+    def coalesced(self) -> int:
+        with self.__condition:
+            return self.__coalesced
+
+    def dispatch(self, listeners: EventListeners, event_method: Union[str, Callable], event: Any) -> None:
+        if len(listeners) == 0:
+            return
+
+        event_name = event_method if isinstance(event_method, str) else event_method.__name__
+        key = (id(listeners), event_name)
+
+        with self.__condition:
+            if self.__closed:
+                return
+
+            if key in self.__pending_events:
+                self.__coalesced += 1
+            self.__pending_events[key] = (listeners, event)
+
+            if self.__dispatcher_thread is None:
+                self.__dispatcher_thread = Thread(target=self.__dispatch_events, daemon=self.__daemon,
+                                                  name="Event Dispatcher Thread")
+                self.__dispatcher_thread.start()
+
+            self.__condition.notify_all()
+
+    # Delivers the pending events of the listeners in the calling thread once the dispatcher thread ends the delivery
+    # in progress, so that later events sent directly (e.g. the end of a process) are not received before them
+    def flush(self, listeners: EventListeners) -> None:
+        with self.__condition:
+            while self.__delivering:
+                self.__condition.wait()
+
+            keys = [key for key in self.__pending_events if key[0] == id(listeners)]
+            pending_events = [(key, self.__pending_events.pop(key)) for key in keys]
+
+            self.__delivering = True
+
+        try:
+            EventDispatcher.__deliver(pending_events)
+        finally:
+            with self.__condition:
+                self.__delivering = False
+                self.__condition.notify_all()
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__closed = True
+            self.__pending_events.clear()
+            self.__condition.notify_all()
+
+            dispatcher_thread = self.__dispatcher_thread
+
+        if dispatcher_thread is not None:
+            dispatcher_thread.join()
+
+    def __dispatch_events(self):
+        while True:
+            with self.__condition:
+                ready_events = self.__wait_for_ready_events()
+
+                if self.__closed:
+                    break
+
+                # Events being flushed by other thread are delivered first
+                while self.__delivering:
+                    self.__condition.wait()
+
+                self.__delivering = True
+
+            try:
+                EventDispatcher.__deliver(ready_events)
+            finally:
+                with self.__condition:
+                    self.__delivering = False
+                    self.__condition.notify_all()
+
+    @staticmethod
+    def __deliver(events: List[Tuple[Tuple[int, str], Tuple[EventListeners, Any]]]):
+        for (_, event_name), (listeners, event) in events:
+            try:
+                listeners.notify(event_name, event)
+            except Exception:
+                LIVIA_LOGGER.exception(f"Error notifying {event_name} event")
+
+    def __wait_for_ready_events(self):
+        while not self.__closed:
+            if not self.__pending_events:
+                self.__condition.wait()
+                continue
+
+            now = time.perf_counter()
+            ready_keys = [
+                key for key in self.__pending_events
+                if now - self.__last_delivery.get(key, -self.__coalescing_interval) >= self.__coalescing_interval
+            ]
+
+            if ready_keys:
+                for key in ready_keys:
+                    self.__last_delivery[key] = now
+
+                return [(key, self.__pending_events.pop(key)) for key in ready_keys]
+            else:
+                next_delivery = min(
+                    self.__last_delivery[key] + self.__coalescing_interval for key in self.__pending_events
+                )
+                self.__condition.wait(next_delivery - now)
+
+        return []
@@ -1,5 +1,5 @@
 from threading import Lock
-from typing import TypeVar, Generic, List, Callable, Union, Iterator
+from typing import TypeVar, Generic, Callable, Union, Iterator, Sequence, Tuple
 
 from livia.process.listener.EventListener import EventListener
 
@@ -8,8 +8,8 @@ E = TypeVar('E')
 
 
 class EventListenersIterator(Generic[T]):
-    def __init__(self, listeners: List[T]):
-        self._listeners: List[T] = listeners
+    def __init__(self, listeners: Sequence[T]):
+        self._listeners: Sequence[T] = listeners
         self._index: int = 0
 
     def __iter__(self):
@@ -46,35 +46,43 @@ class NotificationAction(Generic[T]):
 
 class EventListeners(Generic[T]):
     def __init__(self):
-        self._listeners: List[T] = []
+        # Listeners are replaced instead of modified (copy-on-write), so they can be read without locking
+        self._listeners: Tuple[T, ...] = ()
         self._lock: Lock = Lock()
 
     def append(self, listener: T) -> bool:
         with self._lock:
             if listener not in self._listeners:
-                self._listeners.append(listener)
+                self._listeners = self._listeners + (listener,)
                 return True
             else:
                 return False
 
     def remove(self, listener: T):
         with self._lock:
-            self._listeners.remove(listener)
+            listeners = list(self._listeners)
+            listeners.remove(listener)
+            self._listeners = tuple(listeners)
 
     def clear(self):
         with self._lock:
-            self._listeners.clear()
+            self._listeners = ()
 
     def __contains__(self, listener: T) -> bool:
-        with self._lock:
-            return listener in self._listeners
+        return listener in self._listeners
+
+    def __len__(self) -> int:
+        return len(self._listeners)
 
     def __iter__(self) -> EventListenersIterator[T]:
-        with self._lock:
-            return EventListenersIterator(self._listeners.copy())
+        return EventListenersIterator(self._listeners)
 
     def notify(self, event_method: Union[str, Callable[[T, E], None]], event: E) -> None:
+        listeners = self._listeners
+        if not listeners:
+            return
+
         event_name = event_method if isinstance(event_method, str) else event_method.__name__
 
-        for listener in self:
+        for listener in listeners:
             getattr(listener, event_name)(event)
@@ -1,24 +1,27 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, TYPE_CHECKING
+from typing import TypeVar, Generic, TYPE_CHECKING, Union
 
+from livia.input.AsyncFrameInput import AsyncFrameInput
 from livia.input.FrameInput import FrameInput
+from livia.output.AsyncFrameOutput import AsyncFrameOutput
 from livia.output.FrameOutput import FrameOutput
 
 if TYPE_CHECKING:
+    from livia.process.AsyncioFrameProcessor import AsyncioFrameProcessor
     from livia.process.FrameProcessor import FrameProcessor
 
-T = TypeVar('T', FrameInput, FrameOutput)
+T = TypeVar('T', FrameInput, FrameOutput, AsyncFrameInput, AsyncFrameOutput)
 
 
 class IOChangeEvent(Generic[T]):
-    def __init__(self, processor: FrameProcessor, new: T, old: T):
-        self.__processor: FrameProcessor = processor
+    def __init__(self, processor: Union[FrameProcessor, AsyncioFrameProcessor], new: T, old: T):
+        self.__processor: Union[FrameProcessor, AsyncioFrameProcessor] = processor
         self.__new: T = new
         self.__old: T = old
 
     @property
-    def processor(self) -> FrameProcessor:
+    def processor(self) -> Union[FrameProcessor, AsyncioFrameProcessor]:
         return self.__processor
 
     @property
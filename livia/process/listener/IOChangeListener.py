@@ -1,12 +1,13 @@
-from livia.input.FrameInput import FrameInput
-from livia.output.FrameOutput import FrameOutput
+from typing import Any
+
 from livia.process.listener.EventListener import EventListener
 from livia.process.listener.IOChangeEvent import IOChangeEvent
 
 
+# The events carry the inputs and outputs of either the threaded or the asyncio processors
 class IOChangeListener(EventListener):
-    def input_changed(self, event: IOChangeEvent[FrameInput]) -> None:
+    def input_changed(self, event: IOChangeEvent[Any]) -> None:
         pass
 
-    def output_changed(self, event: IOChangeEvent[FrameOutput]) -> None:
+    def output_changed(self, event: IOChangeEvent[Any]) -> None:
         pass
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Union
+
+from livia.process.FrameTimestamps import FrameTimestamps
 
 if TYPE_CHECKING:
+    from livia.process.AsyncioFrameProcessor import AsyncioFrameProcessor
     from livia.process.FrameProcessor import FrameProcessor
 
 
 class ProcessChangeEvent:
-    def __init__(self, processor: FrameProcessor, num_frame: int):
-        self.__processor: FrameProcessor = processor
-        self.__num_frame: int = num_frame
+    def __init__(self, processor: Union[FrameProcessor, AsyncioFrameProcessor], num_frame: Optional[int],
+                 timestamps: Optional[FrameTimestamps] = None):
+        self.__processor: Union[FrameProcessor, AsyncioFrameProcessor] = processor
+        self.__num_frame: Optional[int] = num_frame
+        self.__timestamps: Optional[FrameTimestamps] = timestamps
 
-    def processor(self) -> FrameProcessor:
+    def processor(self) -> Union[FrameProcessor, AsyncioFrameProcessor]:
         return self.__processor
 
-    def num_frame(self) -> int:
+    def num_frame(self) -> Optional[int]:
         return self.__num_frame
+
+    def timestamps(self) -> Optional[FrameTimestamps]:
+        return self.__timestamps